@@ -0,0 +1,115 @@
+"""
+다이제스트 발송 계획
+
+기간 내 공개 콘텐츠를 한 번만 조회하고, 구독자를 구독 카테고리 조합별로 묶어
+조합마다 카테고리별 콘텐츠 목록을 한 번만 만든다.
+(사용자마다 콘텐츠와 구독 카테고리를 다시 조회하지 않음)
+
+구독자와 구독 카테고리는 각각 pk 순으로 iterator()로 읽으며 병합하므로
+처리 시간과 메모리는 사용자 수가 아니라 서로 다른 구독 조합 수에 비례한다.
+"""
+import logging
+from collections import defaultdict
+from django.conf import settings
+from .models import MailingPreference
+
+logger = logging.getLogger(__name__)
+
+
+def get_period_contents(period_start, period_end):
+    """기간 내 발행된 공개 콘텐츠 (카테고리 이름, 최신순)"""
+    from apps.contents.models import Content
+
+    return list(
+        Content.objects.filter(
+            status=Content.Status.PUBLISHED,
+            published_at__gte=period_start,
+            published_at__lt=period_end
+        ).select_related('category').defer(
+            'content_html', 'content_html_br', 'plain_text'
+        ).order_by('category__name', '-published_at')
+    )
+
+
+def group_by_category(contents, category_ids=None):
+    """
+    카테고리별 콘텐츠 딕셔너리
+
+    Args:
+        contents: 콘텐츠 목록 (정렬된 순서 유지)
+        category_ids: 포함할 카테고리 ID 집합 (None이면 전체)
+
+    Returns:
+        dict: {category_name: [content1, content2, ...]}
+    """
+    contents_by_category = defaultdict(list)
+    for content in contents:
+        if category_ids is not None and content.category_id not in category_ids:
+            continue
+        category_name = content.category.name if content.category else '기타'
+        contents_by_category[category_name].append(content)
+    return dict(contents_by_category)
+
+
+def iter_subscriptions(preferences):
+    """
+    메일링 설정과 구독 카테고리 조합을 pk 순으로 생성
+
+    Yields:
+        (MailingPreference, frozenset 또는 None): 전체 카테고리 구독이면 None
+    """
+    chunk_size = settings.EMAIL_BATCH_SIZE
+    preferences = preferences.order_by('pk')
+
+    links = MailingPreference.selected_categories.through.objects.filter(
+        mailingpreference__in=preferences.filter(all_categories=False).values('pk')
+    ).order_by('mailingpreference_id', 'category_id').values_list(
+        'mailingpreference_id', 'category_id'
+    ).iterator(chunk_size=chunk_size)
+    link = next(links, None)
+
+    for preference in preferences.iterator(chunk_size=chunk_size):
+        category_ids = set()
+        # 두 결과 모두 설정 pk 순이므로 병합하며 읽음
+        while link is not None and link[0] < preference.pk:
+            link = next(links, None)
+        while link is not None and link[0] == preference.pk:
+            category_ids.add(link[1])
+            link = next(links, None)
+
+        if preference.all_categories:
+            yield preference, None
+        else:
+            yield preference, frozenset(category_ids)
+
+
+def plan_digests(frequency, period_start, period_end):
+    """
+    다이제스트 발송 대상과 내용
+
+    Args:
+        frequency: MailingPreference.Frequency 값 (WEEKLY, MONTHLY)
+        period_start: 기간 시작 (datetime)
+        period_end: 기간 종료 (datetime, 미포함)
+
+    Yields:
+        (User, contents_by_category): 보낼 콘텐츠가 있는 사용자만
+    """
+    contents = get_period_contents(period_start, period_end)
+    if not contents:
+        return
+
+    preferences = MailingPreference.objects.filter(
+        enabled=True,
+        frequency=frequency,
+        user__is_active=True
+    ).select_related('user')
+
+    buckets = {}
+    for preference, category_ids in iter_subscriptions(preferences):
+        if category_ids not in buckets:
+            buckets[category_ids] = group_by_category(contents, category_ids)
+        if buckets[category_ids]:
+            yield preference.user, buckets[category_ids]
+
+    logger.info(f"[DIGEST] {frequency}: {len(buckets)} subscription sets, {len(contents)} contents")
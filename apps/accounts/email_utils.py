@@ -1,16 +1,122 @@
 """
 이메일 발송 유틸리티
+
+메일은 build_*()로 메시지만 만든 뒤 deliver_messages()로 묶어서 발송한다.
+EMAIL_BATCH_SIZE개 메시지마다 SMTP 연결 하나를 열어 재사용하고,
+EMAIL_SEND_CONCURRENCY개 배치를 동시에 발송한다.
 """
-from django.core.mail import EmailMultiAlternatives
+import logging
+import smtplib
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.conf import settings
-from datetime import datetime, timedelta
-from collections import defaultdict
 
+logger = logging.getLogger(__name__)
 
-def send_weekly_digest(user, week_start, week_end, contents_by_category):
+# 재시도 간격 (초, 시도마다 두 배)
+RETRY_BACKOFF = 1
+
+# 수신자별 발송 결과
+DeliveryResult = namedtuple('DeliveryResult', ['recipient', 'sent', 'attempts', 'error'])
+
+
+def _is_permanent_failure(error):
+    """다시 보내도 실패할 오류 (수신자 거부, 5xx 응답)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+def _send_batch(messages, throttle=None):
     """
-    주간 다이제스트 이메일 발송
+    메시지 묶음을 SMTP 연결 하나로 발송
+
+    연결을 한 번 열고 메시지마다 send_messages()를 호출해 수신자별 결과를 기록한다.
+    일시적인 오류는 EMAIL_SEND_RETRIES번까지 다시 보내며, 연결 오류면 다시 연결한다.
+    throttle을 지정하면 발송 시도마다 먼저 호출한다. (발송 속도 제한)
+    """
+    retries = settings.EMAIL_SEND_RETRIES
+    connection = get_connection(fail_silently=False)
+    results = []
+    try:
+        for message in messages:
+            recipient = ', '.join(message.to)
+            error = None
+            for attempt in range(1, retries + 2):
+                if throttle is not None:
+                    throttle()
+                try:
+                    # 미리 열어 두어야 send_messages()가 호출마다 연결을 닫지 않음
+                    connection.open()
+                    connection.send_messages([message])
+                    error = None
+                    break
+                except Exception as e:
+                    error = e
+                    if _is_permanent_failure(e) or attempt > retries:
+                        break
+                    if not isinstance(e, smtplib.SMTPResponseException):
+                        connection.close()
+                    time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            results.append(DeliveryResult(recipient, error is None, attempt, error))
+    finally:
+        connection.close()
+    return results
+
+
+def deliver_messages(messages, throttle=None):
+    """
+    이메일 메시지 일괄 발송
+
+    Args:
+        messages: EmailMessage iterable (generator도 가능, 배치 단위로 소비)
+        throttle: 발송 시도마다 호출할 함수 (허용될 때까지 대기, 동시 발송 스레드에서 호출됨)
+
+    Returns:
+        list: 입력 순서대로의 DeliveryResult 목록
+    """
+    batch_size = max(settings.EMAIL_BATCH_SIZE, 1)
+    concurrency = max(settings.EMAIL_SEND_CONCURRENCY, 1)
+
+    def batches():
+        batch = []
+        for message in messages:
+            batch.append(message)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    if concurrency == 1:
+        results = [result for batch in batches() for result in _send_batch(batch, throttle)]
+    else:
+        futures = []
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for batch in batches():
+                # 동시에 메모리에 올리는 배치 수 제한
+                pending = [future for future in futures if not future.done()]
+                if len(pending) >= concurrency:
+                    wait(pending, return_when=FIRST_COMPLETED)
+                futures.append(executor.submit(_send_batch, batch, throttle))
+        results = [result for future in futures for result in future.result()]
+
+    for result in results:
+        if not result.sent:
+            logger.error(
+                f"[Email] Failed to send to {result.recipient} "
+                f"after {result.attempts} attempts: {result.error}"
+            )
+    return results
+
+
+def build_weekly_digest(user, week_start, week_end, contents_by_category):
+    """
+    주간 다이제스트 이메일 메시지 생성
 
     Args:
         user: User 객체
@@ -61,13 +167,18 @@ def send_weekly_digest(user, week_start, week_end, contents_by_category):
     # HTML 버전 첨부
     email.attach_alternative(html_content, "text/html")
 
-    # 이메일 발송
-    email.send()
+    return email
+
+
+def send_weekly_digest(user, week_start, week_end, contents_by_category):
+    """주간 다이제스트 이메일 발송"""
+    build_weekly_digest(user, week_start, week_end, contents_by_category).send()
 
 
 def get_weekly_contents_for_user(user, week_start, week_end):
     """
     특정 사용자의 메일링 설정에 따라 주간 콘텐츠를 가져옴
+    (여러 사용자에게 발송할 때는 digests.plan_digests() 사용)
 
     Args:
         user: User 객체
@@ -78,6 +189,7 @@ def get_weekly_contents_for_user(user, week_start, week_end):
         dict: 카테고리별 콘텐츠 딕셔너리 {category_name: [content1, content2, ...]}
     """
     from apps.contents.models import Content
+    from .digests import group_by_category
     from .models import MailingPreference
 
     try:
@@ -108,43 +220,19 @@ def get_weekly_contents_for_user(user, week_start, week_end):
         contents_query = contents_query.filter(category_id__in=selected_category_ids)
 
     # 카테고리별로 그룹화
-    contents_by_category = defaultdict(list)
-    for content in contents_query.order_by('category__name', '-published_at'):
-        category_name = content.category.name if content.category else '기타'
-        contents_by_category[category_name].append(content)
-
-    return dict(contents_by_category)
+    return group_by_category(contents_query.order_by('category__name', '-published_at'))
 
 
-def send_immediate_content_notification(user, content):
+def build_immediate_content_notification(user, content):
     """
-    즉시 알림 이메일 발송 (새 콘텐츠 발행 시)
+    즉시 알림 이메일 메시지 생성 (새 콘텐츠 발행 시)
+
+    수신 대상 여부는 호출하는 쪽에서 recipients.resolve_recipients()로 확인한다.
 
     Args:
         user: User 객체
         content: Content 객체
     """
-    from .models import MailingPreference
-
-    try:
-        preference = user.mailing_preference
-    except MailingPreference.DoesNotExist:
-        return
-
-    # 메일링이 비활성화되어 있으면 반환
-    if not preference.enabled:
-        return
-
-    # 즉시 알림이 아니면 반환
-    if preference.frequency != 'IMMEDIATE':
-        return
-
-    # 카테고리 체크
-    if not preference.all_categories:
-        selected_category_ids = list(preference.selected_categories.values_list('id', flat=True))
-        if content.category_id not in selected_category_ids:
-            return
-
     # 사이트 URL 설정
     site_url = getattr(settings, 'SITE_URL', 'http://localhost:3000')
 
@@ -178,17 +266,14 @@ LIS Lab에 새로운 콘텐츠가 발행되었습니다.
 메일링 설정: {site_url}/my/mailing-settings
 """
 
-    # 이메일 발송
-    from django.core.mail import send_mail
-    try:
-        send_mail(
-            subject=subject,
-            message=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
-        print(f"[Email] Successfully sent to {user.email}")
-    except Exception as e:
-        print(f"[Email] Failed to send to {user.email}: {str(e)}")
-        raise
+    return EmailMessage(
+        subject=subject,
+        body=text_content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+def send_immediate_content_notification(user, content):
+    """즉시 알림 이메일 발송 (실패 시 예외 발생)"""
+    build_immediate_content_notification(user, content).send()
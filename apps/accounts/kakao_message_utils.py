@@ -1,43 +1,94 @@
 """
 카카오 메시지 발송 유틸리티
+
+send_kakao_messages()는 여러 사용자에게 같은 메시지를 동시에 발송한다.
+- 프로세스 전체가 keep-alive 연결 풀을 가진 requests.Session 하나를 공유
+- KAKAO_MESSAGE_CONCURRENCY개 요청을 동시에 보내고, 요청마다 KAKAO_MESSAGE_TIMEOUT 적용
+- 연결 실패, 429, 503 응답은 세션 어댑터(urllib3 Retry)가 KAKAO_MESSAGE_RETRIES번까지
+  간격을 두 배씩 늘리며 재시도 (Retry-After 헤더가 있으면 RETRY_AFTER_MAX초 안에서 그만큼 기다림)
+- 요청을 보낸 뒤의 오류(읽기 시간 초과, 500/502/504)는 이미 발송되었을 수 있으므로 재시도하지 않음
+- 401 응답(토큰 만료/무효)을 받은 사용자의 토큰은 발송이 끝난 뒤 한 번에 삭제
 """
 import requests
 import json
 import logging
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
-KAKAO_MESSAGE_SEND_URL = 'https://kapi.kakao.com/v2/api/talk/memo/default/send'
-
-
-def send_kakao_message_notification(user, content):
+# 재시도 간격 (초, 시도마다 두 배)
+RETRY_BACKOFF = 0.5
+
+# Retry-After 헤더를 따르는 최대 대기 시간 (초, 발송 스레드가 오래 멈추지 않도록)
+RETRY_AFTER_MAX = 10
+
+# 요청을 처리하지 않았음이 분명한 응답만 재시도
+RETRY_STATUS_CODES = [429, 503]
+
+# 사용자별 발송 결과
+KakaoMessageResult = namedtuple('KakaoMessageResult', ['user_id', 'sent', 'status_code', 'error'])
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class CappedRetry(Retry):
+    """Retry-After 대기 시간을 RETRY_AFTER_MAX초로 제한하는 Retry"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+def get_session():
+    """공유 HTTP 세션 (연결 풀 크기 = 동시 요청 수, 일시적 오류 재시도)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retries = settings.KAKAO_MESSAGE_RETRIES
+                retry = CappedRetry(
+                    total=retries,
+                    connect=retries,
+                    # 요청을 보낸 뒤 응답을 못 받은 경우는 중복 발송이 될 수 있으므로 재시도하지 않음
+                    read=0,
+                    status=retries,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=['POST'],
+                    backoff_factor=RETRY_BACKOFF,
+                    respect_retry_after_header=True,
+                    # 재시도가 끝나면 예외 대신 마지막 응답을 돌려받아 상태 코드를 기록
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=max(settings.KAKAO_MESSAGE_CONCURRENCY, 1),
+                    max_retries=retry
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def build_kakao_message(content):
     """
-    카카오톡 메시지로 새 콘텐츠 알림 발송
+    새 콘텐츠 알림 메시지 요청 데이터 (수신자와 무관하므로 콘텐츠당 한 번 생성)
 
     Args:
-        user: User 객체 (kakao_message_token이 있어야 함)
         content: Content 객체
 
     Returns:
-        bool: 발송 성공 여부
+        dict: 메시지 API 요청 폼 데이터
     """
-    # 카카오 메시지 토큰이 없으면 발송 불가
-    if not user.kakao_message_token:
-        logger.warning(f"[KAKAO MESSAGE] 토큰 없음: {user.username}")
-        return False
-
-    # 메일링 설정 확인
-    try:
-        preference = user.mailing_preference
-    except Exception:
-        logger.warning(f"[KAKAO MESSAGE] 메일링 설정 없음: {user.username}")
-        return False
-
-    # 카카오 알림이 비활성화되어 있으면 발송 안 함
-    if not preference.kakao_notification_enabled:
-        return False
-
     # 사이트 URL 설정
     site_url = getattr(settings, 'SITE_URL', 'http://localhost:3000')
     content_url = f"{site_url}/contents/{content.slug}"
@@ -63,40 +114,107 @@ def send_kakao_message_notification(user, content):
         "button_title": "학습하기"
     }
 
-    # API 요청 헤더
-    headers = {
-        'Authorization': f'Bearer {user.kakao_message_token}',
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
-
     # API 요청 데이터
-    data = {
+    return {
         'template_object': json.dumps(template_object, ensure_ascii=False)
     }
 
+
+def _error_message(response):
+    """실패 응답의 오류 메시지 (JSON이 아니면 본문 그대로)"""
+    try:
+        payload = response.json()
+    except ValueError:
+        return response.text
+    return isinstance(payload, dict) and payload.get('msg') or response.text
+
+
+def _post_message(user_id, token, data):
+    """메시지 한 건 발송 (일시적 오류는 세션이 재시도)"""
+    headers = {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/x-www-form-urlencoded'
+    }
+
     try:
-        # 카카오 메시지 API 호출
-        response = requests.post(
-            KAKAO_MESSAGE_SEND_URL,
+        response = get_session().post(
+            settings.KAKAO_MESSAGE_SEND_URL,
             headers=headers,
-            data=data
+            data=data,
+            timeout=settings.KAKAO_MESSAGE_TIMEOUT
         )
+    except requests.RequestException as e:
+        return KakaoMessageResult(user_id, False, None, e)
 
-        if response.status_code == 200:
-            logger.info(f"[KAKAO MESSAGE] 발송 성공: {user.username} <- {content.title}")
-            return True
-        else:
-            logger.error(f"[KAKAO MESSAGE] 발송 실패 ({user.username}): {response.status_code} - {response.text}")
+    if response.status_code == 200:
+        return KakaoMessageResult(user_id, True, 200, None)
+    return KakaoMessageResult(user_id, False, response.status_code, _error_message(response))
 
-            # 토큰이 만료되었거나 잘못된 경우
-            if response.status_code == 401:
-                logger.warning(f"[KAKAO MESSAGE] 토큰 만료/무효: {user.username}")
-                # 토큰 삭제 (사용자가 재연동해야 함)
+
+def send_kakao_messages(users, content):
+    """
+    카카오톡 메시지로 새 콘텐츠 알림 일괄 발송
+
+    수신 대상 여부는 호출하는 쪽에서 recipients.resolve_recipients()로 확인한다.
+
+    Args:
+        users: User 목록 (kakao_message_token이 있어야 함)
+        content: Content 객체
+
+    Returns:
+        list: 입력 순서대로의 KakaoMessageResult 목록
+    """
+    from .models import User
+
+    users = [user for user in users if user.kakao_message_token]
+    if not users:
+        return []
+
+    data = build_kakao_message(content)
+    concurrency = max(settings.KAKAO_MESSAGE_CONCURRENCY, 1)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(users))) as executor:
+        results = list(executor.map(
+            lambda user: _post_message(user.pk, user.kakao_message_token, data),
+            users
+        ))
+
+    usernames = {user.pk: user.username for user in users}
+    expired = []
+    for result in results:
+        username = usernames[result.user_id]
+        if result.sent:
+            logger.info(f"[KAKAO MESSAGE] 발송 성공: {username} <- {content.title}")
+            continue
+        logger.error(f"[KAKAO MESSAGE] 발송 실패 ({username}): {result.status_code} - {result.error}")
+        # 토큰이 만료되었거나 잘못된 경우
+        if result.status_code == 401:
+            logger.warning(f"[KAKAO MESSAGE] 토큰 만료/무효: {username}")
+            expired.append(result.user_id)
+
+    if expired:
+        # 토큰 삭제 (사용자가 재연동해야 함)
+        User.objects.filter(pk__in=expired).update(kakao_message_token=None)
+        for user in users:
+            if user.pk in expired:
                 user.kakao_message_token = None
-                user.save()
 
-            return False
+    return results
+
+
+def send_kakao_message_notification(user, content):
+    """
+    카카오톡 메시지로 새 콘텐츠 알림 발송 (한 명)
 
-    except Exception as e:
-        logger.error(f"[KAKAO MESSAGE] 예외 발생 ({user.username}): {str(e)}")
+    Args:
+        user: User 객체 (kakao_message_token이 있어야 함)
+        content: Content 객체
+
+    Returns:
+        bool: 발송 성공 여부
+    """
+    # 카카오 메시지 토큰이 없으면 발송 불가
+    if not user.kakao_message_token:
+        logger.warning(f"[KAKAO MESSAGE] 토큰 없음: {user.username}")
         return False
+
+    return send_kakao_messages([user], content)[0].sent
@@ -108,6 +108,9 @@ class User(AbstractUser):
         verbose_name = '사용자'
         verbose_name_plural = '사용자 목록'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['social_provider', 'social_id'],
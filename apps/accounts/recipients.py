@@ -0,0 +1,60 @@
+"""
+알림 수신자 조회
+
+카테고리와 발송 빈도로 알림을 받을 사용자와 채널(이메일, 카카오 메시지)을
+MailingPreference에 대한 쿼리 한 번으로 계산한다.
+(사용자마다 구독 카테고리를 따로 조회하지 않음)
+"""
+from collections import namedtuple
+from django.db.models import Exists, OuterRef, Q
+from .models import MailingPreference, User
+
+EMAIL = 'email'
+KAKAO = 'kakao'
+
+Recipient = namedtuple('Recipient', ['user_id', 'channels'])
+
+
+def resolve_recipients(category_id, frequency, user_ids=None):
+    """
+    알림 대상 사용자와 채널
+
+    Args:
+        category_id: 콘텐츠 카테고리 ID
+        frequency: MailingPreference.Frequency 값
+        user_ids: 지정하면 이 사용자들 중에서만 조회
+
+    Returns:
+        list: user_id 순으로 정렬한 Recipient 목록
+    """
+    subscribed = MailingPreference.selected_categories.through.objects.filter(
+        mailingpreference_id=OuterRef('pk'),
+        category_id=category_id
+    )
+    preferences = MailingPreference.objects.filter(
+        Q(all_categories=True) | Exists(subscribed),
+        enabled=True,
+        frequency=frequency,
+        user__is_active=True
+    )
+    if user_ids is not None:
+        preferences = preferences.filter(user_id__in=user_ids)
+
+    rows = preferences.order_by('user_id').values_list(
+        'user_id',
+        'user__email',
+        'user__social_provider',
+        'user__kakao_message_token',
+        'kakao_notification_enabled'
+    )
+
+    recipients = []
+    for user_id, email, social_provider, kakao_token, kakao_enabled in rows:
+        channels = set()
+        if email:
+            channels.add(EMAIL)
+        if social_provider == User.SocialProvider.KAKAO and kakao_enabled and kakao_token:
+            channels.add(KAKAO)
+        if channels:
+            recipients.append(Recipient(user_id, frozenset(channels)))
+    return recipients
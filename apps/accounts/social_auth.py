@@ -9,6 +9,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
+from apps.analytics.activity import record_event
+from apps.analytics.models import ActivityEvent
 from .models import User
 
 logger = logging.getLogger(__name__)
@@ -157,6 +159,7 @@ def kakao_login(request):
 
     # 5. JWT 토큰 생성
     refresh = RefreshToken.for_user(user)
+    record_event(ActivityEvent.EventType.LOGIN, user, provider='kakao')
 
     return Response({
         'access': str(refresh.access_token),
@@ -471,6 +474,7 @@ def naver_login(request):
 
     # 5. JWT 토큰 생성
     refresh = RefreshToken.for_user(user)
+    record_event(ActivityEvent.EventType.LOGIN, user, provider='naver')
 
     return Response({
         'access': str(refresh.access_token),
@@ -632,6 +636,7 @@ def google_login(request):
 
     # 5. JWT 토큰 생성
     refresh = RefreshToken.for_user(user)
+    record_event(ActivityEvent.EventType.LOGIN, user, provider='google')
 
     return Response({
         'access': str(refresh.access_token),
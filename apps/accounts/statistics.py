@@ -1,37 +1,125 @@
-"""관리자 통계 뷰"""
+"""
+관리자 통계 뷰
+
+통계는 요청마다 계산하지 않고 공유 캐시의 스냅샷을 응답한다.
+스냅샷이 STATISTICS_SNAPSHOT_TTL보다 오래되면 기존 스냅샷을 그대로 응답하고
+Celery 작업으로 새 스냅샷을 만든다. (stale-while-revalidate)
+캐시를 프로세스끼리 공유하지 않으면(CACHE_IS_SHARED=False) 요청을 처리하는 프로세스에서 갱신한다.
+날짜별 추이는 원본 테이블 대신 analytics 앱의 일별 통계를 읽는다.
+"""
+import logging
+import time
+from collections import defaultdict
+from datetime import timedelta
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Count, Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Max, Sum
 from django.utils import timezone
-from datetime import timedelta
+from apps.common.queries import count_subquery
 from .models import User
+from apps.analytics.models import ActivityEvent, DailyStatistic, DailyContentStatistic
+from apps.analytics.trending import decayed_score
 from apps.contents.models import Content, Favorite
 from apps.boards.models import Post, PostReply
 
+logger = logging.getLogger(__name__)
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def admin_statistics(request):
-    """관리자 통계 데이터"""
+SNAPSHOT_KEY = 'admin-statistics:snapshot'
+SNAPSHOT_LOCK_KEY = 'admin-statistics:refresh-lock'
+SNAPSHOT_LOCK_TIMEOUT = 60 * 5
 
-    # 관리자 권한 확인
-    if not request.user.is_admin:
-        return Response(
-            {"detail": "관리자 권한이 필요합니다."},
-            status=status.HTTP_403_FORBIDDEN
-        )
+# 일별 추이를 보여주는 기간 (일)
+ACTIVITY_DAYS = 30
+
+
+def get_monthly_registrations(now, months=12):
+    """월별 회원 등록 건수 (이번 달 포함 최근 months개월, 일별 통계 합계)"""
+    month_start = timezone.localtime(now).date().replace(day=1)
+    month_starts = [month_start]
+    for _ in range(months - 1):
+        previous = month_starts[0]
+        if previous.month == 1:
+            previous = previous.replace(year=previous.year - 1, month=12)
+        else:
+            previous = previous.replace(month=previous.month - 1)
+        month_starts.insert(0, previous)
+
+    counts = defaultdict(int)
+    for date, value in DailyStatistic.objects.filter(
+        metric=DailyStatistic.Metric.REGISTRATIONS,
+        date__gte=month_starts[0]
+    ).values_list('date', 'value'):
+        counts[date.strftime('%Y-%m')] += value
 
+    return [
+        {'month': month.strftime('%Y-%m'), 'count': counts[month.strftime('%Y-%m')]}
+        for month in month_starts
+    ]
+
+
+def get_daily_activity(now, days=ACTIVITY_DAYS):
+    """최근 days일의 지표별 일별 건수"""
+    today = timezone.localtime(now).date()
+    dates = [today - timedelta(days=n) for n in range(days - 1, -1, -1)]
+
+    values = {
+        (date, metric): value
+        for date, metric, value in DailyStatistic.objects.filter(
+            date__gte=dates[0]
+        ).values_list('date', 'metric', 'value')
+    }
+    return [
+        {
+            'date': date,
+            **{metric.lower(): values.get((date, metric), 0) for metric in DailyStatistic.Metric.values},
+        }
+        for date in dates
+    ]
+
+
+def get_most_active_contributors(limit=10):
+    """
+    가장 왕성한 활동을 한 회원
+    활동 점수 = 게시글 작성 수 + 답글 작성 수 + 즐겨찾기 수 (상관 서브쿼리로 한 번에 계산)
+    """
+    users = User.objects.filter(is_active=True).annotate(
+        post_count=count_subquery(Post.objects.filter(is_deleted=False), 'author'),
+        reply_count=count_subquery(PostReply.objects.all(), 'author'),
+        favorite_count=count_subquery(Favorite.objects.all(), 'user'),
+    ).annotate(
+        activity_score=F('post_count') + F('reply_count') + F('favorite_count')
+    ).filter(
+        activity_score__gt=0
+    ).order_by('-activity_score', 'pk').values(
+        'id', 'username', 'first_name', 'last_name', 'email', 'user_type', 'organization',
+        'post_count', 'reply_count', 'favorite_count', 'activity_score'
+    )[:limit]
+
+    contributors = []
+    for user in users:
+        first_name = user.pop('first_name')
+        last_name = user.pop('last_name')
+        # 이름 구성
+        user['full_name'] = f"{last_name}{first_name}".strip() if first_name or last_name else '-'
+        user['organization'] = user['organization'] or '-'
+        contributors.append(user)
+    return contributors
+
+
+def build_statistics():
+    """관리자 통계 계산"""
     # 현재 날짜
     now = timezone.now()
-    this_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    # 이번 달 시작은 현지 시간(TIME_ZONE) 기준
+    this_month_start = timezone.localtime(now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
     # 1. 콘텐츠 통계
     # 가장 많이 즐겨찾기된 콘텐츠 (상위 10개)
-    top_favorited_contents = Content.objects.annotate(
-        favorite_count=Count('favorited_by')
-    ).filter(
+    top_favorited_contents = Content.objects.filter(
         favorite_count__gt=0
     ).order_by('-favorite_count')[:10].values(
         'id', 'title', 'slug', 'favorite_count'
@@ -44,14 +132,30 @@ def admin_statistics(request):
         'id', 'title', 'slug', 'view_count'
     )
 
+    # 최근 30일간 가장 많이 읽힌 콘텐츠 (상위 10개)
+    top_viewed_recent = DailyContentStatistic.objects.filter(
+        date__gt=timezone.localtime(now).date() - timedelta(days=ACTIVITY_DAYS),
+        view_count__gt=0
+    ).values('content_id', 'content__title', 'content__slug').annotate(
+        views=Sum('view_count')
+    ).order_by('-views')[:10]
+
+    # 지금 인기 있는 콘텐츠 (시간 감쇠 조회수, 상위 10개)
+    trending_contents = Content.objects.filter(
+        is_deleted=False,
+        status=Content.Status.PUBLISHED,
+        trending_score__isnull=False
+    ).order_by('-trending_score')[:10].values('id', 'title', 'slug', 'trending_score')
+
     # 2. 회원 통계
     # 전체 회원 수
     total_users = User.objects.filter(is_active=True).count()
 
+    # 월별 회원 등록 건수 (최근 12개월)
+    monthly_registrations = get_monthly_registrations(now)
+
     # 이번 달 신규 회원 수
-    new_users_this_month = User.objects.filter(
-        created_at__gte=this_month_start
-    ).count()
+    new_users_this_month = monthly_registrations[-1]['count']
 
     # 이번 달 신규 회원 목록 (최근 10명)
     recent_new_users = User.objects.filter(
@@ -60,25 +164,6 @@ def admin_statistics(request):
         'id', 'username', 'email', 'user_type', 'organization', 'created_at'
     )
 
-    # 월별 회원 등록 건수 (최근 12개월)
-    monthly_registrations = []
-    for i in range(11, -1, -1):
-        month_start = (now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(days=i*30)).replace(day=1)
-        if i > 0:
-            month_end = (now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(days=(i-1)*30)).replace(day=1)
-        else:
-            month_end = now
-
-        count = User.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-
-        monthly_registrations.append({
-            'month': month_start.strftime('%Y-%m'),
-            'count': count
-        })
-
     # 직업별 회원 수
     users_by_type = User.objects.filter(
         is_active=True
@@ -106,57 +191,59 @@ def admin_statistics(request):
         count=Count('id')
     ).order_by('-count')[:10]
 
-    # 3. 가장 많이 로그인한 회원 (last_login 기준, 최근 로그인한 사용자)
-    # Note: Django는 로그인 횟수를 기본적으로 추적하지 않으므로,
-    # last_login이 최근인 사용자를 반환
-    most_active_users = User.objects.filter(
-        is_active=True,
-        last_login__isnull=False
-    ).order_by('-last_login')[:10].values(
-        'id', 'username', 'email', 'user_type', 'last_login'
+    # 3. 가장 많이 로그인한 회원 (최근 30일 로그인 이벤트 수 기준)
+    login_counts = ActivityEvent.objects.filter(
+        event_type=ActivityEvent.EventType.LOGIN,
+        created_at__gte=now - timedelta(days=ACTIVITY_DAYS),
+        user__isnull=False
+    ).values('user_id').annotate(
+        login_count=Count('pk'),
+        last_login=Max('created_at')
+    ).order_by('-login_count', '-last_login')[:10]
+    login_counts = {item['user_id']: item for item in login_counts}
+    users = User.objects.filter(pk__in=list(login_counts), is_active=True).values(
+        'id', 'username', 'email', 'user_type'
+    )
+    most_active_users = sorted(
+        (
+            {
+                **user,
+                'login_count': login_counts[user['id']]['login_count'],
+                'last_login': login_counts[user['id']]['last_login'],
+            }
+            for user in users
+        ),
+        key=lambda user: (-user['login_count'], -user['last_login'].timestamp())
     )
 
     # 4. 가장 왕성한 활동을 한 회원
-    # 활동 점수 = 게시글 작성 수 + 답글 작성 수 + 즐겨찾기 수
-    active_users_data = []
-    users = User.objects.filter(is_active=True)
+    most_active_contributors = get_most_active_contributors()
 
-    for user in users:
-        post_count = Post.objects.filter(author=user, is_deleted=False).count()
-        reply_count = PostReply.objects.filter(author=user).count()
-        favorite_count = Favorite.objects.filter(user=user).count()
-
-        activity_score = post_count + reply_count + favorite_count
-
-        if activity_score > 0:
-            # 이름 구성
-            full_name = f"{user.last_name}{user.first_name}".strip() if user.first_name or user.last_name else '-'
-
-            active_users_data.append({
-                'id': user.id,
-                'username': user.username,
-                'full_name': full_name,
-                'email': user.email,
-                'user_type': user.user_type,
-                'organization': user.organization or '-',
-                'post_count': post_count,
-                'reply_count': reply_count,
-                'favorite_count': favorite_count,
-                'activity_score': activity_score,
-            })
-
-    # 활동 점수로 정렬
-    most_active_contributors = sorted(
-        active_users_data,
-        key=lambda x: x['activity_score'],
-        reverse=True
-    )[:10]
-
-    return Response({
+    return {
+        'generated_at': now,
         'content_statistics': {
             'top_favorited': list(top_favorited_contents),
             'top_viewed': list(top_viewed_contents),
+            'top_viewed_recent': [
+                {
+                    'id': item['content_id'],
+                    'title': item['content__title'],
+                    'slug': item['content__slug'],
+                    'view_count': item['views'],
+                }
+                for item in top_viewed_recent
+            ],
+            'trending': [
+                {
+                    'id': item['id'],
+                    'title': item['title'],
+                    'slug': item['slug'],
+                    'score': round(decayed_score(item['trending_score'], now), 3),
+                }
+                for item in trending_contents
+            ],
         },
+        'daily_activity': get_daily_activity(now),
         'user_statistics': {
             'total_users': total_users,
             'new_users_this_month': new_users_this_month,
@@ -167,4 +254,54 @@ def admin_statistics(request):
             'most_active_users': list(most_active_users),
             'most_active_contributors': most_active_contributors,
         }
-    })
+    }
+
+
+def refresh_statistics_snapshot():
+    """통계를 다시 계산해 스냅샷으로 저장"""
+    try:
+        data = build_statistics()
+        cache.set(SNAPSHOT_KEY, {'data': data, 'built_at': time.time()}, timeout=None)
+        return data
+    finally:
+        cache.delete(SNAPSHOT_LOCK_KEY)
+
+
+def get_statistics_snapshot():
+    """
+    통계 스냅샷 (없으면 바로 계산, 오래되었으면 기존 스냅샷을 응답하고 백그라운드에서 갱신)
+    """
+    from apps.analytics.tasks import refresh_statistics_snapshot as refresh_task
+
+    snapshot = cache.get(SNAPSHOT_KEY)
+    if snapshot is None:
+        return refresh_statistics_snapshot()
+
+    is_stale = time.time() - snapshot['built_at'] > settings.STATISTICS_SNAPSHOT_TTL
+    if is_stale and not settings.CACHE_IS_SHARED:
+        # Celery 워커가 갱신한 스냅샷을 볼 수 없으므로 이 프로세스에서 갱신
+        return refresh_statistics_snapshot()
+    # 갱신 작업은 한 번만 등록
+    if is_stale and cache.add(SNAPSHOT_LOCK_KEY, 1, timeout=SNAPSHOT_LOCK_TIMEOUT):
+        try:
+            refresh_task.delay()
+        except Exception as e:
+            cache.delete(SNAPSHOT_LOCK_KEY)
+            logger.error(f"[STATISTICS] 스냅샷 갱신 작업 등록 실패: {e}")
+
+    return snapshot['data']
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def admin_statistics(request):
+    """관리자 통계 데이터"""
+
+    # 관리자 권한 확인
+    if not request.user.is_admin:
+        return Response(
+            {"detail": "관리자 권한이 필요합니다."},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    return Response(get_statistics_snapshot())
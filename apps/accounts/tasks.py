@@ -1,11 +1,44 @@
 """
 Celery 태스크
 """
+import logging
 from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from datetime import timedelta
-from .models import User
-from .email_utils import send_weekly_digest, get_weekly_contents_for_user
+from .models import MailingPreference, User
+from .digests import plan_digests
+from .email_utils import build_weekly_digest, deliver_messages
+from .recipients import EMAIL, KAKAO, resolve_recipients
+
+logger = logging.getLogger(__name__)
+
+# 발송 작업 등록이 누락된 발행 이벤트를 다시 등록하기까지의 대기 시간
+PUBLISH_EVENT_RETRY_DELAY = timedelta(minutes=1)
+
+# 발송 중 상태로 이 시간 동안 끝나지 않은 발행 이벤트/청크를 다시 등록
+PUBLISH_EVENT_STALL_TIMEOUT = timedelta(minutes=30)
+
+
+def send_digests(frequency, period_start, period_end):
+    """
+    다이제스트 메시지를 만들어 일괄 발송 (콘텐츠가 없는 사용자는 제외)
+
+    Returns:
+        int: 발송에 성공한 메일 수
+    """
+    def messages():
+        for user, contents_by_category in plan_digests(frequency, period_start, period_end):
+            try:
+                yield build_weekly_digest(user, period_start, period_end, contents_by_category)
+            except Exception as e:
+                # 개별 사용자 메시지 생성 실패 시 로그만 남기고 계속 진행
+                logger.error(f"Failed to build digest for {user.email}: {e}")
+
+    results = deliver_messages(messages())
+    return sum(result.sent for result in results)
 
 
 @shared_task
@@ -25,28 +58,7 @@ def send_weekly_digest_emails():
     week_start_dt = timezone.make_aware(week_start_dt)
     week_end_dt = timezone.make_aware(week_end_dt)
 
-    # 활성 사용자 중 메일링 설정이 있는 사용자들
-    users = User.objects.filter(
-        is_active=True,
-        mailing_preference__enabled=True,
-        mailing_preference__frequency='WEEKLY'
-    ).select_related('mailing_preference')
-
-    sent_count = 0
-    for user in users:
-        try:
-            # 사용자별 콘텐츠 가져오기
-            contents_by_category = get_weekly_contents_for_user(user, week_start_dt, week_end_dt)
-
-            # 콘텐츠가 있을 때만 이메일 발송
-            if contents_by_category:
-                send_weekly_digest(user, week_start_dt, week_end_dt, contents_by_category)
-                sent_count += 1
-        except Exception as e:
-            # 개별 사용자 발송 실패 시 로그만 남기고 계속 진행
-            print(f"Failed to send weekly digest to {user.email}: {str(e)}")
-            continue
-
+    sent_count = send_digests(MailingPreference.Frequency.WEEKLY, week_start_dt, week_end_dt)
     return f"Weekly digest sent to {sent_count} users"
 
 
@@ -72,28 +84,8 @@ def send_monthly_digest_emails():
     month_start_dt = timezone.make_aware(month_start_dt)
     last_month_start_dt = timezone.make_aware(last_month_start_dt)
 
-    # 활성 사용자 중 메일링 설정이 있는 사용자들
-    users = User.objects.filter(
-        is_active=True,
-        mailing_preference__enabled=True,
-        mailing_preference__frequency='MONTHLY'
-    ).select_related('mailing_preference')
-
-    sent_count = 0
-    for user in users:
-        try:
-            # 사용자별 콘텐츠 가져오기 (주간 다이제스트 함수 재사용)
-            contents_by_category = get_weekly_contents_for_user(user, last_month_start_dt, month_start_dt)
-
-            # 콘텐츠가 있을 때만 이메일 발송
-            if contents_by_category:
-                send_weekly_digest(user, last_month_start_dt, month_start_dt, contents_by_category)
-                sent_count += 1
-        except Exception as e:
-            # 개별 사용자 발송 실패 시 로그만 남기고 계속 진행
-            print(f"Failed to send monthly digest to {user.email}: {str(e)}")
-            continue
-
+    # 주간 다이제스트 메시지 재사용
+    sent_count = send_digests(MailingPreference.Frequency.MONTHLY, last_month_start_dt, month_start_dt)
     return f"Monthly digest sent to {sent_count} users"
 
 
@@ -112,7 +104,232 @@ def send_immediate_notification(user_id, content_id):
     try:
         user = User.objects.get(id=user_id)
         content = Content.objects.get(id=content_id)
-        send_immediate_content_notification(user, content)
-        return f"Immediate notification sent to {user.email}"
     except (User.DoesNotExist, Content.DoesNotExist) as e:
         return f"Error: {str(e)}"
+
+    recipients = resolve_recipients(
+        content.category_id, MailingPreference.Frequency.IMMEDIATE, user_ids=[user_id]
+    )
+    if not recipients or EMAIL not in recipients[0].channels:
+        return f"{user.email} is not subscribed"
+
+    send_immediate_content_notification(user, content)
+    return f"Immediate notification sent to {user.email}"
+
+
+@shared_task
+def dispatch_publish_event(event_id):
+    """
+    발행 이벤트의 즉시 알림 대상자(콘텐츠 카테고리 구독자)를 청크로 나눠 발송 작업 등록
+
+    Args:
+        event_id: ContentPublishEvent ID
+    """
+    from apps.contents.models import ContentPublishChunk, ContentPublishEvent
+
+    # 대기 중인 이벤트만 한 번 처리 (중복 등록된 작업은 무시)
+    claimed = ContentPublishEvent.objects.filter(
+        pk=event_id,
+        status=ContentPublishEvent.Status.PENDING
+    ).update(
+        status=ContentPublishEvent.Status.DISPATCHED,
+        dispatched_at=timezone.now()
+    )
+    if not claimed:
+        return f"Publish event {event_id} already dispatched"
+
+    content_category_id = ContentPublishEvent.objects.filter(
+        pk=event_id
+    ).values_list('content__category_id', flat=True).get()
+
+    chunk_size = settings.NOTIFICATION_CHUNK_SIZE
+    user_ids = [
+        recipient.user_id
+        for recipient in resolve_recipients(content_category_id, MailingPreference.Frequency.IMMEDIATE)
+    ]
+    chunks = [user_ids[i:i + chunk_size] for i in range(0, len(user_ids), chunk_size)]
+
+    # 청크 대상자와 집계를 함께 기록 (다시 등록할 때 같은 청크를 사용)
+    with transaction.atomic():
+        ContentPublishChunk.objects.bulk_create(
+            [ContentPublishChunk(event_id=event_id, index=i, user_ids=chunk) for i, chunk in enumerate(chunks)],
+            ignore_conflicts=True
+        )
+        ContentPublishEvent.objects.filter(pk=event_id).update(
+            recipient_count=len(user_ids),
+            chunk_count=len(chunks)
+        )
+
+    if not chunks:
+        ContentPublishEvent.objects.filter(pk=event_id).update(
+            status=ContentPublishEvent.Status.COMPLETED,
+            completed_at=timezone.now()
+        )
+
+    enqueue_publish_chunks(event_id)
+
+    return f"Publish event {event_id}: {len(user_ids)} users in {len(chunks)} chunks"
+
+
+def enqueue_publish_chunks(event_id):
+    """
+    발행 이벤트에서 아직 보내지 않은 청크의 발송 작업 등록
+
+    Returns:
+        int: 등록한 청크 수
+    """
+    from apps.contents.models import ContentPublishChunk
+
+    chunk_ids = list(
+        ContentPublishChunk.objects.filter(
+            event_id=event_id,
+            status=ContentPublishChunk.Status.PENDING
+        ).order_by('index').values_list('pk', flat=True)
+    )
+    for chunk_id in chunk_ids:
+        send_publish_notification_chunk.delay(chunk_id)
+    return len(chunk_ids)
+
+
+def send_publish_chunk(content, user_ids):
+    """
+    사용자 청크 하나에 즉시 알림 발송 (이메일 + 카카오 메시지)
+
+    Returns:
+        tuple: (이메일 발송 성공 수, 실패 수)
+    """
+    from .email_utils import build_immediate_content_notification
+    from .kakao_message_utils import send_kakao_messages
+
+    # 작업 등록 후 설정을 바꾼 사용자는 제외 (청크 단위로 다시 확인)
+    recipients = resolve_recipients(
+        content.category_id, MailingPreference.Frequency.IMMEDIATE, user_ids=user_ids
+    )
+    users = User.objects.select_related('mailing_preference').in_bulk(
+        [recipient.user_id for recipient in recipients]
+    )
+
+    # 이메일은 청크 전체를 SMTP 연결을 재사용해 일괄 발송
+    results = deliver_messages(
+        build_immediate_content_notification(users[recipient.user_id], content)
+        for recipient in recipients
+        if EMAIL in recipient.channels
+    )
+    sent_count = sum(result.sent for result in results)
+    failed_count = len(results) - sent_count
+
+    # 카카오 메시지 발송 (카카오 로그인 사용자 + 알림 활성화된 경우, 동시 발송)
+    kakao_results = send_kakao_messages(
+        [users[recipient.user_id] for recipient in recipients if KAKAO in recipient.channels],
+        content
+    )
+    kakao_failed = sum(not result.sent for result in kakao_results)
+    if kakao_failed:
+        logger.warning(f"[PUBLISH] 카카오 메시지 발송 실패: {kakao_failed}/{len(kakao_results)}")
+
+    return sent_count, failed_count
+
+
+@shared_task(autoretry_for=(Exception,), max_retries=3, retry_backoff=True)
+def send_publish_notification_chunk(chunk_id):
+    """
+    발행 이벤트의 즉시 알림 청크 하나 발송
+
+    청크를 발송 중 상태로 가져간 작업만 발송하므로 다시 등록된 작업이 겹쳐도 한 번만 보낸다.
+    발송 중 오류가 나면 청크를 대기 상태로 되돌리고 다시 시도한다.
+
+    Args:
+        chunk_id: ContentPublishChunk ID
+    """
+    from apps.contents.models import ContentPublishChunk, ContentPublishEvent
+
+    claimed = ContentPublishChunk.objects.filter(
+        pk=chunk_id,
+        status=ContentPublishChunk.Status.PENDING
+    ).update(
+        status=ContentPublishChunk.Status.SENDING,
+        claimed_at=timezone.now()
+    )
+    if not claimed:
+        return f"Publish chunk {chunk_id} already sent"
+
+    chunk = ContentPublishChunk.objects.select_related('event__content__category').get(pk=chunk_id)
+    event_id = chunk.event_id
+    try:
+        sent_count, failed_count = send_publish_chunk(chunk.event.content, chunk.user_ids)
+    except Exception:
+        ContentPublishChunk.objects.filter(pk=chunk_id).update(
+            status=ContentPublishChunk.Status.PENDING,
+            claimed_at=None
+        )
+        raise
+
+    with transaction.atomic():
+        ContentPublishChunk.objects.filter(pk=chunk_id).update(status=ContentPublishChunk.Status.SENT)
+        ContentPublishEvent.objects.filter(pk=event_id).update(
+            sent_count=F('sent_count') + sent_count,
+            failed_count=F('failed_count') + failed_count,
+            completed_chunks=F('completed_chunks') + 1
+        )
+    # 마지막 청크가 끝나면 완료 처리
+    ContentPublishEvent.objects.filter(
+        pk=event_id,
+        completed_chunks__gte=F('chunk_count'),
+        completed_at__isnull=True
+    ).update(
+        status=ContentPublishEvent.Status.COMPLETED,
+        completed_at=timezone.now()
+    )
+
+    return f"Publish event {event_id}: sent {sent_count}, failed {failed_count}"
+
+
+@shared_task
+def dispatch_pending_publish_events():
+    """
+    발송 작업 등록이 누락되었거나 발송이 멈춘 발행 이벤트를 다시 등록
+
+    - 대기 중인 이벤트: 커밋 직후 브로커에 연결하지 못한 경우 등
+    - 발송 중 상태로 PUBLISH_EVENT_STALL_TIMEOUT이 지나도록 끝나지 않은 이벤트:
+      청크 작업 등록이 중간에 실패했거나 워커가 중단된 경우 등.
+      청크를 이미 만들었으면 보내지 않은 청크만 다시 등록하고,
+      청크를 만들기 전에 멈췄으면 대기 상태로 되돌려 처음부터 다시 처리한다.
+    """
+    from apps.contents.models import ContentPublishChunk, ContentPublishEvent
+
+    now = timezone.now()
+    stalled_before = now - PUBLISH_EVENT_STALL_TIMEOUT
+
+    # 발송 중에 워커가 중단된 청크를 대기 상태로 되돌림
+    ContentPublishChunk.objects.filter(
+        status=ContentPublishChunk.Status.SENDING,
+        claimed_at__lt=stalled_before
+    ).update(status=ContentPublishChunk.Status.PENDING, claimed_at=None)
+
+    stalled_ids = list(
+        ContentPublishEvent.objects.filter(
+            status=ContentPublishEvent.Status.DISPATCHED,
+            dispatched_at__lt=stalled_before
+        ).values_list('pk', flat=True)
+    )
+    for event_id in stalled_ids:
+        if ContentPublishChunk.objects.filter(event_id=event_id).exists():
+            # 다음 주기에 다시 등록하지 않도록 시각 기록
+            ContentPublishEvent.objects.filter(pk=event_id).update(dispatched_at=now)
+            enqueue_publish_chunks(event_id)
+        else:
+            ContentPublishEvent.objects.filter(pk=event_id).update(
+                status=ContentPublishEvent.Status.PENDING,
+                dispatched_at=None
+            )
+
+    event_ids = list(
+        ContentPublishEvent.objects.filter(
+            status=ContentPublishEvent.Status.PENDING,
+            created_at__lt=now - PUBLISH_EVENT_RETRY_DELAY
+        ).values_list('pk', flat=True)
+    )
+    for event_id in event_ids:
+        dispatch_publish_event.delay(event_id)
+
+    return f"Re-dispatched {len(event_ids)} publish events, resumed {len(stalled_ids)} stalled events"
@@ -42,3 +42,658 @@ class UserModelTest(TestCase):
 
         guest = User(role=User.Role.GUEST)
         self.assertFalse(guest.can_comment)
+
+
+class PublishNotificationTest(TestCase):
+    """발행 이벤트 즉시 알림 테스트"""
+
+    def setUp(self):
+        from apps.contents.models import Category, Content
+        from .models import MailingPreference
+
+        self.category = Category.objects.create(name='Metadata', slug='metadata')
+        other_category = Category.objects.create(name='Python', slug='python')
+
+        self.author = User.objects.create_user(username='author', password='testpass123')
+
+        for i, categories in enumerate([None, [self.category], [self.category], [other_category]]):
+            user = User.objects.create_user(
+                username=f'subscriber{i}',
+                email=f'subscriber{i}@example.com',
+                password='testpass123'
+            )
+            preference = MailingPreference.objects.create(
+                user=user,
+                enabled=True,
+                frequency=MailingPreference.Frequency.IMMEDIATE,
+                all_categories=categories is None
+            )
+            if categories:
+                preference.selected_categories.set(categories)
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=self.category,
+            author=self.author,
+            status=Content.Status.DRAFT
+        )
+
+    def publish(self):
+        from unittest import mock
+
+        with mock.patch('apps.accounts.tasks.dispatch_publish_event.delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.content.status = self.content.Status.PUBLISHED
+                self.content.save()
+        return delay
+
+    def test_publish_records_event_once(self):
+        """임시저장 → 공개 전환 시에만 이벤트를 기록하고 커밋 후 작업 등록"""
+        from apps.contents.models import ContentPublishEvent
+
+        delay = self.publish()
+        event = ContentPublishEvent.objects.get(content=self.content)
+        delay.assert_called_once_with(event.pk)
+
+        # 공개 상태에서 수정하거나 다시 공개해도 추가 발송 없음
+        self.assertFalse(self.publish().called)
+        self.content.status = self.content.Status.DRAFT
+        self.content.save()
+        self.assertFalse(self.publish().called)
+        self.assertEqual(ContentPublishEvent.objects.count(), 1)
+
+    def test_dispatch_in_chunks(self):
+        """구독자를 청크로 나눠 발송하고 결과 집계"""
+        from unittest import mock
+        from django.core import mail
+        from django.test import override_settings
+        from apps.contents.models import ContentPublishEvent
+        from . import tasks
+
+        self.publish()
+        event = ContentPublishEvent.objects.get(content=self.content)
+
+        with override_settings(NOTIFICATION_CHUNK_SIZE=2), mock.patch(
+            'apps.accounts.tasks.send_publish_notification_chunk.delay',
+            side_effect=tasks.send_publish_notification_chunk
+        ) as chunk_delay:
+            tasks.dispatch_publish_event(event.pk)
+            # 중복 등록된 작업은 무시
+            tasks.dispatch_publish_event(event.pk)
+
+        self.assertEqual(chunk_delay.call_count, 2)
+        self.assertEqual(len(mail.outbox), 3)
+
+        event.refresh_from_db()
+        self.assertEqual(event.status, ContentPublishEvent.Status.COMPLETED)
+        self.assertEqual(event.recipient_count, 3)
+        self.assertEqual(event.sent_count, 3)
+        self.assertEqual(event.completed_chunks, 2)
+
+    def test_stalled_event_resumes_unsent_chunks(self):
+        """청크 작업 등록이 중간에 실패한 이벤트는 보내지 않은 청크만 다시 등록"""
+        from datetime import timedelta
+        from unittest import mock
+        from django.core import mail
+        from django.test import override_settings
+        from django.utils import timezone
+        from apps.contents.models import ContentPublishChunk, ContentPublishEvent
+        from . import tasks
+
+        self.publish()
+        event = ContentPublishEvent.objects.get(content=self.content)
+
+        def enqueue_first_only(chunk_id):
+            # 첫 청크를 등록한 뒤 브로커 연결이 끊김
+            if ContentPublishChunk.objects.filter(event=event).exclude(
+                status=ContentPublishChunk.Status.PENDING
+            ).exists():
+                raise ConnectionError
+            tasks.send_publish_notification_chunk(chunk_id)
+
+        with override_settings(NOTIFICATION_CHUNK_SIZE=2), mock.patch(
+            'apps.accounts.tasks.send_publish_notification_chunk.delay',
+            side_effect=enqueue_first_only
+        ):
+            with self.assertRaises(ConnectionError):
+                tasks.dispatch_publish_event(event.pk)
+        self.assertEqual(len(mail.outbox), 2)
+
+        with mock.patch(
+            'apps.accounts.tasks.send_publish_notification_chunk.delay',
+            side_effect=tasks.send_publish_notification_chunk
+        ) as chunk_delay:
+            # 아직 멈춘 것으로 보지 않음
+            tasks.dispatch_pending_publish_events()
+            self.assertFalse(chunk_delay.called)
+
+            ContentPublishEvent.objects.filter(pk=event.pk).update(
+                dispatched_at=timezone.now() - tasks.PUBLISH_EVENT_STALL_TIMEOUT - timedelta(minutes=1)
+            )
+            tasks.dispatch_pending_publish_events()
+            tasks.dispatch_pending_publish_events()
+
+        self.assertEqual(chunk_delay.call_count, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        event.refresh_from_db()
+        self.assertEqual(event.status, ContentPublishEvent.Status.COMPLETED)
+        self.assertEqual((event.sent_count, event.completed_chunks), (3, 2))
+
+    def test_failed_chunk_is_released_for_retry(self):
+        """발송 중 오류가 난 청크는 대기 상태로 되돌려 다시 시도"""
+        from unittest import mock
+        from apps.contents.models import ContentPublishChunk, ContentPublishEvent
+        from . import tasks
+
+        self.publish()
+        event = ContentPublishEvent.objects.get(content=self.content)
+        with mock.patch('apps.accounts.tasks.send_publish_notification_chunk.delay'):
+            tasks.dispatch_publish_event(event.pk)
+        chunk = ContentPublishChunk.objects.get(event=event)
+
+        with mock.patch('apps.accounts.tasks.send_publish_chunk', side_effect=RuntimeError('smtp down')):
+            with self.assertRaises(RuntimeError):
+                tasks.send_publish_notification_chunk(chunk.pk)
+        chunk.refresh_from_db()
+        self.assertEqual(chunk.status, ContentPublishChunk.Status.PENDING)
+
+        tasks.send_publish_notification_chunk(chunk.pk)
+        self.assertEqual(
+            tasks.send_publish_notification_chunk(chunk.pk), f'Publish chunk {chunk.pk} already sent'
+        )
+        event.refresh_from_db()
+        self.assertEqual((event.status, event.sent_count), (ContentPublishEvent.Status.COMPLETED, 3))
+
+    def test_resolve_recipients(self):
+        """카테고리 구독자와 채널을 쿼리 한 번으로 조회"""
+        from .models import MailingPreference
+        from .recipients import EMAIL, KAKAO, resolve_recipients
+
+        kakao_user = User.objects.get(username='subscriber1')
+        kakao_user.social_provider = User.SocialProvider.KAKAO
+        kakao_user.kakao_message_token = 'token'
+        kakao_user.save()
+        kakao_user.mailing_preference.kakao_notification_enabled = True
+        kakao_user.mailing_preference.save()
+
+        with self.assertNumQueries(1):
+            recipients = resolve_recipients(self.category.pk, MailingPreference.Frequency.IMMEDIATE)
+
+        self.assertEqual(
+            [(User.objects.get(pk=r.user_id).username, r.channels) for r in recipients],
+            [
+                ('subscriber0', frozenset([EMAIL])),
+                ('subscriber1', frozenset([EMAIL, KAKAO])),
+                ('subscriber2', frozenset([EMAIL])),
+            ]
+        )
+        self.assertEqual(
+            resolve_recipients(self.category.pk, MailingPreference.Frequency.WEEKLY), []
+        )
+
+
+class RecordingEmailBackend:
+    """연결 수와 발송 결과를 기록하는 테스트용 이메일 백엔드"""
+
+    connections = 0
+    sent = []
+    # 수신자별로 남은 일시적 실패 횟수
+    failures = {}
+
+    def __init__(self, fail_silently=False, **kwargs):
+        self.connection = None
+
+    def open(self):
+        if self.connection is None:
+            self.connection = object()
+            RecordingEmailBackend.connections += 1
+            return True
+        return False
+
+    def close(self):
+        self.connection = None
+
+    def send_messages(self, messages):
+        import smtplib
+
+        for message in messages:
+            recipient = message.to[0]
+            if recipient.startswith('refused'):
+                raise smtplib.SMTPRecipientsRefused({recipient: (550, b'no such user')})
+            if self.failures.get(recipient):
+                self.failures[recipient] -= 1
+                raise smtplib.SMTPServerDisconnected('connection lost')
+            RecordingEmailBackend.sent.append(recipient)
+        return len(messages)
+
+
+class EmailDeliveryTest(TestCase):
+    """이메일 일괄 발송 테스트"""
+
+    def setUp(self):
+        RecordingEmailBackend.connections = 0
+        RecordingEmailBackend.sent = []
+        RecordingEmailBackend.failures = {}
+
+    def deliver(self, recipients, **settings):
+        from unittest import mock
+        from django.core.mail import EmailMessage
+        from django.test import override_settings
+        from .email_utils import deliver_messages
+
+        options = {
+            'EMAIL_BACKEND': 'apps.accounts.tests.RecordingEmailBackend',
+            'EMAIL_BATCH_SIZE': 2,
+            'EMAIL_SEND_CONCURRENCY': 1,
+            'EMAIL_SEND_RETRIES': 1,
+        }
+        options.update(settings)
+        with override_settings(**options), mock.patch('apps.accounts.email_utils.RETRY_BACKOFF', 0):
+            return deliver_messages(
+                EmailMessage(subject='test', body='body', to=[recipient])
+                for recipient in recipients
+            )
+
+    def test_batches_reuse_connection(self):
+        """배치마다 연결 하나를 재사용하고 입력 순서대로 결과 반환"""
+        recipients = [f'user{i}@example.com' for i in range(5)]
+        results = self.deliver(recipients)
+
+        self.assertEqual(RecordingEmailBackend.connections, 3)
+        self.assertEqual([result.recipient for result in results], recipients)
+        self.assertTrue(all(result.sent for result in results))
+
+        RecordingEmailBackend.sent = []
+        results = self.deliver(recipients, EMAIL_SEND_CONCURRENCY=3)
+        self.assertEqual([result.recipient for result in results], recipients)
+        self.assertCountEqual(RecordingEmailBackend.sent, recipients)
+
+    def test_per_recipient_results(self):
+        """일시적 오류는 재시도하고 영구 오류는 바로 실패로 기록"""
+        RecordingEmailBackend.failures = {'flaky@example.com': 1, 'down@example.com': 5}
+        results = self.deliver(['flaky@example.com', 'refused@example.com', 'down@example.com', 'ok@example.com'])
+
+        outcomes = {result.recipient: (result.sent, result.attempts) for result in results}
+        self.assertEqual(outcomes, {
+            'flaky@example.com': (True, 2),
+            'refused@example.com': (False, 1),
+            'down@example.com': (False, 2),
+            'ok@example.com': (True, 1),
+        })
+        self.assertEqual(RecordingEmailBackend.sent, ['flaky@example.com', 'ok@example.com'])
+
+
+class DigestPlanTest(TestCase):
+    """다이제스트 발송 계획 테스트"""
+
+    def setUp(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.contents.models import Category, Content
+        from .models import MailingPreference
+
+        self.period_end = timezone.now()
+        self.period_start = self.period_end - timedelta(days=7)
+
+        metadata = Category.objects.create(name='Metadata', slug='metadata')
+        python = Category.objects.create(name='Python', slug='python')
+        author = User.objects.create_user(username='author', password='testpass123')
+        for category, days in ((metadata, 1), (python, 2), (python, 30)):
+            Content.objects.create(
+                title=f'{category.name} {days}',
+                slug=f'{category.slug}-{days}',
+                summary='summary',
+                content_html='<p>content</p>',
+                category=category,
+                author=author,
+                status=Content.Status.PUBLISHED,
+                published_at=self.period_end - timedelta(days=days)
+            )
+
+        subscriptions = [None, [metadata], [metadata], [metadata, python], [python], []]
+        for i, categories in enumerate(subscriptions):
+            user = User.objects.create_user(
+                username=f'reader{i}',
+                email=f'reader{i}@example.com',
+                password='testpass123'
+            )
+            preference = MailingPreference.objects.create(
+                user=user,
+                enabled=True,
+                frequency=MailingPreference.Frequency.WEEKLY,
+                all_categories=categories is None
+            )
+            if categories:
+                preference.selected_categories.set(categories)
+
+    def test_plan_groups_by_subscription_set(self):
+        """구독 조합별로 한 번만 묶고 사용자 수와 무관한 쿼리 수로 계획"""
+        from .digests import plan_digests
+        from .models import MailingPreference
+
+        with self.assertNumQueries(3):
+            plan = [
+                (user.username, {name: [c.title for c in items] for name, items in contents.items()})
+                for user, contents in plan_digests(
+                    MailingPreference.Frequency.WEEKLY, self.period_start, self.period_end
+                )
+            ]
+
+        both = {'Metadata': ['Metadata 1'], 'Python': ['Python 2']}
+        self.assertEqual(plan, [
+            ('reader0', both),
+            ('reader1', {'Metadata': ['Metadata 1']}),
+            ('reader2', {'Metadata': ['Metadata 1']}),
+            ('reader3', both),
+            ('reader4', {'Python': ['Python 2']}),
+        ])
+
+    def test_send_digests(self):
+        """계획된 사용자에게만 다이제스트 발송"""
+        from django.core import mail
+        from .models import MailingPreference
+        from .tasks import send_digests
+
+        sent_count = send_digests(MailingPreference.Frequency.WEEKLY, self.period_start, self.period_end)
+
+        self.assertEqual(sent_count, 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(mail.outbox[1].to, ['reader1@example.com'])
+
+
+class KakaoMessageDeliveryTest(TestCase):
+    """카카오 메시지 일괄 발송 테스트 (로컬 스텁 서버 사용)"""
+
+    @classmethod
+    def setUpClass(cls):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        cls.requests = []
+        cls.failures = {}
+
+        class StubHandler(BaseHTTPRequestHandler):
+            # keep-alive 연결 재사용 확인
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers['Content-Length']))
+                token = self.headers['Authorization'].split()[-1]
+                cls.requests.append((token, self.client_address[1]))
+
+                headers = {}
+                body = b'{}'
+                if token == 'expired':
+                    status = 401
+                    body = b'{"msg": "this access token does not exist", "code": -401}'
+                elif token == 'broken':
+                    status = 400
+                    body = b'bad request'
+                elif token == 'throttled' and cls.failures.get(token):
+                    cls.failures[token] -= 1
+                    status = 429
+                    headers['Retry-After'] = '1'
+                elif cls.failures.get(token):
+                    cls.failures[token] -= 1
+                    status = 503
+                else:
+                    status = 200
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/send'
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        from apps.contents.models import Category, Content
+
+        self.requests.clear()
+        self.failures.clear()
+        category = Category.objects.create(name='Metadata', slug='metadata')
+        author = User.objects.create_user(username='author', password='testpass123')
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=category,
+            author=author,
+            status=Content.Status.PUBLISHED
+        )
+
+    def send(self, tokens):
+        from unittest import mock
+        from django.test import override_settings
+        from . import kakao_message_utils
+
+        users = [
+            User.objects.create_user(
+                username=f'kakao{i}',
+                password='testpass123',
+                social_provider=User.SocialProvider.KAKAO,
+                kakao_message_token=token
+            )
+            for i, token in enumerate(tokens)
+        ]
+        with override_settings(
+            KAKAO_MESSAGE_SEND_URL=self.url,
+            KAKAO_MESSAGE_CONCURRENCY=2,
+            KAKAO_MESSAGE_RETRIES=1
+        ), mock.patch.object(kakao_message_utils, 'RETRY_BACKOFF', 0), \
+                mock.patch.object(kakao_message_utils, '_session', None):
+            return users, kakao_message_utils.send_kakao_messages(users, self.content)
+
+    def test_concurrent_delivery_reuses_connections(self):
+        """동시 요청 수만큼의 연결을 재사용해 발송"""
+        users, results = self.send([f'token{i}' for i in range(8)])
+
+        self.assertEqual([result.user_id for result in results], [user.pk for user in users])
+        self.assertTrue(all(result.sent for result in results))
+        self.assertEqual(len(self.requests), 8)
+        self.assertLessEqual(len({port for _, port in self.requests}), 2)
+
+    def test_retry_and_invalidate_tokens(self):
+        """일시적 오류는 재시도하고 만료된 토큰은 한 번에 삭제"""
+        self.failures.update({'flaky': 1, 'down': 5})
+        users, results = self.send(['flaky', 'expired', 'down', None, 'ok'])
+
+        outcomes = {result.user_id: (result.sent, result.status_code) for result in results}
+        self.assertEqual(outcomes, {
+            users[0].pk: (True, 200),
+            users[1].pk: (False, 401),
+            users[2].pk: (False, 503),
+            users[4].pk: (True, 200),
+        })
+        # 401은 재시도하지 않음, 503은 재시도 1번
+        tokens = [token for token, _ in self.requests]
+        self.assertEqual(tokens.count('expired'), 1)
+        self.assertEqual(tokens.count('down'), 2)
+
+        self.assertEqual(
+            list(User.objects.filter(username__startswith='kakao', kakao_message_token__isnull=True)
+                 .order_by('username').values_list('username', flat=True)),
+            ['kakao1', 'kakao3']
+        )
+
+    def test_read_timeout_is_not_retried(self):
+        """요청을 보낸 뒤 응답을 못 받으면 중복 발송하지 않도록 재시도하지 않음"""
+        from unittest import mock
+        from urllib3.connectionpool import HTTPConnectionPool
+        from urllib3.exceptions import ReadTimeoutError
+
+        def timeout(pool, conn, method, url, **kwargs):
+            raise ReadTimeoutError(pool, url, 'read timed out')
+
+        with mock.patch.object(HTTPConnectionPool, '_make_request', autospec=True, side_effect=timeout) as post:
+            users, results = self.send(['slow'])
+
+        self.assertEqual(post.call_count, 1)
+        self.assertEqual([(result.sent, result.status_code) for result in results], [(False, None)])
+
+    def test_retry_after_is_capped(self):
+        """Retry-After가 길어도 RETRY_AFTER_MAX초까지만 대기"""
+        from unittest import mock
+        from . import kakao_message_utils
+
+        self.failures.update({'throttled': 1})
+        with mock.patch.object(kakao_message_utils, 'RETRY_AFTER_MAX', 0), \
+                mock.patch('urllib3.util.retry.time.sleep') as sleep:
+            users, results = self.send(['throttled'])
+
+        self.assertTrue(results[0].sent)
+        self.assertEqual([token for token, _ in self.requests], ['throttled', 'throttled'])
+        self.assertTrue(all(call.args[0] <= 0 for call in sleep.call_args_list))
+
+    def test_retry_after_and_error_messages(self):
+        """429는 Retry-After만큼 기다린 뒤 재시도하고, JSON이 아닌 오류 응답도 결과에 기록"""
+        import time
+
+        self.failures.update({'throttled': 1})
+        started = time.monotonic()
+        users, results = self.send(['throttled', 'expired', 'broken'])
+
+        self.assertGreaterEqual(time.monotonic() - started, 1)
+        self.assertEqual(
+            [(result.sent, result.status_code, result.error) for result in results],
+            [
+                (True, 200, None),
+                (False, 401, 'this access token does not exist'),
+                (False, 400, 'bad request'),
+            ]
+        )
+
+
+class AdminStatisticsTest(TestCase):
+    """관리자 통계 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        from apps.boards.models import Board, Post, PostReply
+        from apps.contents.models import Category, Content, Favorite
+
+        self.admin = User.objects.create_user(username='admin', password='testpass123', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        board = Board.objects.create(name='공지사항', board_type=Board.BoardType.NOTICE)
+        category = Category.objects.create(name='Metadata', slug='metadata')
+        contents = [
+            Content.objects.create(
+                title=f'Content {i}',
+                slug=f'content-{i}',
+                summary='summary',
+                content_html='<p>content</p>',
+                category=category,
+                author=self.admin,
+                status=Content.Status.PUBLISHED
+            )
+            for i in range(3)
+        ]
+
+        # (게시글, 삭제된 게시글, 답글, 즐겨찾기)
+        activity = [(2, 1, 1, 3), (0, 0, 0, 1), (1, 0, 0, 0), (0, 5, 0, 0)]
+        for i, (posts, deleted, replies, favorites) in enumerate(activity):
+            user = User.objects.create_user(
+                username=f'member{i}',
+                password='testpass123',
+                first_name='길동',
+                last_name='홍'
+            )
+            for j in range(posts + deleted):
+                post = Post.objects.create(
+                    board=board, author=user, title='post', content='content', is_deleted=j >= posts
+                )
+            for _ in range(replies):
+                PostReply.objects.create(post=post, author=user, content='reply')
+            for content in contents[:favorites]:
+                Favorite.objects.create(user=user, content=content)
+
+    def test_most_active_contributors(self):
+        """활동 점수 순 상위 회원 (삭제된 게시글 제외)"""
+        response = self.client.get('/api/accounts/statistics/')
+        self.assertEqual(response.status_code, 200)
+
+        contributors = response.data['user_statistics']['most_active_contributors']
+        self.assertEqual(
+            [(c['username'], c['post_count'], c['reply_count'], c['favorite_count'], c['activity_score'])
+             for c in contributors],
+            [('member0', 2, 1, 3, 6), ('member1', 0, 0, 1, 1), ('member2', 1, 0, 0, 1)]
+        )
+        self.assertEqual(contributors[0]['full_name'], '홍길동')
+        self.assertEqual(contributors[0]['organization'], '-')
+
+    def test_query_count_is_bounded(self):
+        """회원 수와 무관한 쿼리 수로 계산"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .statistics import build_statistics
+
+        with CaptureQueriesContext(connection) as before:
+            build_statistics()
+        User.objects.bulk_create([User(username=f'extra{i}') for i in range(20)])
+        with CaptureQueriesContext(connection) as after:
+            build_statistics()
+        self.assertEqual(len(before), len(after))
+
+    def test_monthly_registrations(self):
+        """달력 기준 최근 12개월 월별 등록 건수 (일별 통계 합계)"""
+        from django.utils import timezone
+
+        from apps.analytics.rollups import refresh_daily_statistics
+
+        now = timezone.localtime()
+        last_year = now.replace(year=now.year - 1, day=15)
+        User.objects.filter(username='member3').update(created_at=last_year)
+        refresh_daily_statistics(last_year.date())
+
+        response = self.client.get('/api/accounts/statistics/')
+        monthly = response.data['user_statistics']['monthly_registrations']
+
+        self.assertEqual(len(monthly), 12)
+        self.assertEqual(monthly[-1], {'month': now.strftime('%Y-%m'), 'count': 4})
+        self.assertEqual(sum(item['count'] for item in monthly), 4)
+
+    def test_recent_new_users_use_local_month(self):
+        """이번 달 신규 회원은 UTC가 아닌 현지 시간 기준 월 시작부터"""
+        from datetime import datetime, timezone as dt_timezone
+        from unittest import mock
+        from .statistics import build_statistics
+
+        # 2026-11-01 01:00 KST (UTC로는 아직 10월)
+        now = datetime(2026, 10, 31, 16, 0, tzinfo=dt_timezone.utc)
+        User.objects.update(created_at=datetime(2026, 10, 1, tzinfo=dt_timezone.utc))
+        User.objects.filter(username='member0').update(
+            created_at=datetime(2026, 10, 31, 15, 30, tzinfo=dt_timezone.utc)  # 11-01 00:30 KST
+        )
+        User.objects.filter(username='member1').update(
+            created_at=datetime(2026, 10, 31, 14, 0, tzinfo=dt_timezone.utc)  # 10-31 23:00 KST
+        )
+
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            statistics = build_statistics()
+
+        self.assertEqual(
+            [user['username'] for user in statistics['user_statistics']['recent_new_users']],
+            ['member0']
+        )
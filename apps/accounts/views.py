@@ -3,6 +3,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import update_session_auth_hash
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.views import TokenObtainPairView
+from apps.analytics.activity import record_event
+from apps.analytics.models import ActivityEvent
 from .models import User, MailingPreference
 from .serializers import (
     UserSerializer,
@@ -155,3 +159,18 @@ class MailingPreferenceViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
+
+
+class LoginView(TokenObtainPairView):
+    """아이디/비밀번호 로그인 (JWT 발급, 로그인 활동 이벤트 기록)"""
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+
+        record_event(ActivityEvent.EventType.LOGIN, serializer.user, provider='password')
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
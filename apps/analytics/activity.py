@@ -0,0 +1,210 @@
+"""
+활동 이벤트 기록
+
+record_event()는 DB에 쓰지 않고 워커(프로세스)별 메모리 버퍼에 이벤트를 추가한다.
+버퍼는 프로세스마다 하나씩 뜨는 백그라운드 스레드가 ACTIVITY_FLUSH_INTERVAL초마다
+(ACTIVITY_BATCH_SIZE개가 모이면 바로) bulk_create로 저장한다.
+요청을 처리하는 스레드는 DB에 쓰지 않으며, 요청이 없는 워커의 이벤트도 제때 저장된다.
+프로세스 종료 시에는 DB를 사용할 수 있을 때만 남은 이벤트를 저장한다.
+(ACTIVITY_BACKGROUND_FLUSH=False면 스레드를 띄우지 않음 - 테스트 러너에서 사용)
+
+이벤트는 분석용이므로 저장에 실패하면 로그만 남기고 버린다.
+(버퍼가 ACTIVITY_BUFFER_LIMIT개를 넘으면 가장 오래된 이벤트부터 버림)
+
+오래된 이벤트는 prune_events()가 pk 범위 단위로 나눠 삭제한다.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from .models import ActivityEvent
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 삭제하는 이벤트 수
+PRUNE_BATCH_SIZE = 10000
+
+_buffer = []
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+_wakeup = threading.Event()
+_flusher = None
+_flusher_pid = None
+
+
+def record_event(event_type, user=None, object_id=None, **data):
+    """
+    활동 이벤트 기록 (DB 쓰기 없음)
+
+    Args:
+        event_type: ActivityEvent.EventType 값
+        user: 사용자 (익명 사용자나 None이면 비워 둠)
+        object_id: 대상 객체 ID (콘텐츠 등)
+        **data: 추가 정보 (JSON으로 저장)
+    """
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    event = ActivityEvent(
+        event_type=event_type,
+        user_id=user_id,
+        object_id=object_id,
+        data=data,
+        created_at=timezone.now()
+    )
+    with _lock:
+        _buffer.append(event)
+        overflow = len(_buffer) - settings.ACTIVITY_BUFFER_LIMIT
+        if overflow > 0:
+            del _buffer[:overflow]
+        is_full = len(_buffer) >= settings.ACTIVITY_BATCH_SIZE
+    if overflow > 0:
+        logger.warning(f"[ACTIVITY] 버퍼가 가득 차 이벤트 {overflow}개를 버렸습니다")
+
+    _start_flusher()
+    if is_full:
+        _wakeup.set()
+
+
+def _start_flusher():
+    """
+    백그라운드 저장 스레드 시작
+
+    fork된 워커에는 부모의 스레드가 없으므로 pid가 바뀌면 새로 띄운다.
+    """
+    global _flusher, _flusher_pid
+
+    if not settings.ACTIVITY_BACKGROUND_FLUSH:
+        return
+    pid = os.getpid()
+    with _lock:
+        if _flusher_pid == pid and _flusher.is_alive():
+            return
+        _flusher = threading.Thread(target=_run_flusher, name='activity-flusher', daemon=True)
+        _flusher_pid = pid
+    _flusher.start()
+
+
+def _run_flusher():
+    """저장 간격마다(버퍼가 차면 바로) 이벤트 저장"""
+    while True:
+        _flush_once()
+
+
+def _flush_once():
+    """저장 스레드의 한 주기: 간격만큼(버퍼가 차면 바로 깨어날 때까지) 기다린 뒤 저장"""
+    _wakeup.wait(settings.ACTIVITY_FLUSH_INTERVAL)
+    _wakeup.clear()
+    try:
+        flush_events()
+    finally:
+        # 이 스레드 전용 DB 연결은 다음 주기까지 쓰지 않으므로 닫음
+        connection.close()
+
+
+def discard_events():
+    """
+    저장되지 않은 이벤트 버림
+
+    Returns:
+        int: 버린 이벤트 수
+    """
+    with _lock:
+        count = len(_buffer)
+        del _buffer[:]
+    return count
+
+
+def pending_event_count():
+    """저장되지 않은 이벤트 수"""
+    with _lock:
+        return len(_buffer)
+
+
+def _take_events(force):
+    global _last_flush
+
+    with _lock:
+        is_due = (
+            force
+            or len(_buffer) >= settings.ACTIVITY_BATCH_SIZE
+            or time.monotonic() - _last_flush >= settings.ACTIVITY_FLUSH_INTERVAL
+        )
+        if not is_due or not _buffer:
+            return []
+        events = _buffer[:]
+        del _buffer[:]
+        _last_flush = time.monotonic()
+    return events
+
+
+def flush_events(force=True):
+    """
+    버퍼의 이벤트를 DB에 저장
+
+    Args:
+        force: False면 저장 조건(개수/간격)을 만족할 때만 저장
+
+    Returns:
+        int: 저장한 이벤트 수
+    """
+    events = _take_events(force)
+    if not events:
+        return 0
+
+    try:
+        ActivityEvent.objects.bulk_create(events, batch_size=settings.ACTIVITY_BATCH_SIZE)
+    except Exception as e:
+        logger.error(f"[ACTIVITY] 이벤트 {len(events)}개 저장 실패: {e}")
+        return 0
+    return len(events)
+
+
+def _flush_at_exit():
+    """프로세스 종료 시 남은 이벤트 저장 (DB를 사용할 수 없으면 버림)"""
+    if not pending_event_count():
+        return
+    try:
+        usable = ActivityEvent._meta.db_table in connection.introspection.table_names()
+    except Exception:
+        usable = False
+    if not usable:
+        logger.warning(f"[ACTIVITY] DB를 사용할 수 없어 이벤트 {discard_events()}개를 버렸습니다")
+        return
+    flush_events()
+
+
+atexit.register(_flush_at_exit)
+
+
+def prune_events(before):
+    """
+    before 이전에 발생한 이벤트 삭제
+
+    pk는 발생 순서대로 증가하므로 경계 pk를 한 번 찾은 뒤
+    pk 범위로 나눠 삭제한다. (긴 트랜잭션과 큰 잠금을 피함)
+
+    Returns:
+        int: 삭제한 이벤트 수
+    """
+    boundary = ActivityEvent.objects.filter(
+        created_at__gte=before
+    ).order_by('created_at').values_list('pk', flat=True).first()
+    if boundary is None:
+        boundary = (ActivityEvent.objects.order_by('-pk').values_list('pk', flat=True).first() or 0) + 1
+
+    first = ActivityEvent.objects.order_by('pk').values_list('pk', flat=True).first()
+    if first is None:
+        return 0
+
+    deleted = 0
+    for start in range(first, boundary, PRUNE_BATCH_SIZE):
+        count, _ = ActivityEvent.objects.filter(
+            pk__gte=start,
+            pk__lt=min(start + PRUNE_BATCH_SIZE, boundary),
+            created_at__lt=before
+        ).delete()
+        deleted += count
+    return deleted
@@ -0,0 +1,52 @@
+from django.contrib import admin
+from .models import ActivityEvent, ContentViewBucket, DailyStatistic, DailyContentStatistic
+
+
+@admin.register(DailyStatistic)
+class DailyStatisticAdmin(admin.ModelAdmin):
+    list_display = ['date', 'metric', 'value', 'updated_at']
+    list_filter = ['metric']
+    date_hierarchy = 'date'
+    readonly_fields = ['date', 'metric', 'value', 'updated_at']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(DailyContentStatistic)
+class DailyContentStatisticAdmin(admin.ModelAdmin):
+    list_display = ['date', 'content', 'view_count', 'favorite_count']
+    list_select_related = ['content']
+    search_fields = ['content__title']
+    date_hierarchy = 'date'
+    readonly_fields = ['date', 'content', 'view_count', 'favorite_count']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(ContentViewBucket)
+class ContentViewBucketAdmin(admin.ModelAdmin):
+    list_display = ['hour', 'content', 'view_count']
+    list_select_related = ['content']
+    search_fields = ['content__title']
+    date_hierarchy = 'hour'
+    readonly_fields = ['hour', 'content', 'view_count']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(ActivityEvent)
+class ActivityEventAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'event_type', 'user_id', 'object_id', 'data']
+    list_filter = ['event_type']
+    search_fields = ['=user__username']
+    date_hierarchy = 'created_at'
+    readonly_fields = ['event_type', 'user', 'object_id', 'data', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
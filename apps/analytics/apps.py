@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class AnalyticsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.analytics'
+    verbose_name = '통계'
+
+    def ready(self):
+        """앱이 준비되면 시그널 등록"""
+        import apps.analytics.signals
@@ -0,0 +1,26 @@
+"""
+활동 이벤트 정리 Management Command
+
+보관 기간이 지난 활동 이벤트를 pk 범위 단위로 나눠 삭제합니다.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.analytics.activity import prune_events
+
+
+class Command(BaseCommand):
+    help = '오래된 활동 이벤트 삭제'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.ACTIVITY_RETENTION_DAYS,
+            help='보관 기간 (일, 기본: ACTIVITY_RETENTION_DAYS)'
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_events(timezone.now() - timedelta(days=options['days']))
+        self.stdout.write(self.style.SUCCESS(f"✓ {options['days']}일이 지난 활동 이벤트 {deleted}개를 삭제했습니다."))
@@ -0,0 +1,43 @@
+"""
+일별 통계 재계산 Management Command
+
+원본 테이블에서 일별 통계(조회수 제외)를 다시 계산합니다.
+과거 데이터는 analytics 0004 마이그레이션이 한 번 채우며, 집계가 어긋났을 때 사용합니다.
+"""
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Min
+from django.utils import timezone
+from apps.analytics.rollups import refresh_daily_statistics
+
+# 한 번에 다시 계산하는 기간 (일)
+BATCH_DAYS = 30
+
+
+class Command(BaseCommand):
+    help = '일별 통계 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='최근 N일만 재계산 (기본: 첫 회원 가입일부터 전체)'
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        if options['days']:
+            start_date = today - timedelta(days=options['days'] - 1)
+        else:
+            first = get_user_model().objects.aggregate(first=Min('created_at'))['first']
+            start_date = timezone.localdate(first) if first else today
+
+        total = 0
+        batch_start = start_date
+        while batch_start <= today:
+            batch_end = min(batch_start + timedelta(days=BATCH_DAYS - 1), today)
+            total += refresh_daily_statistics(batch_start, batch_end)
+            batch_start = batch_end + timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS(f"✓ {start_date}부터 {total}일의 통계를 다시 계산했습니다."))
@@ -0,0 +1,16 @@
+"""
+인기 점수 재계산 Management Command
+
+보관 중인 시간별 조회수로 콘텐츠 인기 점수를 다시 계산합니다.
+TRENDING_HALF_LIFE_HOURS를 바꾼 뒤 실행합니다.
+"""
+from django.core.management.base import BaseCommand
+from apps.analytics.trending import rebuild_trending_scores
+
+
+class Command(BaseCommand):
+    help = '콘텐츠 인기 점수 재계산'
+
+    def handle(self, *args, **options):
+        count = rebuild_trending_scores()
+        self.stdout.write(self.style.SUCCESS(f"✓ {count}개 콘텐츠의 인기 점수를 다시 계산했습니다."))
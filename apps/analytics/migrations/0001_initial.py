@@ -0,0 +1,50 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contents', '0009_favorite_created_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('metric', models.CharField(choices=[('REGISTRATIONS', '회원 가입'), ('FAVORITES', '즐겨찾기'), ('POSTS', '게시글'), ('REPLIES', '답글'), ('VIEWS', '콘텐츠 조회')], max_length=20, verbose_name='지표')),
+                ('value', models.PositiveIntegerField(default=0, verbose_name='건수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='집계일')),
+            ],
+            options={
+                'verbose_name': '일별 통계',
+                'verbose_name_plural': '일별 통계 목록',
+                'db_table': 'daily_statistics',
+                'ordering': ['-date', 'metric'],
+                'unique_together': {('date', 'metric')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyContentStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('view_count', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('favorite_count', models.PositiveIntegerField(default=0, verbose_name='즐겨찾기 수')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_statistics', to='contents.content', verbose_name='콘텐츠')),
+            ],
+            options={
+                'verbose_name': '콘텐츠 일별 통계',
+                'verbose_name_plural': '콘텐츠 일별 통계 목록',
+                'db_table': 'daily_content_statistics',
+                'ordering': ['-date'],
+                'unique_together': {('date', 'content')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('LOGIN', '로그인'), ('CONTENT_VIEW', '콘텐츠 조회'), ('SEARCH', '검색'), ('FAVORITE', '즐겨찾기 등록'), ('UNFAVORITE', '즐겨찾기 해제')], max_length=20, verbose_name='이벤트')),
+                ('object_id', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='대상 ID')),
+                ('data', models.JSONField(blank=True, default=dict, verbose_name='추가 정보')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='발생일')),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '활동 이벤트',
+                'verbose_name_plural': '활동 이벤트 목록',
+                'db_table': 'activity_events',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='activity_ev_created_cc5c13_idx'), models.Index(fields=['event_type', 'created_at'], name='activity_ev_event_t_a0a379_idx'), models.Index(fields=['user', 'created_at'], name='activity_ev_user_id_8f5de0_idx')],
+            },
+        ),
+    ]
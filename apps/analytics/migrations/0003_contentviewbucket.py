@@ -0,0 +1,32 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0010_content_trending_score'),
+        ('analytics', '0002_activityevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentViewBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(verbose_name='시간')),
+                ('view_count', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_buckets', to='contents.content', verbose_name='콘텐츠')),
+            ],
+            options={
+                'verbose_name': '콘텐츠 시간별 조회수',
+                'verbose_name_plural': '콘텐츠 시간별 조회수 목록',
+                'db_table': 'content_view_buckets',
+                'ordering': ['-hour'],
+                'indexes': [models.Index(fields=['hour'], name='content_vie_hour_71d239_idx')],
+                'unique_together': {('content', 'hour')},
+            },
+        ),
+    ]
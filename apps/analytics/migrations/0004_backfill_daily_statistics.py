@@ -0,0 +1,57 @@
+# Generated by Django 4.2.18 on 2026-10-18 13:52
+
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+# 이 마이그레이션 시점의 지표별 원본 (apps.analytics.rollups가 바뀌어도 결과가 달라지지 않도록 복사)
+METRIC_SOURCES = [
+    ('REGISTRATIONS', 'accounts', 'User', {}),
+    ('FAVORITES', 'contents', 'Favorite', {}),
+    ('POSTS', 'boards', 'Post', {'is_deleted': False}),
+    ('REPLIES', 'boards', 'PostReply', {}),
+]
+
+
+def backfill_daily_statistics(apps, schema_editor):
+    """
+    기존 데이터의 일별 통계(조회수 제외) 채우기
+
+    정기 갱신은 최근 며칠만 다시 계산하므로 월별 회원 가입 등 과거 추이를 위해
+    전체 기간을 한 번 집계한다. (건수가 있는 날짜만 기록, 없는 날짜는 0으로 읽음)
+    """
+    DailyStatistic = apps.get_model('analytics', 'DailyStatistic')
+
+    rows = []
+    for metric, app_label, model_name, filters in METRIC_SOURCES:
+        model = apps.get_model(app_label, model_name)
+        counts = model.objects.filter(**filters).annotate(
+            day=TruncDate('created_at')
+        ).order_by().values('day').annotate(count=Count('pk')).values_list('day', 'count')
+        rows.extend(
+            DailyStatistic(date=day, metric=metric, value=count)
+            for day, count in counts
+        )
+
+    DailyStatistic.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['date', 'metric'],
+        update_fields=['value', 'updated_at'],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_contentviewbucket'),
+        ('accounts', '0005_user_created_at_index'),
+        ('boards', '0002_created_at_indexes'),
+        ('contents', '0009_favorite_created_at_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_daily_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,174 @@
+from django.db import models
+from django.utils import timezone
+
+
+class DailyStatistic(models.Model):
+    """일별 사이트 통계 (지표별 건수)"""
+
+    class Metric(models.TextChoices):
+        REGISTRATIONS = 'REGISTRATIONS', '회원 가입'
+        FAVORITES = 'FAVORITES', '즐겨찾기'
+        POSTS = 'POSTS', '게시글'
+        REPLIES = 'REPLIES', '답글'
+        VIEWS = 'VIEWS', '콘텐츠 조회'
+
+    date = models.DateField(
+        verbose_name='날짜'
+    )
+
+    metric = models.CharField(
+        max_length=20,
+        choices=Metric.choices,
+        verbose_name='지표'
+    )
+
+    value = models.PositiveIntegerField(
+        default=0,
+        verbose_name='건수'
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='집계일'
+    )
+
+    class Meta:
+        db_table = 'daily_statistics'
+        verbose_name = '일별 통계'
+        verbose_name_plural = '일별 통계 목록'
+        ordering = ['-date', 'metric']
+        unique_together = ['date', 'metric']
+
+    def __str__(self):
+        return f"{self.date} {self.get_metric_display()}: {self.value}"
+
+
+class DailyContentStatistic(models.Model):
+    """콘텐츠별 일별 통계"""
+
+    date = models.DateField(
+        verbose_name='날짜'
+    )
+
+    content = models.ForeignKey(
+        'contents.Content',
+        on_delete=models.CASCADE,
+        related_name='daily_statistics',
+        verbose_name='콘텐츠'
+    )
+
+    view_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='조회수'
+    )
+
+    favorite_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='즐겨찾기 수'
+    )
+
+    class Meta:
+        db_table = 'daily_content_statistics'
+        verbose_name = '콘텐츠 일별 통계'
+        verbose_name_plural = '콘텐츠 일별 통계 목록'
+        ordering = ['-date']
+        unique_together = ['date', 'content']
+
+    def __str__(self):
+        return f"{self.date} {self.content_id}"
+
+
+class ContentViewBucket(models.Model):
+    """콘텐츠별 시간 단위 조회수"""
+
+    hour = models.DateTimeField(
+        verbose_name='시간'
+    )
+
+    content = models.ForeignKey(
+        'contents.Content',
+        on_delete=models.CASCADE,
+        related_name='view_buckets',
+        verbose_name='콘텐츠'
+    )
+
+    view_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='조회수'
+    )
+
+    class Meta:
+        db_table = 'content_view_buckets'
+        verbose_name = '콘텐츠 시간별 조회수'
+        verbose_name_plural = '콘텐츠 시간별 조회수 목록'
+        ordering = ['-hour']
+        unique_together = ['content', 'hour']
+        indexes = [
+            models.Index(fields=['hour']),
+        ]
+
+    def __str__(self):
+        return f"{self.hour:%Y-%m-%d %H}시 {self.content_id}: {self.view_count}"
+
+
+class ActivityEvent(models.Model):
+    """
+    사용자 활동 이벤트 (추가만 하는 로그)
+
+    activity.record_event()로 기록하며, 워커별 메모리 버퍼에 모았다가 일괄 저장한다.
+    사용자 삭제와 무관하게 보관하도록 외래 키 제약은 두지 않는다.
+    """
+
+    class EventType(models.TextChoices):
+        LOGIN = 'LOGIN', '로그인'
+        CONTENT_VIEW = 'CONTENT_VIEW', '콘텐츠 조회'
+        SEARCH = 'SEARCH', '검색'
+        FAVORITE = 'FAVORITE', '즐겨찾기 등록'
+        UNFAVORITE = 'UNFAVORITE', '즐겨찾기 해제'
+
+    event_type = models.CharField(
+        max_length=20,
+        choices=EventType.choices,
+        verbose_name='이벤트'
+    )
+
+    user = models.ForeignKey(
+        'accounts.User',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='사용자'
+    )
+
+    object_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='대상 ID'
+    )
+
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='추가 정보'
+    )
+
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='발생일'
+    )
+
+    class Meta:
+        db_table = 'activity_events'
+        verbose_name = '활동 이벤트'
+        verbose_name_plural = '활동 이벤트 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['event_type', 'created_at']),
+            models.Index(fields=['user', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M} {self.get_event_type_display()} {self.user_id}"
@@ -0,0 +1,170 @@
+"""
+일별 통계 집계
+
+- 회원 가입, 즐겨찾기, 게시글, 답글: refresh_daily_statistics()가 최근 며칠을
+  원본 테이블(created_at 인덱스 범위)에서 다시 계산해 덮어쓴다. (삭제도 반영됨)
+- 조회수: 조회수 write-behind 카운터가 DB에 반영될 때(view_counts_flushed)
+  반영한 증가분을 그날의 집계, 그 시간의 시간별 조회수, 인기 점수에 더한다.
+
+대시보드는 원본 테이블 대신 이 집계 테이블을 읽는다.
+"""
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from .models import ContentViewBucket, DailyStatistic, DailyContentStatistic
+
+
+def _metric_sources():
+    """지표별 원본 queryset (생성일 기준 집계)"""
+    from apps.boards.models import Post, PostReply
+    from apps.contents.models import Favorite
+
+    return {
+        DailyStatistic.Metric.REGISTRATIONS: get_user_model().objects.all(),
+        DailyStatistic.Metric.FAVORITES: Favorite.objects.all(),
+        DailyStatistic.Metric.POSTS: Post.objects.filter(is_deleted=False),
+        DailyStatistic.Metric.REPLIES: PostReply.objects.all(),
+    }
+
+
+def _date_range(start_date, end_date):
+    return [start_date + timedelta(days=n) for n in range((end_date - start_date).days + 1)]
+
+
+def refresh_daily_statistics(start_date, end_date=None):
+    """
+    기간 내 일별 통계를 원본 테이블에서 다시 계산 (조회수 제외)
+
+    Args:
+        start_date: 시작일 (date)
+        end_date: 종료일 (date, 포함, 없으면 오늘)
+
+    Returns:
+        int: 집계한 날짜 수
+    """
+    from apps.contents.models import Favorite
+
+    end_date = end_date or timezone.localdate()
+    dates = _date_range(start_date, end_date)
+    period = {
+        'created_at__gte': timezone.make_aware(datetime.combine(start_date, time.min)),
+        'created_at__lt': timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min)),
+    }
+
+    rows = []
+    for metric, queryset in _metric_sources().items():
+        counts = dict(
+            queryset.filter(**period).annotate(
+                day=TruncDate('created_at')
+            ).order_by().values('day').annotate(count=Count('pk')).values_list('day', 'count')
+        )
+        rows.extend(
+            DailyStatistic(date=date, metric=metric, value=counts.get(date, 0))
+            for date in dates
+        )
+
+    favorites_by_content = Favorite.objects.filter(**period).annotate(
+        day=TruncDate('created_at')
+    ).order_by().values('day', 'content_id').annotate(count=Count('pk')).values_list(
+        'day', 'content_id', 'count'
+    )
+
+    with transaction.atomic():
+        DailyStatistic.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['date', 'metric'],
+            update_fields=['value', 'updated_at']
+        )
+        # 즐겨찾기가 모두 취소된 콘텐츠도 0으로 반영되도록 먼저 초기화
+        DailyContentStatistic.objects.filter(
+            date__gte=start_date, date__lte=end_date
+        ).update(favorite_count=0)
+        DailyContentStatistic.objects.bulk_create(
+            [
+                DailyContentStatistic(date=day, content_id=content_id, favorite_count=count)
+                for day, content_id, count in favorites_by_content
+            ],
+            update_conflicts=True,
+            unique_fields=['date', 'content'],
+            update_fields=['favorite_count'],
+            batch_size=500
+        )
+
+    return len(dates)
+
+
+def refresh_recent_statistics():
+    """최근 STATISTICS_ROLLUP_DAYS일(오늘 포함) 통계 갱신"""
+    today = timezone.localdate()
+    return refresh_daily_statistics(
+        today - timedelta(days=max(settings.STATISTICS_ROLLUP_DAYS, 1) - 1), today
+    )
+
+
+def _add_view_counts(model, pks_by_delta, **lookup):
+    """(lookup, content) 행을 만들어 두고 증가분별로 묶어 view_count 증가"""
+    model.objects.bulk_create(
+        [model(content_id=pk, **lookup) for pks in pks_by_delta.values() for pk in pks],
+        ignore_conflicts=True
+    )
+    for delta, pks in pks_by_delta.items():
+        model.objects.filter(content_id__in=pks, **lookup).update(
+            view_count=F('view_count') + delta
+        )
+
+
+def record_content_views(deltas):
+    """
+    DB에 반영된 콘텐츠 조회수 증가분을 오늘 통계, 시간별 조회수, 인기 점수에 더함
+
+    Args:
+        deltas: {content_pk: 증가분}
+    """
+    from apps.contents.models import Content
+    from .trending import update_trending_scores
+
+    now = timezone.now()
+    today = timezone.localdate(now)
+    hour = now.replace(minute=0, second=0, microsecond=0)
+
+    # 그 사이 삭제된 콘텐츠 제외
+    content_ids = set(Content.objects.filter(pk__in=list(deltas)).values_list('pk', flat=True))
+    deltas = {pk: delta for pk, delta in deltas.items() if pk in content_ids}
+    if not deltas:
+        return
+
+    pks_by_delta = defaultdict(list)
+    for pk, delta in deltas.items():
+        pks_by_delta[delta].append(pk)
+
+    with transaction.atomic():
+        _add_view_counts(DailyContentStatistic, pks_by_delta, date=today)
+        _add_view_counts(ContentViewBucket, pks_by_delta, hour=hour)
+
+        DailyStatistic.objects.bulk_create(
+            [DailyStatistic(date=today, metric=DailyStatistic.Metric.VIEWS)],
+            ignore_conflicts=True
+        )
+        DailyStatistic.objects.filter(date=today, metric=DailyStatistic.Metric.VIEWS).update(
+            value=F('value') + sum(deltas.values()),
+            updated_at=now
+        )
+
+        update_trending_scores(deltas, now)
+
+
+def prune_view_buckets(before):
+    """
+    before 이전의 시간별 조회수 삭제
+
+    Returns:
+        int: 삭제한 행 수
+    """
+    deleted, _ = ContentViewBucket.objects.filter(hour__lt=before).delete()
+    return deleted
@@ -0,0 +1,15 @@
+"""
+통계 시그널
+"""
+from django.dispatch import receiver
+from apps.common.view_counter import view_counts_flushed
+from apps.contents.models import Content
+from .rollups import record_content_views
+
+
+@receiver(view_counts_flushed, sender=Content)
+def record_daily_content_views(sender, pks, deltas=None, **kwargs):
+    """DB에 반영된 조회수를 일별 통계에 누적"""
+    if deltas:
+        record_content_views(deltas)
+
@@ -0,0 +1,48 @@
+"""
+Celery 태스크
+"""
+from datetime import timedelta
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from .activity import prune_events
+from .rollups import prune_view_buckets, refresh_recent_statistics
+
+
+@shared_task
+def refresh_daily_statistics():
+    """
+    최근 일별 통계를 원본 테이블에서 다시 계산
+    10분마다 실행되도록 스케줄링
+    """
+    days = refresh_recent_statistics()
+    return f"Refreshed daily statistics for {days} days"
+
+
+@shared_task
+def refresh_statistics_snapshot():
+    """관리자 통계 스냅샷 다시 생성 (오래된 스냅샷을 조회할 때 등록)"""
+    from apps.accounts.statistics import refresh_statistics_snapshot as refresh
+
+    refresh()
+    return "Refreshed statistics snapshot"
+
+
+@shared_task
+def prune_activity_events():
+    """
+    보관 기간(ACTIVITY_RETENTION_DAYS)이 지난 활동 이벤트 삭제
+    매일 새벽 4시에 실행되도록 스케줄링
+    """
+    deleted = prune_events(timezone.now() - timedelta(days=settings.ACTIVITY_RETENTION_DAYS))
+    return f"Pruned {deleted} activity events"
+
+
+@shared_task
+def prune_content_view_buckets():
+    """
+    보관 기간(VIEW_BUCKET_RETENTION_DAYS)이 지난 시간별 조회수 삭제
+    매일 새벽 4시 30분에 실행되도록 스케줄링
+    """
+    deleted = prune_view_buckets(timezone.now() - timedelta(days=settings.VIEW_BUCKET_RETENTION_DAYS))
+    return f"Pruned {deleted} view buckets"
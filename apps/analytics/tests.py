@@ -0,0 +1,351 @@
+from datetime import timedelta
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from apps.boards.models import Board, Post
+from apps.contents.models import Category, Content, Favorite
+from .models import DailyStatistic, DailyContentStatistic
+from .rollups import refresh_daily_statistics
+
+User = get_user_model()
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class DailyStatisticRollupTest(TestCase):
+    """일별 통계 집계 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+        self.today = timezone.localdate()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        category = Category.objects.create(name='Metadata', slug='metadata')
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test</p>',
+            category=category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def values(self, date):
+        return dict(DailyStatistic.objects.filter(date=date).values_list('metric', 'value'))
+
+    def test_refresh_from_source_tables(self):
+        """원본 테이블에서 일별 건수를 다시 계산 (삭제 반영)"""
+        board = Board.objects.create(name='공지사항', board_type=Board.BoardType.NOTICE)
+        Post.objects.create(board=board, author=self.user, title='post', content='content')
+        Post.objects.create(board=board, author=self.user, title='deleted', content='content', is_deleted=True)
+        favorite = Favorite.objects.create(user=self.user, content=self.content)
+
+        yesterday = self.today - timedelta(days=1)
+        other = User.objects.create_user(username='other', password='testpass123')
+        User.objects.filter(pk=other.pk).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+
+        self.assertEqual(refresh_daily_statistics(yesterday), 2)
+        self.assertEqual(self.values(self.today), {
+            'REGISTRATIONS': 1, 'FAVORITES': 1, 'POSTS': 1, 'REPLIES': 0,
+        })
+        self.assertEqual(self.values(yesterday)['REGISTRATIONS'], 1)
+        self.assertEqual(
+            DailyContentStatistic.objects.get(date=self.today, content=self.content).favorite_count, 1
+        )
+
+        favorite.delete()
+        refresh_daily_statistics(self.today)
+        self.assertEqual(self.values(self.today)['FAVORITES'], 0)
+        self.assertEqual(
+            DailyContentStatistic.objects.get(date=self.today, content=self.content).favorite_count, 0
+        )
+
+    def test_flushed_views_are_recorded(self):
+        """DB에 반영된 조회수를 오늘 통계에 누적"""
+        from apps.common.view_counter import flush_view_counts, record_view
+
+        for _ in range(3):
+            record_view(self.content)
+        flush_view_counts()
+        record_view(self.content)
+        flush_view_counts()
+
+        stat = DailyContentStatistic.objects.get(date=self.today, content=self.content)
+        self.assertEqual(stat.view_count, 4)
+        self.assertEqual(self.values(self.today)['VIEWS'], 4)
+
+        # 다시 계산해도 조회수는 유지
+        refresh_daily_statistics(self.today)
+        self.assertEqual(self.values(self.today)['VIEWS'], 4)
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class StatisticsSnapshotTest(TestCase):
+    """관리자 통계 스냅샷 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='testpass123', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_stale_snapshot_is_served_while_refreshing(self):
+        """오래된 스냅샷은 그대로 응답하고 갱신 작업을 한 번만 등록"""
+        from unittest import mock
+        from django.test import override_settings
+        from apps.accounts.statistics import SNAPSHOT_KEY
+
+        response = self.client.get('/api/accounts/statistics/')
+        self.assertEqual(response.data['user_statistics']['total_users'], 1)
+        User.objects.create_user(username='member', password='testpass123')
+
+        with mock.patch('apps.analytics.tasks.refresh_statistics_snapshot.delay') as delay:
+            # 새 스냅샷: DB를 조회하지 않음
+            with self.assertNumQueries(0):
+                response = self.client.get('/api/accounts/statistics/')
+            self.assertEqual(response.data['user_statistics']['total_users'], 1)
+            self.assertFalse(delay.called)
+
+            snapshot = cache.get(SNAPSHOT_KEY)
+            snapshot['built_at'] -= 10 ** 6
+            cache.set(SNAPSHOT_KEY, snapshot)
+            with override_settings(STATISTICS_SNAPSHOT_TTL=60):
+                response = self.client.get('/api/accounts/statistics/')
+                self.client.get('/api/accounts/statistics/')
+            self.assertEqual(response.data['user_statistics']['total_users'], 1)
+            delay.assert_called_once_with()
+
+        from .tasks import refresh_statistics_snapshot
+        refresh_statistics_snapshot()
+        response = self.client.get('/api/accounts/statistics/')
+        self.assertEqual(response.data['user_statistics']['total_users'], 2)
+
+
+class ActivityEventTest(TestCase):
+    """활동 이벤트 기록 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+        from .activity import discard_events
+
+        cache.clear()
+        discard_events()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        category = Category.objects.create(name='Metadata', slug='metadata')
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test</p>',
+            category=category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+        self.client = APIClient()
+
+    def test_events_are_buffered_then_bulk_inserted(self):
+        """요청 중에는 DB에 쓰지 않고 저장 조건을 만족하면 한 번에 저장"""
+        from django.test import override_settings
+        from .activity import flush_events, pending_event_count, record_event
+        from .models import ActivityEvent
+
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                record_event(ActivityEvent.EventType.SEARCH, self.user, query='dublin core')
+        self.assertEqual(pending_event_count(), 3)
+
+        # 개수/간격 조건을 만족하지 않으면 저장하지 않음
+        with override_settings(ACTIVITY_BATCH_SIZE=10, ACTIVITY_FLUSH_INTERVAL=3600):
+            self.assertEqual(flush_events(force=False), 0)
+
+        with override_settings(ACTIVITY_BATCH_SIZE=3), self.assertNumQueries(1):
+            self.assertEqual(flush_events(force=False), 3)
+        self.assertEqual(pending_event_count(), 0)
+        self.assertEqual(
+            list(ActivityEvent.objects.values_list('user_id', 'data')),
+            [(self.user.pk, {'query': 'dublin core'})] * 3
+        )
+
+    def test_background_flusher(self):
+        """요청 스레드 대신 프로세스당 하나인 백그라운드 스레드가 저장 (버퍼가 차면 바로 깨움)"""
+        import threading
+        from unittest import mock
+        from django.test import override_settings
+        from . import activity
+        from .models import ActivityEvent
+
+        stop = threading.Event()
+        with override_settings(ACTIVITY_BACKGROUND_FLUSH=True, ACTIVITY_BATCH_SIZE=2), \
+                mock.patch.object(activity, '_run_flusher', side_effect=stop.wait) as run, \
+                mock.patch.object(activity, '_wakeup') as wakeup:
+            try:
+                activity.record_event(ActivityEvent.EventType.SEARCH, self.user, query='a')
+                wakeup.set.assert_not_called()
+                activity.record_event(ActivityEvent.EventType.SEARCH, self.user, query='b')
+                wakeup.set.assert_called_once()
+                self.assertEqual(run.call_count, 1)
+            finally:
+                stop.set()
+                activity._flusher.join()
+
+    def test_api_emits_events(self):
+        """로그인, 검색, 조회, 즐겨찾기 이벤트 기록"""
+        from .activity import flush_events
+        from .models import ActivityEvent
+
+        response = self.client.post('/api/token/', {'username': 'testuser', 'password': 'testpass123'})
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+        self.client.get('/api/contents/contents/', {'search': 'Test'})
+        self.client.get(f'/api/contents/contents/{self.content.slug}/')
+        self.client.post(f'/api/contents/contents/{self.content.slug}/favorite/')
+        self.client.post(f'/api/contents/contents/{self.content.slug}/favorite/')
+        flush_events()
+
+        self.assertEqual(
+            list(ActivityEvent.objects.order_by('pk').values_list('event_type', 'user_id', 'object_id', 'data')),
+            [
+                ('LOGIN', self.user.pk, None, {'provider': 'password'}),
+                ('SEARCH', self.user.pk, None, {'query': 'Test'}),
+                ('CONTENT_VIEW', self.user.pk, self.content.pk, {}),
+                ('FAVORITE', self.user.pk, self.content.pk, {}),
+                ('UNFAVORITE', self.user.pk, self.content.pk, {}),
+            ]
+        )
+
+    def test_prune_events(self):
+        """보관 기간이 지난 이벤트만 pk 범위로 나눠 삭제"""
+        from unittest import mock
+        from .activity import prune_events
+        from .models import ActivityEvent
+
+        now = timezone.now()
+        ActivityEvent.objects.bulk_create([
+            ActivityEvent(event_type=ActivityEvent.EventType.LOGIN, created_at=now - timedelta(days=days))
+            for days in (400, 300, 200, 10, 1)
+        ])
+
+        with mock.patch('apps.analytics.activity.PRUNE_BATCH_SIZE', 2):
+            self.assertEqual(prune_events(now - timedelta(days=180)), 3)
+        self.assertEqual(ActivityEvent.objects.count(), 2)
+        self.assertEqual(prune_events(now - timedelta(days=180)), 0)
+
+
+class ActivityFlusherTest(TransactionTestCase):
+    """백그라운드 저장 스레드 실행 테스트 (별도 DB 연결로 저장하므로 트랜잭션 없이 실행)"""
+
+    def setUp(self):
+        from .activity import discard_events
+
+        discard_events()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+
+    def test_flusher_iteration_saves_events(self):
+        """버퍼가 차면 저장 스레드가 깨어나 이벤트를 저장하고 버퍼를 비움"""
+        import threading
+        from . import activity
+        from .models import ActivityEvent
+
+        with override_settings(ACTIVITY_BATCH_SIZE=2, ACTIVITY_FLUSH_INTERVAL=5):
+            activity.record_event(ActivityEvent.EventType.SEARCH, self.user, query='a')
+            activity.record_event(ActivityEvent.EventType.SEARCH, self.user, query='b')
+
+            flusher = threading.Thread(target=activity._flush_once)
+            flusher.start()
+            flusher.join(timeout=5)
+
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(activity.pending_event_count(), 0)
+        self.assertEqual(
+            sorted(ActivityEvent.objects.values_list('user_id', 'data__query')),
+            [(self.user.pk, 'a'), (self.user.pk, 'b')]
+        )
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class TrendingContentTest(TestCase):
+    """시간별 조회수와 인기 콘텐츠 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.category = Category.objects.create(name='Metadata', slug='metadata')
+        self.old, self.new = [
+            Content.objects.create(
+                title=f'Content {i}',
+                slug=f'content-{i}',
+                summary='Test summary',
+                content_html='<p>Test</p>',
+                category=self.category,
+                author=self.user,
+                status=Content.Status.PUBLISHED
+            )
+            for i in range(2)
+        ]
+
+    def test_flushed_views_fill_hourly_buckets(self):
+        """DB에 반영된 조회수를 시간별 조회수와 인기 점수에 누적"""
+        from apps.common.view_counter import flush_view_counts, record_view
+        from .models import ContentViewBucket
+        from .trending import decayed_score
+
+        for _ in range(3):
+            record_view(self.new)
+        flush_view_counts()
+        record_view(self.new)
+        flush_view_counts()
+
+        bucket = ContentViewBucket.objects.get(content=self.new)
+        self.assertEqual(bucket.hour, timezone.now().replace(minute=0, second=0, microsecond=0))
+        self.assertEqual(bucket.view_count, 4)
+
+        self.new.refresh_from_db()
+        self.assertAlmostEqual(decayed_score(self.new.trending_score), 4, places=2)
+
+    def test_scores_decay_over_time(self):
+        """오래전 조회수는 반감기마다 절반으로 감쇠하며, 증분 갱신과 재계산 결과가 같음"""
+        from django.test import override_settings
+        from .models import ContentViewBucket
+        from .trending import decayed_score, rebuild_trending_scores, update_trending_scores
+
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        with override_settings(TRENDING_HALF_LIFE_HOURS=24):
+            # 이틀 전 조회 10회, 지금 조회 3회
+            update_trending_scores({self.old.pk: 10}, hour - timedelta(hours=48, minutes=-30))
+            update_trending_scores({self.new.pk: 3}, hour + timedelta(minutes=30))
+            ContentViewBucket.objects.create(hour=hour - timedelta(hours=48), content=self.old, view_count=10)
+            ContentViewBucket.objects.create(hour=hour, content=self.new, view_count=3)
+
+            self.old.refresh_from_db()
+            now = hour + timedelta(minutes=30)
+            self.assertAlmostEqual(decayed_score(self.old.trending_score, now), 2.5, places=3)
+
+            scores = dict(Content.objects.values_list('pk', 'trending_score'))
+            self.assertEqual(rebuild_trending_scores(), 2)
+            for pk, score in Content.objects.values_list('pk', 'trending_score'):
+                self.assertAlmostEqual(score, scores[pk], places=6)
+
+            response = self.client.get('/api/contents/contents/trending/', {'limit': 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.data], [self.new.pk, self.old.pk])
+        self.assertEqual(response.data[0]['recent_views'], 3)
+        self.assertEqual(response.data[1]['recent_views'], 0)
+
+    def test_prune_view_buckets(self):
+        """보관 기간이 지난 시간별 조회수 삭제"""
+        from .models import ContentViewBucket
+        from .rollups import prune_view_buckets
+
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        ContentViewBucket.objects.create(hour=hour - timedelta(days=40), content=self.old, view_count=1)
+        ContentViewBucket.objects.create(hour=hour, content=self.old, view_count=1)
+
+        self.assertEqual(prune_view_buckets(hour - timedelta(days=30)), 1)
+        self.assertEqual(ContentViewBucket.objects.count(), 1)
@@ -0,0 +1,106 @@
+"""
+인기 콘텐츠 점수
+
+점수는 조회 시점마다 e^(-λ·경과 시간)으로 감쇠한 조회수의 합이다. (반감기 TRENDING_HALF_LIFE_HOURS)
+모든 콘텐츠의 점수는 같은 비율로 감쇠하므로 순위는 기준 시점(TRENDING_EPOCH)에서 본
+log(Σ 조회수 · e^(λ·(조회 시각 - 기준 시점)))으로 비교할 수 있다.
+
+Content.trending_score에는 이 로그 값을 저장하고, 조회수가 DB에 반영될 때마다
+새 조회수만 더해 갱신한다. (이력을 다시 읽지 않음)
+현재 시점의 점수는 decayed_score()로 계산한다.
+"""
+import math
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db.models import Sum
+from django.utils import timezone
+
+TRENDING_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _log_weight(at):
+    """기준 시점부터 at까지의 성장 지수 λ·(at - epoch)"""
+    decay_rate = math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+    return (at - TRENDING_EPOCH).total_seconds() * decay_rate
+
+
+def add_views(log_score, views, at):
+    """
+    로그 점수에 at 시점의 조회수 추가
+
+    Args:
+        log_score: 기존 로그 점수 (조회 이력이 없으면 None)
+        views: 추가할 조회수
+        at: 조회 시각
+    """
+    term = math.log(views) + _log_weight(at)
+    if log_score is None:
+        return term
+    high, low = max(log_score, term), min(log_score, term)
+    return high + math.log1p(math.exp(low - high))
+
+
+def decayed_score(log_score, now=None):
+    """현재 시점의 감쇠 조회수"""
+    if log_score is None:
+        return 0.0
+    return math.exp(log_score - _log_weight(now or timezone.now()))
+
+
+def update_trending_scores(deltas, at=None):
+    """
+    DB에 반영된 조회수 증가분을 콘텐츠 인기 점수에 더함
+
+    Args:
+        deltas: {content_pk: 증가분}
+        at: 조회 시각 (기본: 현재)
+    """
+    from apps.contents.models import Content
+
+    at = at or timezone.now()
+    contents = list(Content.objects.filter(pk__in=list(deltas)).only('pk', 'trending_score'))
+    for content in contents:
+        content.trending_score = add_views(content.trending_score, deltas[content.pk], at)
+    Content.objects.bulk_update(contents, ['trending_score'], batch_size=500)
+
+
+def rebuild_trending_scores():
+    """
+    보관 중인 시간별 조회수로 인기 점수를 다시 계산 (반감기 설정을 바꾼 경우 등)
+
+    Returns:
+        int: 점수를 계산한 콘텐츠 수
+    """
+    from apps.contents.models import Content
+    from .models import ContentViewBucket
+
+    scores = {}
+    buckets = ContentViewBucket.objects.order_by('content_id', 'hour').values_list(
+        'content_id', 'hour', 'view_count'
+    )
+    for content_id, hour, view_count in buckets.iterator(chunk_size=2000):
+        if view_count:
+            # 버킷의 조회는 해당 시간의 중간에 일어난 것으로 봄
+            scores[content_id] = add_views(
+                scores.get(content_id), view_count, hour + timedelta(minutes=30)
+            )
+
+    Content.objects.exclude(pk__in=list(scores)).update(trending_score=None)
+    contents = [Content(pk=pk, trending_score=score) for pk, score in scores.items()]
+    Content.objects.bulk_update(contents, ['trending_score'], batch_size=500)
+    return len(contents)
+
+
+def get_recent_views(content_ids, hours=24):
+    """최근 hours시간 동안의 콘텐츠별 조회수 (시간별 조회수 합계)"""
+    from .models import ContentViewBucket
+
+    since = timezone.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=hours - 1)
+    return dict(
+        ContentViewBucket.objects.filter(
+            content_id__in=content_ids,
+            hour__gte=since
+        ).values('content_id').annotate(
+            views=Sum('view_count')
+        ).values_list('content_id', 'views')
+    )
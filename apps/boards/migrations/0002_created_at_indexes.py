@@ -0,0 +1,21 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['created_at'], name='posts_created_060265_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postreply',
+            index=models.Index(fields=['created_at'], name='post_replie_created_b05048_idx'),
+        ),
+    ]
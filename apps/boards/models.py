@@ -119,6 +119,7 @@ class Post(models.Model):
         indexes = [
             models.Index(fields=['board', '-created_at']),
             models.Index(fields=['author', '-created_at']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -161,6 +162,9 @@ class PostReply(models.Model):
         verbose_name = '게시글 답글'
         verbose_name_plural = '게시글 답글 목록'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
 
     def __str__(self):
         return f"{self.post.title} - 답글"
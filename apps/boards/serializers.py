@@ -1,19 +1,18 @@
 from rest_framework import serializers
+from apps.common.fieldsets import SparseFieldsetSerializerMixin
 from .models import Board, Post, PostReply
 
 
-class BoardSerializer(serializers.ModelSerializer):
+class BoardSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """게시판 Serializer"""
 
-    posts_count = serializers.SerializerMethodField()
+    # BoardViewSet.get_queryset에서 annotate
+    posts_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
         fields = ['id', 'name', 'board_type', 'description', 'posts_count']
 
-    def get_posts_count(self, obj):
-        return obj.posts.filter(is_deleted=False).count()
-
 
 class PostReplySerializer(serializers.ModelSerializer):
     """게시글 답글 Serializer"""
@@ -29,13 +28,14 @@ class PostReplySerializer(serializers.ModelSerializer):
         return obj.author.first_name or obj.author.username
 
 
-class PostListSerializer(serializers.ModelSerializer):
+class PostListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """게시글 목록용 Serializer"""
 
     board_name = serializers.CharField(source='board.name', read_only=True)
     board_type = serializers.CharField(source='board.board_type', read_only=True)
     author_name = serializers.SerializerMethodField()
-    replies_count = serializers.SerializerMethodField()
+    # PostViewSet.get_queryset에서 annotate
+    replies_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Post
@@ -48,11 +48,8 @@ class PostListSerializer(serializers.ModelSerializer):
     def get_author_name(self, obj):
         return obj.author.first_name or obj.author.username
 
-    def get_replies_count(self, obj):
-        return obj.admin_replies.count()
-
 
-class PostDetailSerializer(serializers.ModelSerializer):
+class PostDetailSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """게시글 상세용 Serializer"""
 
     board_name = serializers.CharField(source='board.name', read_only=True)
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from .models import Board, Post, PostReply
 
@@ -41,3 +41,53 @@ class PostModelTest(TestCase):
         )
         self.assertEqual(reply.post, self.post)
         self.assertEqual(self.post.admin_replies.count(), 1)
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class BoardListQueryTest(TestCase):
+    """게시판/게시글 목록 쿼리 수 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.admin = User.objects.create_user(username='admin', password='testpass123', is_staff=True)
+        self.boards = [
+            Board.objects.create(name='공지사항', board_type=Board.BoardType.NOTICE),
+            Board.objects.create(name='Q&A', board_type=Board.BoardType.QNA),
+        ]
+        for i in range(4):
+            post = Post.objects.create(
+                board=self.boards[i % 2], author=self.user, title=f'post {i}', content='content'
+            )
+            for j in range(i):
+                PostReply.objects.create(post=post, author=self.admin, content=f'reply {j}')
+        Post.objects.create(
+            board=self.boards[0], author=self.user, title='deleted', content='content', is_deleted=True
+        )
+
+    def test_board_list_counts_posts_in_one_query(self):
+        """게시판 목록은 게시판 수와 무관하게 개수 + 목록 조회만 실행"""
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/boards/boards/')
+
+        counts = {item['id']: item['posts_count'] for item in response.data['results']}
+        self.assertEqual(counts, {self.boards[0].pk: 2, self.boards[1].pk: 2})
+
+    def test_post_list_counts_replies_without_loading_them(self):
+        """게시글 목록은 답글을 불러오지 않고 답글 수를 함께 조회"""
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/boards/posts/')
+
+        counts = {item['title']: item['replies_count'] for item in response.data['results']}
+        self.assertEqual(counts, {'post 0': 0, 'post 1': 1, 'post 2': 2, 'post 3': 3})
+
+    def test_post_detail_loads_replies(self):
+        """게시글 상세는 답글과 작성자를 함께 조회"""
+        post = Post.objects.get(title='post 3')
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/boards/posts/{post.pk}/')
+        self.assertEqual(len(response.data['admin_replies']), 3)
+        self.assertEqual(response.data['admin_replies'][0]['author_name'], 'admin')
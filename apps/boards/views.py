@@ -2,6 +2,11 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from django.db.models import Prefetch
+from apps.common.fieldsets import SparseFieldsetViewMixin
+from apps.common.pagination import PageNumberOrCursorPagination
+from apps.common.queries import count_subquery
+from apps.common.view_counter import record_view
 from .models import Board, Post, PostReply
 from .serializers import (
     BoardSerializer,
@@ -12,15 +17,20 @@ from .serializers import (
 )
 
 
-class BoardViewSet(viewsets.ReadOnlyModelViewSet):
+class BoardViewSet(SparseFieldsetViewMixin, viewsets.ReadOnlyModelViewSet):
     """게시판 ViewSet (읽기 전용)"""
 
-    queryset = Board.objects.filter(is_active=True)
     serializer_class = BoardSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        # 게시판마다 COUNT를 실행하지 않도록 게시글 수를 함께 조회
+        return Board.objects.filter(is_active=True).annotate(
+            posts_count=count_subquery(Post.objects.filter(is_deleted=False), 'board')
+        )
+
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     게시글 ViewSet
 
@@ -29,9 +39,14 @@ class PostViewSet(viewsets.ModelViewSet):
     - create: 게시글 작성 (회원만)
     - update: 게시글 수정 (본인 또는 관리자만)
     - destroy: 게시글 삭제 (본인 또는 관리자만, Soft Delete)
+
+    ?pagination=cursor 요청 시 커서 방식으로 조회 (상단 고정 게시글 먼저, 최신순)
     """
 
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = PageNumberOrCursorPagination
+    cursor_ordering = ('-is_pinned', '-created_at', '-id')
+    sparse_fieldset_always_load = ('created_at', 'is_pinned')
 
     def get_queryset(self):
         queryset = Post.objects.filter(is_deleted=False)
@@ -52,7 +67,17 @@ class PostViewSet(viewsets.ModelViewSet):
         if search:
             queryset = queryset.filter(title__icontains=search)
 
-        return queryset.select_related('board', 'author').prefetch_related('admin_replies')
+        queryset = queryset.select_related('board', 'author')
+        if self.action == 'list':
+            # 목록은 답글 본문 없이 답글 수만 조회
+            return queryset.annotate(
+                replies_count=count_subquery(PostReply.objects.all(), 'post')
+            )
+        if self.action == 'retrieve':
+            return queryset.prefetch_related(
+                Prefetch('admin_replies', queryset=PostReply.objects.select_related('author'))
+            )
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -64,8 +89,8 @@ class PostViewSet(viewsets.ModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """게시글 상세 조회 시 조회수 증가"""
         instance = self.get_object()
-        instance.view_count += 1
-        instance.save(update_fields=['view_count'])
+        # 조회수는 캐시에 기록하고 주기적으로 DB에 반영 (상세 조회는 DB 쓰기 없음)
+        instance.view_count += record_view(instance)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -0,0 +1,144 @@
+"""
+댓글 수 관리
+
+- Content.comment_count: 콘텐츠 스레드에 표시되는 댓글(답글 포함) 수
+- Comment.reply_count: 댓글의 표시되는 답글 수
+
+표시되는 댓글은 삭제/숨김되지 않은 댓글이며, 작성/삭제/숨김 시 댓글 상태 변경과
+같은 트랜잭션에서 F()로 증감한다. 상태는 조건부 UPDATE로 바꾸므로
+동시에 같은 요청이 들어와도 실제로 상태를 바꾼 요청만 증감한다.
+상위 댓글이 삭제/숨김되면 그 답글도 스레드에서 사라지므로 comment_count에서 함께 빠지고,
+복구되면 다시 더한다. (표시되는 댓글 중 상위 댓글이 없거나 표시되는 댓글만 셈)
+관리자 화면에서 직접 바꾸는 등으로 어긋난 값은 reconcile_comment_counts()로 보정한다.
+"""
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from apps.common.queries import count_subquery
+from apps.contents.models import Content
+from apps.contents.response_cache import content_detail_group, invalidate
+from .models import Comment
+
+
+def _adjust_counts(comment, delta):
+    """
+    댓글이 표시되거나(delta=1) 사라질 때(delta=-1) 콘텐츠 댓글 수와 상위 댓글의 답글 수 증감
+
+    댓글의 표시되는 답글도 함께 보이거나 사라지므로 콘텐츠 댓글 수는 1 + reply_count만큼 바꾸고,
+    상위 댓글이 표시되지 않으면 스레드에 나타나지 않으므로 바꾸지 않는다.
+    (상태를 바꾼 UPDATE가 댓글/상위 댓글 행을 잠근 뒤 읽으므로 동시 변경과 어긋나지 않음)
+    """
+    in_thread = True
+    if comment.parent_id is not None:
+        Comment.objects.filter(pk=comment.parent_id).update(reply_count=F('reply_count') + delta)
+        in_thread = Comment.objects.filter(
+            pk=comment.parent_id, is_deleted=False, is_hidden=False
+        ).exists()
+    if not in_thread:
+        return
+
+    reply_count = Comment.objects.filter(pk=comment.pk).values_list('reply_count', flat=True).get()
+    Content.objects.filter(pk=comment.content_id).update(
+        comment_count=F('comment_count') + delta * (1 + reply_count)
+    )
+
+    # update()는 시그널을 보내지 않으므로 콘텐츠 목록('contents')과 상세 응답 캐시를 직접 무효화
+    slug = Content.objects.filter(pk=comment.content_id).values_list('slug', flat=True).first()
+    if slug is not None:
+        transaction.on_commit(lambda: invalidate('contents', content_detail_group(slug)))
+
+
+def create_comment(serializer):
+    """댓글 저장 후 댓글 수 증가"""
+    with transaction.atomic():
+        comment = serializer.save()
+        if not (comment.is_deleted or comment.is_hidden):
+            _adjust_counts(comment, 1)
+    return comment
+
+
+def delete_comment(comment):
+    """
+    댓글 삭제 (Soft Delete) 후 댓글 수 차감
+
+    Returns:
+        bool: 이번 요청으로 삭제되었으면 True
+    """
+    with transaction.atomic():
+        deleted = Comment.objects.filter(pk=comment.pk, is_deleted=False).update(
+            is_deleted=True, updated_at=timezone.now()
+        )
+        if deleted:
+            comment.is_deleted = True
+            hidden = Comment.objects.filter(pk=comment.pk).values_list('is_hidden', flat=True).get()
+            if not hidden:
+                _adjust_counts(comment, -1)
+    return bool(deleted)
+
+
+def toggle_hidden(comment):
+    """
+    댓글 숨김/복구 후 댓글 수 증감
+
+    Returns:
+        bool: 숨김 상태가 되었으면 True
+    """
+    with transaction.atomic():
+        hidden = not comment.is_hidden
+        changed = Comment.objects.filter(pk=comment.pk, is_hidden=comment.is_hidden).update(
+            is_hidden=hidden, updated_at=timezone.now()
+        )
+        if changed:
+            comment.is_hidden = hidden
+            deleted = Comment.objects.filter(pk=comment.pk).values_list('is_deleted', flat=True).get()
+            if not deleted:
+                _adjust_counts(comment, -1 if hidden else 1)
+    return comment.is_hidden
+
+
+def actual_comment_count():
+    """콘텐츠 스레드에 표시되는 댓글 수 서브쿼리 (상위 댓글이 없거나 표시되는 댓글만)"""
+    visible = Comment.objects.filter(is_deleted=False, is_hidden=False).filter(
+        Q(parent__isnull=True) | Q(parent__is_deleted=False, parent__is_hidden=False)
+    )
+    return count_subquery(visible, 'content')
+
+
+def actual_reply_count():
+    """댓글의 표시되는 답글 수 서브쿼리"""
+    return count_subquery(Comment.objects.filter(is_deleted=False, is_hidden=False), 'parent')
+
+
+def reconcile_comment_counts(dry_run=False):
+    """
+    comment_count, reply_count가 실제 댓글 수와 다른 콘텐츠/댓글을 찾아 보정
+
+    Returns:
+        tuple: (보정 대상 콘텐츠 목록, 보정 대상 댓글 수)
+    """
+    drifted_contents = list(
+        Content.objects.annotate(
+            actual=actual_comment_count()
+        ).exclude(
+            comment_count=F('actual')
+        ).values('pk', 'slug', 'comment_count', 'actual')
+    )
+    drifted_comments = Comment.objects.annotate(
+        actual=actual_reply_count()
+    ).exclude(reply_count=F('actual'))
+
+    drifted_comment_count = drifted_comments.count()
+    if not dry_run:
+        # 조회 이후의 변경도 반영되도록 갱신 시점에 다시 계산
+        if drifted_contents:
+            Content.objects.filter(
+                pk__in=[row['pk'] for row in drifted_contents]
+            ).update(comment_count=actual_comment_count())
+            # 목록에도 comment_count가 있으므로 목록과 상세 응답 캐시를 함께 무효화
+            invalidate('contents', *[content_detail_group(row['slug']) for row in drifted_contents])
+        if drifted_comment_count:
+            Comment.objects.filter(
+                pk__in=drifted_comments.values('pk')
+            ).update(reply_count=actual_reply_count())
+
+    return drifted_contents, drifted_comment_count
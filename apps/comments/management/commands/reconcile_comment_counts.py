@@ -0,0 +1,35 @@
+"""
+댓글 수 보정 Management Command
+
+Content.comment_count, Comment.reply_count가 실제 댓글 수와 다른 경우 보정합니다.
+(관리자 화면에서 댓글을 숨김/삭제했거나 회원 탈퇴로 댓글이 삭제된 경우 등)
+"""
+from django.core.management.base import BaseCommand
+from apps.comments.comment_utils import reconcile_comment_counts
+
+
+class Command(BaseCommand):
+    help = '콘텐츠 댓글 수, 댓글 답글 수 보정'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='보정하지 않고 대상만 출력'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        drifted_contents, drifted_comment_count = reconcile_comment_counts(dry_run=dry_run)
+
+        for row in drifted_contents:
+            self.stdout.write(f"  - {row['slug']}: {row['comment_count']} → {row['actual']}")
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                f"보정 대상 콘텐츠 {len(drifted_contents)}개, 댓글 {drifted_comment_count}개 (dry-run)"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"✓ 콘텐츠 {len(drifted_contents)}개, 댓글 {drifted_comment_count}개의 댓글 수를 보정했습니다."
+            ))
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:15
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_comment_counts(apps, schema_editor):
+    """
+    기존 댓글로 Content.comment_count, Comment.reply_count 계산
+
+    comment_count는 스레드에 표시되는 댓글만 센다. (상위 댓글이 없거나 표시되는 댓글)
+    """
+    Comment = apps.get_model('comments', 'Comment')
+    Content = apps.get_model('contents', 'Content')
+
+    def visible_count(queryset, field):
+        counts = queryset.filter(
+            is_deleted=False,
+            is_hidden=False,
+            **{field: OuterRef('pk')}
+        ).order_by().values(field).annotate(count=Count('pk')).values('count')
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+    in_thread = Comment.objects.filter(
+        Q(parent__isnull=True) | Q(parent__is_deleted=False, parent__is_hidden=False)
+    )
+    Content.objects.update(comment_count=visible_count(in_thread, 'content'))
+    Comment.objects.update(reply_count=visible_count(Comment.objects.all(), 'parent'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0001_initial'),
+        ('contents', '0011_content_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='reply_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='답글 수'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['parent', 'created_at'], name='comments_parent__149355_idx'),
+        ),
+        migrations.RunPython(fill_comment_counts, migrations.RunPython.noop),
+    ]
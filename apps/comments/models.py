@@ -37,6 +37,12 @@ class Comment(models.Model):
         verbose_name='URL 링크'
     )
 
+    # 답글 작성/삭제/숨김 시 F()로 증감 (reconcile_comment_counts로 보정)
+    reply_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='답글 수'
+    )
+
     is_admin_reply = models.BooleanField(
         default=False,
         verbose_name='관리자 답글 여부'
@@ -70,12 +76,32 @@ class Comment(models.Model):
         indexes = [
             models.Index(fields=['content', '-created_at']),
             models.Index(fields=['author', '-created_at']),
+            models.Index(fields=['parent', 'created_at']),
         ]
 
     def __str__(self):
         return f"{self.author.username} - {self.text[:50]}"
 
+    # 저장과 별도로 갱신하는 카운터 (전체 저장 시 읽어 둔 이전 값으로 덮어쓰지 않음)
+    COUNTER_FIELDS = ('reply_count',)
+
+    def save(self, *args, **kwargs):
+        if (
+            not args and not self._state.adding
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.COUNTER_FIELDS
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def replies_count(self):
-        """답글 개수"""
+        """답글 개수 (reply_count와 달리 실제 답글 수를 조회)"""
         return self.replies.filter(is_deleted=False, is_hidden=False).count()
@@ -1,13 +1,25 @@
 from rest_framework import serializers
+from apps.common.fieldsets import SparseFieldsetSerializerMixin
 from .models import Comment
+from .threads import load_replies
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentThreadListSerializer(serializers.ListSerializer):
+    """목록 직렬화 전에 페이지 전체 최상위 댓글의 답글을 한 번에 조회"""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        load_replies(items)
+        return super().to_representation(items)
+
+
+class CommentSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """댓글 Serializer"""
 
     author_name = serializers.CharField(source='author.username', read_only=True)
-    replies_count = serializers.IntegerField(read_only=True)
+    replies_count = serializers.IntegerField(source='reply_count', read_only=True)
     replies = serializers.SerializerMethodField()
+    replies_cursor = serializers.SerializerMethodField()
     can_edit = serializers.SerializerMethodField()
     can_delete = serializers.SerializerMethodField()
 
@@ -16,18 +28,26 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'content', 'author', 'author_name', 'parent',
             'text', 'url_link', 'is_admin_reply', 'is_hidden', 'is_deleted',
-            'created_at', 'updated_at', 'replies_count', 'replies',
+            'created_at', 'updated_at', 'replies_count', 'replies', 'replies_cursor',
             'can_edit', 'can_delete'
         ]
         read_only_fields = ['author', 'is_admin_reply', 'created_at', 'updated_at']
+        list_serializer_class = CommentThreadListSerializer
 
     def get_replies(self, obj):
-        """답글 조회 (1depth만)"""
-        if obj.parent is None:  # 최상위 댓글만 답글 표시
-            replies = obj.replies.filter(is_deleted=False, is_hidden=False)
-            return CommentSerializer(replies, many=True, context=self.context).data
+        """답글 조회 (1depth만, 처음 REPLY_WINDOW개)"""
+        if obj.parent_id is None:  # 최상위 댓글만 답글 표시
+            load_replies([obj])  # 목록에서는 이미 불러와 있음
+            return CommentSerializer(obj.loaded_replies, many=True, context=self.context).data
         return []
 
+    def get_replies_cursor(self, obj):
+        """나머지 답글 조회 커서 (replies 액션의 ?cursor=, 더 없으면 None)"""
+        if obj.parent_id is None:
+            load_replies([obj])
+            return obj.replies_cursor
+        return None
+
     def get_can_edit(self, obj):
         """수정 권한 체크"""
         request = self.context.get('request')
@@ -1,7 +1,9 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from apps.contents.models import Category, Content
+from .comment_utils import reconcile_comment_counts
 from .models import Comment
+from .threads import REPLY_WINDOW
 
 User = get_user_model()
 
@@ -51,3 +53,233 @@ class CommentModelTest(TestCase):
         )
         self.assertEqual(reply.parent, self.comment)
         self.assertEqual(self.comment.replies_count, 1)
+
+
+class CommentThreadTest(TestCase):
+    """댓글 스레드 조회 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        category = Category.objects.create(name='Test Category', slug='test-category')
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test</p>',
+            category=category,
+            author=self.user
+        )
+
+        self.roots = []
+        for i in range(5):
+            root = Comment.objects.create(content=self.content, author=self.user, text=f'comment {i}')
+            for j in range(i):
+                Comment.objects.create(
+                    content=self.content, author=self.user, parent=root, text=f'reply {i}-{j}'
+                )
+            self.roots.append(root)
+
+        # 숨김/삭제된 답글은 목록과 개수에서 제외
+        Comment.objects.create(
+            content=self.content, author=self.user, parent=self.roots[0], text='hidden', is_hidden=True
+        )
+        Comment.objects.create(
+            content=self.content, author=self.user, parent=self.roots[0], text='deleted', is_deleted=True
+        )
+
+        # 카운터를 거치지 않고 만든 댓글의 댓글 수 계산
+        reconcile_comment_counts()
+
+    def test_thread_loaded_in_constant_queries(self):
+        """댓글 수와 무관하게 개수 + 최상위 댓글 + 답글 조회만 실행 (답글은 처음 REPLY_WINDOW개)"""
+        url = f'/api/comments/?content_id={self.content.pk}'
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        results = response.data['results']
+        self.assertEqual(len(results), 5)
+        counts = {item['id']: (item['replies_count'], len(item['replies'])) for item in results}
+        self.assertEqual(
+            counts, {root.pk: (i, min(i, REPLY_WINDOW)) for i, root in enumerate(self.roots)}
+        )
+        self.assertEqual(results[0]['replies'][0]['replies_count'], 0)
+
+        longest = next(item for item in results if item['id'] == self.roots[4].pk)
+        self.assertEqual(
+            [reply['text'] for reply in longest['replies']], ['reply 4-0', 'reply 4-1', 'reply 4-2']
+        )
+        self.assertEqual(longest['replies_cursor'], longest['replies'][-1]['id'])
+        self.assertIsNone(next(item for item in results if item['id'] == self.roots[2].pk)['replies_cursor'])
+
+    def test_reply_pages(self):
+        """커서로 나머지 답글을 작성순으로 이어서 조회"""
+        root = self.roots[4]
+        url = f'/api/comments/{root.pk}/replies/'
+
+        response = self.client.get(url, {'limit': 2})
+        self.assertEqual([reply['text'] for reply in response.data['results']], ['reply 4-0', 'reply 4-1'])
+
+        response = self.client.get(url, {'limit': 2, 'cursor': response.data['next_cursor']})
+        self.assertEqual([reply['text'] for reply in response.data['results']], ['reply 4-2', 'reply 4-3'])
+        self.assertIsNone(response.data['next_cursor'])
+
+        response = self.client.get(url, {'cursor': 'x'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_detail_loads_replies(self):
+        """상세 조회도 답글과 개수를 함께 응답"""
+        response = self.client.get(f'/api/comments/{self.roots[3].pk}/')
+        self.assertEqual(response.data['replies_count'], 3)
+        self.assertEqual(
+            [reply['text'] for reply in response.data['replies']],
+            ['reply 3-0', 'reply 3-1', 'reply 3-2']
+        )
+
+
+class CommentCountTest(TestCase):
+    """댓글 수 카운터 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.admin = User.objects.create_user(username='admin', password='testpass123', is_staff=True)
+        category = Category.objects.create(name='Test Category', slug='test-category')
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test</p>',
+            category=category,
+            author=self.user
+        )
+        self.client = APIClient()
+
+    def counts(self, comment=None):
+        self.content.refresh_from_db()
+        if comment is None:
+            return self.content.comment_count
+        comment.refresh_from_db()
+        return self.content.comment_count, comment.reply_count
+
+    def test_counts_follow_create_delete_hide(self):
+        """작성/삭제/숨김 시 콘텐츠 댓글 수와 답글 수 증감"""
+        self.client.force_authenticate(self.user)
+        self.client.post('/api/comments/', {'content': self.content.pk, 'text': 'comment'})
+        root = Comment.objects.get(text='comment')
+        for i in range(2):
+            self.client.post(
+                '/api/comments/', {'content': self.content.pk, 'parent': root.pk, 'text': f'reply {i}'}
+            )
+        replies = list(root.replies.order_by('pk'))
+        self.assertEqual(self.counts(root), (3, 2))
+
+        # 본문 수정이 카운터를 덮어쓰지 않음
+        self.client.patch(f'/api/comments/{root.pk}/', {'text': 'edited'})
+        self.assertEqual(self.counts(root), (3, 2))
+
+        self.client.force_authenticate(self.admin)
+        self.client.post(f'/api/comments/{replies[0].pk}/hide/')
+        self.assertEqual(self.counts(root), (2, 1))
+
+        # 숨긴 댓글 삭제는 다시 차감하지 않음
+        self.client.delete(f'/api/comments/{replies[0].pk}/')
+        self.client.delete(f'/api/comments/{replies[1].pk}/')
+        self.assertEqual(self.counts(root), (1, 0))
+
+        response = self.client.get(f'/api/contents/contents/{self.content.slug}/')
+        self.assertEqual(response.data['comment_count'], 1)
+
+    def test_root_removal_hides_replies_from_count(self):
+        """상위 댓글을 삭제/숨기면 스레드에서 사라지는 답글도 콘텐츠 댓글 수에서 빠짐"""
+        self.client.force_authenticate(self.user)
+        self.client.post('/api/comments/', {'content': self.content.pk, 'text': 'root'})
+        root = Comment.objects.get(text='root')
+        for i in range(2):
+            self.client.post('/api/comments/', {'content': self.content.pk, 'parent': root.pk, 'text': f'reply {i}'})
+        self.assertEqual(self.counts(root), (3, 2))
+
+        self.client.force_authenticate(self.admin)
+        self.client.post(f'/api/comments/{root.pk}/hide/')
+        self.assertEqual(self.counts(root), (0, 2))
+
+        # 숨긴 상위 댓글의 답글은 스레드에 없으므로 콘텐츠 댓글 수는 그대로
+        reply = root.replies.order_by('pk').first()
+        self.client.delete(f'/api/comments/{reply.pk}/')
+        self.assertEqual(self.counts(root), (0, 1))
+
+        self.client.post(f'/api/comments/{root.pk}/hide/')
+        self.assertEqual(self.counts(root), (2, 1))
+
+        # 보정 기준도 같음
+        self.assertEqual(reconcile_comment_counts(dry_run=True), ([], 0))
+        self.client.delete(f'/api/comments/{root.pk}/')
+        self.assertEqual(self.counts(root), (0, 1))
+        self.assertEqual(reconcile_comment_counts(dry_run=True), ([], 0))
+
+    def test_list_etag_follows_comment_counts(self):
+        """다른 콘텐츠에서 댓글이 하나 늘고 하나 줄어도 목록 ETag가 바뀜"""
+        other = Content.objects.create(
+            title='Other Content',
+            slug='other-content',
+            summary='Other summary',
+            content_html='<p>Other</p>',
+            category=self.content.category,
+            author=self.user
+        )
+        Content.objects.filter(pk__in=[self.content.pk, other.pk]).update(status=Content.Status.PUBLISHED)
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/comments/', {'content': other.pk, 'text': 'old'})
+        old = Comment.objects.get(text='old')
+
+        url = '/api/contents/contents/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/comments/', {'content': self.content.pk, 'text': 'new'})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f'/api/comments/{old.pk}/')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_reconcile(self):
+        """reconcile_comment_counts가 어긋난 값을 보정"""
+        from io import StringIO
+        from django.core.management import call_command
+
+        root = Comment.objects.create(content=self.content, author=self.user, text='comment')
+        Comment.objects.create(content=self.content, author=self.user, parent=root, text='reply')
+        self.assertEqual(self.counts(root), (0, 0))
+
+        call_command('reconcile_comment_counts', stdout=StringIO())
+        self.assertEqual(self.counts(root), (2, 1))
+
+    @override_settings(CACHE_IS_SHARED=True)
+    def test_cached_list_follows_comment_count(self):
+        """캐시된 익명 목록 응답도 댓글 작성/보정 후 새 comment_count를 반환"""
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        Content.objects.filter(pk=self.content.pk).update(status=Content.Status.PUBLISHED)
+        anonymous = APIClient()
+
+        def listed_count():
+            response = anonymous.get('/api/contents/contents/')
+            return response.data['results'][0]['comment_count']
+
+        self.assertEqual(listed_count(), 0)
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/comments/', {'content': self.content.pk, 'text': 'comment'})
+        self.assertEqual(listed_count(), 1)
+
+        Comment.objects.create(content=self.content, author=self.user, text='direct')
+        self.assertEqual(listed_count(), 1)
+        reconcile_comment_counts()
+        self.assertEqual(listed_count(), 2)
@@ -0,0 +1,100 @@
+"""
+댓글 스레드 로딩
+
+최상위 댓글 한 페이지의 답글을 쿼리 한 번으로 조회해 메모리에서 2단계 트리로 묶는다.
+(최상위 댓글마다 답글을 따로 조회하지 않음)
+
+긴 스레드가 응답을 키우지 않도록 최상위 댓글마다 작성순으로 처음 REPLY_WINDOW개만
+(윈도 함수로 잘라) 불러오고, 더 있으면 마지막 답글 ID를 커서로 남긴다.
+나머지 답글은 커서로 get_reply_page()에서 REPLY_PAGE_SIZE개씩 이어서 조회한다.
+답글 수는 Comment.reply_count를 사용한다. (comment_utils 참고)
+"""
+from collections import defaultdict
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from .models import Comment
+
+# 목록에서 최상위 댓글마다 함께 응답하는 답글 수
+REPLY_WINDOW = 3
+
+# 답글 목록 한 페이지의 기본/최대 답글 수
+REPLY_PAGE_SIZE = 20
+MAX_REPLY_PAGE_SIZE = 100
+
+REPLY_ORDERING = ('created_at', 'pk')
+
+
+def visible_comments():
+    """삭제/숨김되지 않은 댓글"""
+    return Comment.objects.filter(is_deleted=False, is_hidden=False)
+
+
+def load_replies(comments):
+    """
+    최상위 댓글들의 처음 REPLY_WINDOW개 답글을 한 번에 조회해
+    loaded_replies, replies_cursor(다음 답글 커서, 없으면 None)에 저장
+
+    이미 답글을 불러온 댓글과 답글(parent가 있는 댓글)은 건너뛴다.
+
+    Args:
+        comments: 댓글 목록
+    """
+    roots = [
+        comment for comment in comments
+        if comment.parent_id is None and not hasattr(comment, 'loaded_replies')
+    ]
+    if not roots:
+        return
+
+    # 더 있는지 알 수 있도록 하나 더 조회
+    replies = visible_comments().filter(
+        parent_id__in=[root.pk for root in roots]
+    ).annotate(
+        position=Window(
+            RowNumber(),
+            partition_by=F('parent_id'),
+            order_by=[F(name).asc() for name in REPLY_ORDERING]
+        )
+    ).filter(
+        position__lte=REPLY_WINDOW + 1
+    ).select_related('author').order_by('parent_id', *REPLY_ORDERING)
+
+    replies_by_parent = defaultdict(list)
+    for reply in replies:
+        replies_by_parent[reply.parent_id].append(reply)
+
+    for root in roots:
+        root.loaded_replies, root.replies_cursor = _window(replies_by_parent.get(root.pk, []), REPLY_WINDOW)
+
+
+def _window(replies, size):
+    """(앞의 size개, 더 있으면 마지막 답글 ID)"""
+    if len(replies) > size:
+        replies = replies[:size]
+        return replies, replies[-1].pk
+    return replies, None
+
+
+def get_reply_page(parent, cursor=None, size=REPLY_PAGE_SIZE):
+    """
+    커서 다음의 답글 한 페이지 (작성순)
+
+    Args:
+        parent: 최상위 댓글
+        cursor: 이전 페이지의 마지막 답글 ID (None이면 처음부터)
+        size: 페이지 크기
+
+    Returns:
+        tuple: (답글 목록, 다음 커서 또는 None)
+    """
+    replies = visible_comments().filter(parent_id=parent.pk)
+    if cursor is not None:
+        last = Comment.objects.filter(pk=cursor, parent_id=parent.pk).values('created_at', 'pk').first()
+        if last is None:
+            return [], None
+        replies = replies.filter(
+            Q(created_at__gt=last['created_at']) |
+            Q(created_at=last['created_at'], pk__gt=last['pk'])
+        )
+    replies = list(replies.select_related('author').order_by(*REPLY_ORDERING)[:size + 1])
+    return _window(replies, size)
@@ -2,11 +2,15 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from apps.common.fieldsets import SparseFieldsetViewMixin
+from apps.common.pagination import PageNumberOrCursorPagination
 from .models import Comment
 from .serializers import CommentSerializer, CommentCreateSerializer
+from .comment_utils import create_comment, delete_comment, toggle_hidden
+from .threads import REPLY_PAGE_SIZE, MAX_REPLY_PAGE_SIZE, get_reply_page
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     댓글 ViewSet
 
@@ -14,9 +18,14 @@ class CommentViewSet(viewsets.ModelViewSet):
     - create: 댓글 작성 (회원만)
     - update: 댓글 수정 (본인 또는 관리자만)
     - destroy: 댓글 삭제 (본인 또는 관리자만, Soft Delete)
+    - replies: 답글 목록 (작성순, 커서 페이지네이션)
+    - hide: 댓글 숨김/복구 (관리자만)
+
+    목록/상세의 답글은 처음 REPLY_WINDOW개만 포함하고, 나머지는 replies_cursor로 이어서 조회한다.
     """
 
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = PageNumberOrCursorPagination
 
     def get_queryset(self):
         queryset = Comment.objects.filter(is_deleted=False)
@@ -30,13 +39,18 @@ class CommentViewSet(viewsets.ModelViewSet):
         if content_id:
             queryset = queryset.filter(content_id=content_id, parent__isnull=True)
 
-        return queryset.select_related('author', 'content').prefetch_related('replies')
+        # 답글은 CommentSerializer가 페이지 단위로 한 번에 조회 (threads 참고)
+        return queryset.select_related('author')
 
     def get_serializer_class(self):
         if self.action == 'create':
             return CommentCreateSerializer
         return CommentSerializer
 
+    def perform_create(self, serializer):
+        """댓글 저장 후 댓글 수 증가"""
+        create_comment(serializer)
+
     def perform_update(self, serializer):
         """댓글 수정 권한 체크"""
         instance = self.get_object()
@@ -57,8 +71,7 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        instance.is_deleted = True
-        instance.save()
+        delete_comment(instance)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -72,10 +85,34 @@ class CommentViewSet(viewsets.ModelViewSet):
             )
 
         comment = self.get_object()
-        comment.is_hidden = not comment.is_hidden
-        comment.save()
+        hidden = toggle_hidden(comment)
 
         return Response(
-            {"detail": f"댓글이 {'숨김' if comment.is_hidden else '복구'}되었습니다."},
+            {"detail": f"댓글이 {'숨김' if hidden else '복구'}되었습니다."},
             status=status.HTTP_200_OK
         )
+
+    @action(detail=True, methods=['get'])
+    def replies(self, request, pk=None):
+        """
+        답글 목록 (작성순)
+
+        ?cursor=<이전 페이지의 마지막 답글 ID>로 이어서 조회하고,
+        ?limit=로 페이지 크기를 지정한다. (기본 20, 최대 100)
+        """
+        comment = self.get_object()
+        try:
+            cursor = int(request.query_params['cursor']) if 'cursor' in request.query_params else None
+            limit = int(request.query_params.get('limit', REPLY_PAGE_SIZE))
+        except ValueError:
+            return Response(
+                {"detail": "cursor와 limit은 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), MAX_REPLY_PAGE_SIZE)
+
+        replies, next_cursor = get_reply_page(comment, cursor, limit)
+        return Response({
+            'next_cursor': next_cursor,
+            'results': CommentSerializer(replies, many=True, context=self.get_serializer_context()).data,
+        })
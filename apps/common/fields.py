@@ -0,0 +1,66 @@
+"""
+압축 저장 필드
+
+CompressedTextField는 파이썬에서는 문자열로 다루고 DB에는 gzip 바이트로 저장한다.
+mtime=0으로 압축하므로 같은 문자열은 항상 같은 바이트가 되고,
+저장된 바이트는 그대로 Content-Encoding: gzip 응답 본문으로 사용할 수 있다.
+
+brotli 패키지가 설치되어 있으면 brotli_compress()로 br 변형도 만들 수 있다.
+"""
+import gzip
+from django.db import models
+from django.db.models import BinaryField, ExpressionWrapper, F
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (없으면 gzip만 사용)
+    brotli = None
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def gzip_compress(text):
+    return gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0)
+
+
+def gzip_decompress(data):
+    return gzip.decompress(data).decode('utf-8')
+
+
+def brotli_compress(text):
+    """brotli 압축 (패키지가 없으면 None)"""
+    if brotli is None:
+        return None
+    return brotli.compress(text.encode('utf-8'), mode=brotli.MODE_TEXT)
+
+
+def raw_bytes(field_name):
+    """압축 해제 없이 저장된 바이트를 그대로 조회하는 표현식"""
+    return ExpressionWrapper(F(field_name), output_field=BinaryField())
+
+
+class CompressedTextField(models.TextField):
+    """gzip으로 압축해 저장하는 TextField (조회 시 자동 압축 해제, 부분 일치 검색 불가)"""
+
+    description = 'gzip으로 압축해 저장하는 텍스트'
+
+    def get_internal_type(self):
+        # DB 컬럼은 bytea(PostgreSQL) / BLOB(SQLite)
+        return 'BinaryField'
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        value = super().get_db_prep_value(value, connection, prepared)
+        if value is None:
+            return None
+        return connection.Database.Binary(gzip_compress(value))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        if isinstance(value, str):
+            return value
+        value = bytes(value)
+        if not value.startswith(GZIP_MAGIC):
+            # 압축 전에 저장된 값
+            return value.decode('utf-8')
+        return gzip_decompress(value)
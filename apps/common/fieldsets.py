@@ -0,0 +1,105 @@
+"""
+Sparse fieldset (?fields= / ?omit=)
+
+- ?fields=id,title,slug : 지정한 필드만 응답
+- ?omit=content_html    : 지정한 필드를 제외하고 응답
+
+SparseFieldsetSerializerMixin은 응답 필드를 줄이고,
+SparseFieldsetViewMixin은 응답에 필요 없는 컬럼을 queryset에서 defer()해
+PostgreSQL에서 읽지도 않도록 한다.
+"""
+from rest_framework import serializers
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def parse_field_list(value):
+    """'a, b,c' -> ['a', 'b', 'c']"""
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    요청의 ?fields= / ?omit=에 따라 응답 필드를 줄이는 Serializer Mixin
+
+    최상위 Serializer(또는 many=True의 child)에만 적용되고, 중첩된 Serializer에는 적용되지 않는다.
+    SerializerMethodField처럼 source가 '*'인 필드가 모델 컬럼을 읽는다면
+    Meta.sparse_fieldset_dependencies = {'필드명': ['모델 필드명', ...]}로 지정한다.
+    """
+
+    def _is_sparse_target(self):
+        parent = self.parent
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        request = self.context.get('request')
+        if request is None or not self._is_sparse_target():
+            return fields
+
+        # DRF Request가 아닌 HttpRequest가 전달되는 경우도 있으므로 GET 사용
+        requested = parse_field_list(request.GET.get(FIELDS_PARAM, ''))
+        omitted = set(parse_field_list(request.GET.get(OMIT_PARAM, '')))
+
+        # 존재하지 않는 필드명은 무시 (유효한 필드가 하나도 없으면 전체 응답)
+        requested = [name for name in requested if name in fields]
+        if requested:
+            fields = {name: field for name, field in fields.items() if name in requested}
+        if omitted:
+            fields = {name: field for name, field in fields.items() if name not in omitted}
+        return fields
+
+    def get_required_model_fields(self):
+        """응답 필드를 만드는 데 필요한 모델 필드명"""
+        dependencies = getattr(self.Meta, 'sparse_fieldset_dependencies', {})
+
+        required = set()
+        for name, field in self.fields.items():
+            if name in dependencies:
+                required.update(dependencies[name])
+            elif field.source != '*':
+                required.add(field.source.split('.')[0])
+        return required
+
+
+class SparseFieldsetViewMixin:
+    """
+    조회(list/retrieve) 시 응답에 쓰이지 않는 컬럼을 defer()하는 ViewSet Mixin
+
+    외래 키는 select_related와 함께 쓰이므로 defer하지 않는다.
+    뷰에서 직접 사용하는 필드는 sparse_fieldset_always_load에 지정한다.
+    (커서 페이지네이션이 created_at으로 다음 커서를 만들므로 기본 포함)
+    """
+
+    sparse_fieldset_actions = ('list', 'retrieve')
+    sparse_fieldset_always_load = ('created_at',)
+
+    def get_deferred_fields(self):
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, SparseFieldsetSerializerMixin):
+            return []
+
+        serializer = serializer_class(context=self.get_serializer_context())
+        required = serializer.get_required_model_fields()
+        required.update(self.sparse_fieldset_always_load)
+
+        model = serializer_class.Meta.model
+        return [
+            field.name
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+            and not field.is_relation
+            and field.name not in required
+        ]
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in self.sparse_fieldset_actions:
+            deferred = self.get_deferred_fields()
+            if deferred:
+                queryset = queryset.defer(*deferred)
+        return queryset
@@ -0,0 +1,194 @@
+"""
+페이지네이션
+
+기본은 기존과 같은 페이지 번호 방식(PageNumberPagination)이고,
+?pagination=cursor 또는 ?cursor= 가 있는 요청은 커서(keyset) 방식으로 처리한다.
+커서 방식은 COUNT(*)와 OFFSET 스캔 없이 정렬 인덱스를 따라 다음 페이지를 읽는다.
+
+커서 정렬은 뷰마다 정한다.
+- cursor_ordering: 정렬 필드 목록 (마지막은 유일한 필드여야 함, 기본 -created_at, -id)
+- get_cursor_ordering(): 요청마다 정렬을 정할 때 사용,
+  None을 반환하면(검색 관련도 순 등 keyset으로 표현할 수 없는 정렬) 페이지 번호 방식으로 처리
+"""
+import json
+from base64 import b64decode, b64encode
+from datetime import datetime
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """커서 값 인코더 (datetime은 마이크로초까지 유지)"""
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def keyset_filter(ordering, values, reverse=False):
+    """
+    정렬 순서에서 values 다음(reverse면 이전)에 오는 행 조건
+
+    (a, b, c) 정렬이면 a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND c > vc)
+    (내림차순 필드는 <, 정렬 필드는 NULL이 아니어야 함)
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    뷰의 정렬 순 keyset 커서 페이지네이션
+
+    커서에는 페이지 경계 행의 정렬 필드 값과 방향을 담고,
+    다음/이전 페이지는 keyset_filter() 조건과 LIMIT로 읽는다.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, view):
+        """뷰의 커서 정렬 (None이면 커서 방식 불가)"""
+        if hasattr(view, 'get_cursor_ordering'):
+            return view.get_cursor_ordering()
+        return getattr(view, 'cursor_ordering', self.ordering)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            payload = json.loads(b64decode(encoded.encode('ascii')).decode('utf-8'))
+            values, reverse = payload['v'], bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound('Invalid cursor')
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound('Invalid cursor')
+        return values, reverse
+
+    def encode_cursor(self, row, reverse):
+        values = [getattr(row, field.lstrip('-')) for field in self.ordering]
+        payload = json.dumps({'v': values, 'r': int(reverse)}, cls=CursorEncoder, separators=(',', ':'))
+        encoded = b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.ordering = tuple(self.get_ordering(view))
+        self.base_url = request.build_absolute_uri()
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor[1]
+
+        if cursor is not None:
+            queryset = queryset.filter(keyset_filter(self.ordering, cursor[0], reverse))
+        if reverse:
+            ordering = [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+        else:
+            ordering = self.ordering
+
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # 앞으로 읽었으면 커서가 있을 때 이전 페이지가 있고, 뒤로 읽었으면 항상 다음 페이지가 있음
+        self.has_next = has_more if not reverse else True
+        self.has_previous = cursor is not None if not reverse else has_more
+        self.page = rows
+        return rows
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'The pagination cursor value.',
+            'schema': {'type': 'string'},
+        }]
+
+
+class PageNumberOrCursorPagination(BasePagination):
+    """요청마다 페이지 번호 방식과 커서 방식 중 하나를 선택하는 페이지네이션"""
+
+    page_number_class = PageNumberPagination
+    cursor_class = KeysetCursorPagination
+
+    def __init__(self):
+        self.page_number_paginator = self.page_number_class()
+        self.cursor_paginator = self.cursor_class()
+        self.paginator = self.page_number_paginator
+
+    def use_cursor(self, request, view=None):
+        requested = (
+            request.query_params.get('pagination') == 'cursor' or
+            self.cursor_paginator.cursor_query_param in request.query_params
+        )
+        return requested and self.cursor_paginator.get_ordering(view) is not None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request, view):
+            self.paginator = self.cursor_paginator
+        else:
+            self.paginator = self.page_number_paginator
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_paginator.get_paginated_response_schema(schema)
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    def get_results(self, data):
+        return self.paginator.get_results(data)
+
+    def get_schema_operation_parameters(self, view):
+        return (
+            self.page_number_paginator.get_schema_operation_parameters(view) +
+            self.cursor_paginator.get_schema_operation_parameters(view)
+        )
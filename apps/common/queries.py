@@ -0,0 +1,15 @@
+"""
+공용 쿼리 표현식
+"""
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, field):
+    """queryset에서 field가 바깥 행을 가리키는 행 수 (상관 서브쿼리, 없으면 0)"""
+    counts = queryset.filter(
+        **{field: OuterRef('pk')}
+    ).order_by().values(field).annotate(
+        count=Count('pk')
+    ).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
@@ -0,0 +1,15 @@
+"""
+Celery 태스크
+"""
+from celery import shared_task
+from .view_counter import flush_view_counts as flush_pending_view_counts
+
+
+@shared_task
+def flush_view_counts():
+    """
+    캐시에 누적된 조회수 증가분을 DB에 반영
+    1분마다 실행되도록 스케줄링
+    """
+    flushed = flush_pending_view_counts()
+    return f"Flushed {flushed} views"
@@ -0,0 +1,24 @@
+"""
+프로젝트 테스트 러너
+"""
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    테스트 환경 설정
+
+    활동 이벤트 백그라운드 저장 스레드는 테스트 트랜잭션 밖에서 DB에 쓰므로 끄고,
+    테스트가 끝나면 저장되지 않은 이벤트를 버린다.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.ACTIVITY_BACKGROUND_FLUSH = False
+
+    def teardown_test_environment(self, **kwargs):
+        from apps.analytics.activity import discard_events
+
+        discard_events()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,182 @@
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from apps.contents.models import Category, Content
+from .view_counter import record_view, get_pending_views, flush_view_counts, view_counts_flushed
+
+User = get_user_model()
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class ViewCounterTest(TestCase):
+    """조회수 write-behind 카운터 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test</p>',
+            category=self.category,
+            author=self.user
+        )
+
+    def test_record_view_is_write_free(self):
+        """조회 기록 시 DB 쿼리가 실행되지 않음"""
+        with self.assertNumQueries(0):
+            record_view(self.content)
+            record_view(self.content)
+
+        self.assertEqual(get_pending_views(self.content), 2)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 0)
+
+    def test_flush_applies_pending_views(self):
+        """flush 시 누적된 조회수가 DB에 반영되고 대기분이 비워짐"""
+        for _ in range(3):
+            record_view(self.content)
+
+        self.assertEqual(flush_view_counts(), 3)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 3)
+        self.assertEqual(get_pending_views(self.content), 0)
+
+        # 반영 후 새로 들어온 조회도 다음 flush에서 반영
+        record_view(self.content)
+        self.assertEqual(flush_view_counts(), 1)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 4)
+
+    def test_unshared_cache_writes_directly(self):
+        """프로세스별 캐시에서는 flush 작업이 볼 수 없으므로 바로 DB에 반영"""
+        receiver = mock.Mock()
+        view_counts_flushed.connect(receiver)
+        self.addCleanup(view_counts_flushed.disconnect, receiver)
+
+        with override_settings(CACHE_IS_SHARED=False):
+            record_view(self.content)
+            record_view(self.content)
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 2)
+        self.assertEqual(get_pending_views(self.content), 0)
+        # 요청마다 반영 후속 처리를 실행하지 않음
+        receiver.assert_not_called()
+
+    def test_flush_survives_evicted_counter(self):
+        """증가분을 읽은 뒤 키가 사라져도 커서와 신호가 정상 처리됨"""
+        record_view(self.content)
+        receiver = mock.Mock()
+        view_counts_flushed.connect(receiver)
+        self.addCleanup(view_counts_flushed.disconnect, receiver)
+
+        with mock.patch('apps.common.view_counter.cache.decr', side_effect=ValueError):
+            self.assertEqual(flush_view_counts(), 1)
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 1)
+        receiver.assert_called_once()
+        # 커서가 진행되어 같은 증가분을 다시 반영하지 않음
+        self.assertEqual(flush_view_counts(), 0)
+
+
+class PageNumberOrCursorPaginationTest(TestCase):
+    """페이지네이션 방식 선택 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        for i in range(25):
+            Content.objects.create(
+                title=f'Test Content {i}',
+                slug=f'test-content-{i}',
+                summary='Test summary',
+                content_html='<p>Test</p>',
+                category=self.category,
+                author=self.user,
+                status=Content.Status.PUBLISHED
+            )
+
+    def test_page_number_is_default(self):
+        """기본은 페이지 번호 방식 (count 포함)"""
+        response = self.client.get('/api/contents/contents/')
+        self.assertEqual(response.data['count'], 25)
+        self.assertEqual(len(response.data['results']), 20)
+
+    def test_cursor_pagination(self):
+        """커서 방식은 count 없이 다음 페이지 커서를 반환"""
+        response = self.client.get('/api/contents/contents/', {'pagination': 'cursor'})
+        self.assertNotIn('count', response.data)
+        self.assertEqual(len(response.data['results']), 20)
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNone(response.data['next'])
+
+    def test_cursor_ties_and_previous(self):
+        """작성일이 같아도 id로 이어서 빠짐없이 조회하고, 이전 페이지로 돌아감"""
+        from django.utils import timezone
+
+        Content.objects.update(created_at=timezone.now())
+        expected = list(Content.objects.order_by('-id').values_list('slug', flat=True))
+
+        first = self.client.get('/api/contents/contents/', {'pagination': 'cursor'})
+        second = self.client.get(first.data['next'])
+        self.assertEqual(
+            [item['slug'] for item in first.data['results'] + second.data['results']], expected
+        )
+
+        previous = self.client.get(second.data['previous'])
+        self.assertEqual(previous.data['results'], first.data['results'])
+        self.assertIsNone(previous.data['previous'])
+
+    def test_search_falls_back_to_page_number(self):
+        """관련도 순 검색 결과는 커서 대신 페이지 번호 방식으로 응답"""
+        response = self.client.get('/api/contents/contents/', {'pagination': 'cursor', 'search': 'Test'})
+        self.assertEqual(response.data['count'], 25)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/contents/contents/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_post_cursor_keeps_pinned_first(self):
+        """게시글 커서 방식도 상단 고정 게시글을 먼저 조회"""
+        from apps.boards.models import Board, Post
+
+        board = Board.objects.create(name='질의응답', board_type=Board.BoardType.QNA)
+        posts = [
+            Post.objects.create(board=board, author=self.user, title=f'post {i}', content='content')
+            for i in range(25)
+        ]
+        Post.objects.filter(pk=posts[3].pk).update(is_pinned=True)
+
+        first = self.client.get('/api/boards/posts/', {'pagination': 'cursor'})
+        second = self.client.get(first.data['next'])
+        titles = [item['title'] for item in first.data['results'] + second.data['results']]
+        self.assertEqual(titles, ['post 3'] + [f'post {i}' for i in reversed(range(25)) if i != 3])
@@ -0,0 +1,204 @@
+"""
+조회수 write-behind 카운터
+
+상세 조회 시 DB를 갱신하지 않고 공유 캐시에 증가분만 기록한다.
+주기적으로 실행되는 flush_view_counts 태스크가 누적된 증가분을
+F() 표현식으로 DB에 일괄 반영한다.
+
+캐시 키 구성:
+- views:<label>:<pk>            반영 대기 중인 증가분
+- views:<label>:journal         증가분이 생긴 객체를 기록하는 저널 순번
+- views:<label>:journal:<n>     n번째 저널 항목 (객체 pk)
+- views:<label>:cursor          마지막으로 반영한 저널 순번
+
+캐시를 프로세스끼리 공유하지 않으면(CACHE_IS_SHARED=False) flush 태스크가
+증가분을 볼 수 없으므로 조회할 때 view_count만 바로 DB에 반영한다.
+(요청마다 일별 통계/인기 점수/캐시 무효화가 실행되지 않도록 view_counts_flushed는 보내지 않음)
+"""
+import logging
+from collections import defaultdict
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# 조회수를 집계하는 모델 (app_label.ModelName)
+COUNTED_MODELS = ['contents.Content', 'boards.Post']
+
+KEY_PREFIX = 'views'
+
+# 저널 항목 보관 기간 (flush가 장시간 멈춰도 유실되지 않도록 넉넉하게)
+JOURNAL_TIMEOUT = 60 * 60 * 24 * 7
+
+# 순번만 증가하고 아직 기록되지 않은 항목을 기다려 주는 범위
+JOURNAL_GRACE = 10
+
+FLUSH_LOCK_TIMEOUT = 60 * 5
+
+# 조회수를 DB에 반영한 뒤 발송 (sender=모델, pks=반영한 객체 pk 목록, deltas={pk: 증가분})
+view_counts_flushed = Signal()
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def _counter_key(label, pk):
+    return f'{KEY_PREFIX}:{label}:{pk}'
+
+
+def _journal_key(label):
+    return f'{KEY_PREFIX}:{label}:journal'
+
+
+def _journal_entry_key(label, seq):
+    return f'{KEY_PREFIX}:{label}:journal:{seq}'
+
+
+def _cursor_key(label):
+    return f'{KEY_PREFIX}:{label}:cursor'
+
+
+def _incr(key, delta=1):
+    """키가 없으면 생성 후 원자적으로 증가"""
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # 동시에 생성해도 add는 한 번만 성공하므로 증가분이 유실되지 않음
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key, delta)
+
+
+def _append_journal(label, pk):
+    seq = _incr(_journal_key(label))
+    cache.set(_journal_entry_key(label, seq), pk, timeout=JOURNAL_TIMEOUT)
+
+
+def record_view(instance):
+    """
+    조회수 1 증가 기록 (DB 쓰기 없음)
+
+    Returns:
+        int: 아직 DB에 반영되지 않은 누적 증가분
+            (캐시를 공유하지 않으면 1: 바로 반영하지만 이미 읽어 둔 값에는 포함되지 않음)
+    """
+    if not settings.CACHE_IS_SHARED:
+        model = type(instance)
+        model.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
+        return 1
+
+    label = _label(type(instance))
+    pending = _incr(_counter_key(label, instance.pk))
+
+    # 반영 대기 상태가 새로 시작된 객체만 저널에 기록
+    if pending == 1:
+        _append_journal(label, instance.pk)
+
+    return pending
+
+
+def get_pending_views(instance):
+    """DB에 반영되지 않은 조회수 증가분"""
+    return cache.get(_counter_key(_label(type(instance)), instance.pk), 0)
+
+
+def _read_journal(label):
+    """저널에서 반영 대상 pk 목록과 다음 커서 위치를 읽음"""
+    seq = cache.get(_journal_key(label), 0)
+    cursor = cache.get(_cursor_key(label), 0)
+
+    # 캐시가 비워져 순번이 초기화된 경우
+    if cursor > seq:
+        cursor = 0
+
+    if seq == cursor:
+        return set(), cursor
+
+    entry_keys = [_journal_entry_key(label, n) for n in range(cursor + 1, seq + 1)]
+    entries = cache.get_many(entry_keys)
+
+    pks = set()
+    new_cursor = cursor
+    for n, key in enumerate(entry_keys, start=cursor + 1):
+        if key not in entries:
+            # 방금 순번을 받은 요청이 아직 항목을 기록하지 못했을 수 있음
+            if seq - n < JOURNAL_GRACE:
+                break
+            logger.warning(f"[VIEW COUNTER] 저널 항목 유실: {label} #{n}")
+        else:
+            pks.add(entries[key])
+        new_cursor = n
+
+    return pks, new_cursor
+
+
+def flush_model(model):
+    """
+    모델 하나의 누적 조회수를 DB에 반영
+
+    Returns:
+        int: 반영한 조회수 합계
+    """
+    label = _label(model)
+    pks, new_cursor = _read_journal(label)
+
+    counter_keys = {pk: _counter_key(label, pk) for pk in pks}
+    values = cache.get_many(list(counter_keys.values()))
+    deltas = {
+        pk: values[key]
+        for pk, key in counter_keys.items()
+        if values.get(key)
+    }
+
+    # 같은 증가분끼리 묶어 UPDATE 횟수를 줄임
+    pks_by_delta = defaultdict(list)
+    for pk, delta in deltas.items():
+        pks_by_delta[delta].append(pk)
+
+    with transaction.atomic():
+        for delta, delta_pks in pks_by_delta.items():
+            model.objects.filter(pk__in=delta_pks).update(
+                view_count=F('view_count') + delta
+            )
+
+    # 반영한 만큼만 차감 (그 사이 들어온 조회는 남겨 두고 다시 저널에 기록)
+    for pk, delta in deltas.items():
+        try:
+            remaining = cache.decr(counter_keys[pk], delta)
+        except ValueError:
+            # get_many 이후 키가 만료/축출된 경우 (남은 증가분 없음)
+            remaining = 0
+        if remaining > 0:
+            _append_journal(label, pk)
+
+    cache.set(_cursor_key(label), new_cursor, timeout=None)
+
+    if deltas:
+        view_counts_flushed.send(sender=model, pks=list(deltas), deltas=deltas)
+
+    return sum(deltas.values())
+
+
+def flush_view_counts():
+    """
+    모든 집계 대상 모델의 누적 조회수를 DB에 반영
+
+    Returns:
+        int: 반영한 조회수 합계 (다른 작업이 실행 중이면 0)
+    """
+    lock_key = f'{KEY_PREFIX}:flush-lock'
+    if not cache.add(lock_key, 1, timeout=FLUSH_LOCK_TIMEOUT):
+        logger.info("[VIEW COUNTER] 다른 flush 작업이 실행 중")
+        return 0
+
+    try:
+        total = 0
+        for model_label in COUNTED_MODELS:
+            total += flush_model(apps.get_model(model_label))
+        return total
+    finally:
+        cache.delete(lock_key)
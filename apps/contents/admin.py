@@ -4,7 +4,8 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 from ckeditor.widgets import CKEditorWidget
 from django import forms
-from .models import Category, Tag, Content, ContentVersion, Favorite
+from .models import Category, Tag, Content, ContentVersion, ContentPublishEvent, Favorite
+from .versioning import save_version
 
 
 # Content Form with CKEditor
@@ -16,6 +17,20 @@ class ContentAdminForm(forms.ModelForm):
         fields = '__all__'
 
 
+# ContentVersion Form (본문은 스냅샷/델타로 변환해 저장)
+class ContentVersionAdminForm(forms.ModelForm):
+    html = forms.CharField(
+        widget=CKEditorWidget(config_name='content'),
+        required=False,
+        label='콘텐츠 HTML',
+        help_text='비워 두면 콘텐츠의 현재 본문을 버전으로 저장합니다.'
+    )
+
+    class Meta:
+        model = ContentVersion
+        fields = ['content', 'version', 'change_log']
+
+
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'order', 'is_active', 'created_at']
@@ -33,21 +48,33 @@ class TagAdmin(admin.ModelAdmin):
 
 
 class ContentVersionInline(admin.TabularInline):
+    """버전 이력 (본문은 불러오지 않음, 버전 추가는 콘텐츠 버전 화면에서)"""
     model = ContentVersion
     extra = 0
-    readonly_fields = ['created_at', 'created_by']
+    fields = ['sequence', 'version', 'size', 'change_log', 'created_by', 'created_at']
+    readonly_fields = fields
     can_delete = False
+    ordering = ['-sequence']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('created_by').defer('content_html', 'delta')
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Content)
 class ContentAdmin(admin.ModelAdmin):
     form = ContentAdminForm
-    list_display = ['title', 'category', 'author', 'status_badge', 'difficulty_badge', 'version', 'view_count', 'created_at']
+    list_display = ['title', 'category', 'author', 'status_badge', 'difficulty_badge', 'version', 'view_count', 'favorite_count', 'created_at']
     list_filter = ['status', 'category', 'difficulty', 'created_at']
     search_fields = ['title', 'summary', 'author__username']
     prepopulated_fields = {'slug': ('title',)}
     filter_horizontal = ['tags']
-    readonly_fields = ['view_count', 'created_at', 'updated_at', 'published_at', 'content_preview']
+    readonly_fields = [
+        'view_count', 'favorite_count', 'comment_count', 'created_at', 'updated_at', 'published_at', 'content_preview',
+        'word_count', 'char_count', 'reading_time'
+    ]
     inlines = [ContentVersionInline]
     actions = ['make_published', 'make_draft']
 
@@ -59,7 +86,7 @@ class ContentAdmin(admin.ModelAdmin):
             'fields': ('category', 'tags', 'difficulty')
         }),
         ('메타 정보', {
-            'fields': ('author', 'status', 'version', 'estimated_time')
+            'fields': ('author', 'status', 'version', 'estimated_time', 'reading_time')
         }),
         ('학습 정보', {
             'fields': ('prerequisites', 'learning_objectives')
@@ -69,7 +96,7 @@ class ContentAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('통계', {
-            'fields': ('view_count', 'created_at', 'updated_at', 'published_at'),
+            'fields': ('view_count', 'favorite_count', 'comment_count', 'word_count', 'char_count', 'created_at', 'updated_at', 'published_at'),
             'classes': ('collapse',)
         }),
     )
@@ -106,10 +133,9 @@ class ContentAdmin(admin.ModelAdmin):
 
     def content_preview(self, obj):
         """콘텐츠 HTML 미리보기"""
-        if obj.content_html:
-            # HTML 태그를 제거하고 텍스트만 표시 (태그가 잘려서 페이지가 깨지는 것을 방지)
-            import re
-            text_only = re.sub(r'<[^>]+>', '', obj.content_html)
+        if obj.plain_text:
+            # 저장 시 추출한 본문 텍스트를 표시 (태그가 잘려서 페이지가 깨지는 것을 방지)
+            text_only = obj.plain_text
             preview_text = text_only[:500]
             return format_html('<div style="border: 1px solid #ddd; padding: 15px; max-height: 200px; overflow-y: auto; white-space: pre-wrap;">{}</div>', preview_text + '...' if len(text_only) > 500 else preview_text)
         return '-'
@@ -124,14 +150,19 @@ class ContentAdmin(admin.ModelAdmin):
                 content.status = 'PUBLISHED'
                 if not content.published_at:
                     content.published_at = timezone.now()
-                content.save()
+                content.save_without_counters()
                 updated += 1
         self.message_user(request, f'{updated}개의 콘텐츠가 발행되었습니다.')
     make_published.short_description = '선택된 콘텐츠 발행'
 
     def make_draft(self, request, queryset):
         """선택된 콘텐츠를 초안 상태로 변경"""
+        from .response_cache import content_detail_group, invalidate
+
+        slugs = list(queryset.values_list('slug', flat=True))
         updated = queryset.update(status='DRAFT')
+        # update()는 시그널을 발생시키지 않으므로 응답 캐시를 직접 무효화
+        invalidate('contents', *[content_detail_group(slug) for slug in slugs])
         self.message_user(request, f'{updated}개의 콘텐츠가 초안으로 변경되었습니다.')
     make_draft.short_description = '선택된 콘텐츠를 초안으로 변경'
 
@@ -146,15 +177,70 @@ class ContentAdmin(admin.ModelAdmin):
         if obj.status == 'PUBLISHED' and not obj.published_at:
             obj.published_at = timezone.now()
 
-        super().save_model(request, obj, form, change)
+        obj.save_without_counters()
 
 
 @admin.register(ContentVersion)
 class ContentVersionAdmin(admin.ModelAdmin):
-    list_display = ['content', 'version', 'created_by', 'created_at']
-    list_filter = ['created_at']
+    """
+    콘텐츠 버전
+
+    이후 버전이 이전 버전과의 델타로 저장되므로 저장된 버전은 수정/삭제할 수 없다.
+    """
+    form = ContentVersionAdminForm
+    list_display = ['content', 'version', 'sequence', 'is_snapshot', 'size', 'created_by', 'created_at']
+    list_filter = ['is_snapshot', 'created_at']
     search_fields = ['content__title', 'change_log']
-    readonly_fields = ['created_at']
+    list_select_related = ['content', 'created_by']
+    readonly_fields = ['sequence', 'is_snapshot', 'size', 'created_by', 'created_at', 'html_preview']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('content__content_html', 'content_html', 'delta')
+
+    def get_fields(self, request, obj=None):
+        if obj is None:
+            return ['content', 'version', 'change_log', 'html']
+        return ['content', 'version', 'change_log'] + self.readonly_fields
+
+    def html_preview(self, obj):
+        """복원한 본문 미리보기"""
+        return format_html(
+            '<div style="border: 1px solid #ddd; padding: 15px; max-height: 200px; overflow-y: auto; white-space: pre-wrap;">{}</div>',
+            obj.html[:2000]
+        )
+    html_preview.short_description = '콘텐츠 HTML'
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        """수정자를 설정하고 스냅샷/델타로 변환해 저장"""
+        obj.created_by = request.user
+        save_version(obj, html=form.cleaned_data['html'] or None)
+
+
+@admin.register(ContentPublishEvent)
+class ContentPublishEventAdmin(admin.ModelAdmin):
+    """콘텐츠 발행 이벤트 (즉시 알림 발송 현황, 읽기 전용)"""
+    list_display = [
+        'content', 'status', 'recipient_count', 'sent_count', 'failed_count',
+        'completed_chunks', 'chunk_count', 'created_at', 'completed_at'
+    ]
+    list_filter = ['status', 'created_at']
+    search_fields = ['content__title']
+    list_select_related = ['content']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('content__content_html', 'content__content_html_br')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Favorite)
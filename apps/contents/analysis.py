@@ -0,0 +1,71 @@
+"""
+콘텐츠 본문 분석
+
+콘텐츠 저장 시 content_html을 한 번만 파싱해 본문 텍스트, 목차(제목 태그),
+단어/글자 수, 읽기 시간을 계산한다. 계산 결과는 Content 모델에 저장되어
+관리자 화면, 검색 색인, API가 HTML을 다시 파싱하지 않고 사용한다.
+"""
+import math
+from .search import _TextExtractor
+
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+# 분당 읽는 단어(어절) 수
+WORDS_PER_MINUTE = 200
+
+
+class _ContentAnalyzer(_TextExtractor):
+    """본문 텍스트와 함께 제목 태그(h1~h6)로 목차를 추출"""
+
+    def __init__(self):
+        super().__init__()
+        self.toc = []
+        self._heading = None
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        if tag in HEADING_TAGS and self._heading is None:
+            self._heading = {
+                'level': int(tag[1]),
+                'id': dict(attrs).get('id') or '',
+                'parts': [],
+            }
+
+    def handle_endtag(self, tag):
+        super().handle_endtag(tag)
+        if tag in HEADING_TAGS and self._heading is not None:
+            text = ' '.join(' '.join(self._heading['parts']).split())
+            if text:
+                self.toc.append({
+                    'level': self._heading['level'],
+                    'text': text,
+                    'id': self._heading['id'],
+                })
+            self._heading = None
+
+    def handle_data(self, data):
+        super().handle_data(data)
+        if self._heading is not None and not self._skip_depth:
+            self._heading['parts'].append(data)
+
+
+def analyze_html(html):
+    """
+    콘텐츠 HTML 분석
+
+    Returns:
+        dict: plain_text, toc, word_count, char_count(공백 제외), reading_time(분)
+    """
+    analyzer = _ContentAnalyzer()
+    if html:
+        analyzer.feed(html)
+        analyzer.close()
+
+    words = ' '.join(analyzer.parts).split()
+    return {
+        'plain_text': ' '.join(words),
+        'toc': analyzer.toc,
+        'word_count': len(words),
+        'char_count': sum(len(word) for word in words),
+        'reading_time': math.ceil(len(words) / WORDS_PER_MINUTE),
+    }
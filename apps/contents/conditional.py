@@ -0,0 +1,97 @@
+"""
+조건부 GET (ETag / Last-Modified)
+
+응답 본문을 만들기 전에 가벼운 검증자만 계산해 If-None-Match /
+If-Modified-Since와 비교하고, 변경이 없으면 직렬화 없이 304를 반환한다.
+"""
+import hashlib
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from .response_cache import get_generations
+
+
+def accepted_encodings(request):
+    """Accept-Encoding에서 허용된(q > 0) 인코딩 집합"""
+    encodings = set()
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            encodings.add(coding)
+    return encodings
+
+
+def make_etag(*parts):
+    """검증 값들로 ETag 생성"""
+    raw = '|'.join(str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+
+class ConditionalGetMixin:
+    """
+    목록/상세 응답에 ETag, Last-Modified를 붙이고 변경이 없으면 304를 반환하는 ViewSet Mixin
+
+    기본 검증자는 응답 캐시 그룹의 세대 값이다. (AnonymousResponseCacheMixin과 함께 사용)
+    다른 검증자가 필요하면 get_validators()를 재정의한다.
+    """
+
+    def get_validators(self):
+        """
+        Returns:
+            tuple: (etag, last_modified datetime 또는 None), 검증하지 않으면 None
+        """
+        generations = get_generations(self.get_response_cache_groups())
+        return make_etag(self.basename, self.action, *generations), None
+
+    def get_conditional_response(self, build_response):
+        """검증자가 일치하면 304, 아니면 build_response()의 응답에 검증자를 붙여 반환"""
+        request = self.request
+        if request.method not in ('GET', 'HEAD'):
+            return build_response()
+
+        validators = self.get_validators()
+        if validators is None:
+            return build_response()
+
+        etag, last_modified = validators
+        last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified_ts
+        )
+        if response is None:
+            response = build_response()
+
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified_ts is not None:
+                response['Last-Modified'] = http_date(last_modified_ts)
+            # 매번 재검증하도록 하고, 사용자별 응답은 공유 캐시에 저장되지 않게 함
+            patch_cache_control(response, no_cache=True)
+            if request.user.is_authenticated:
+                patch_cache_control(response, private=True)
+            patch_vary_headers(response, ('Authorization',))
+
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        )
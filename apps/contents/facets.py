@@ -0,0 +1,71 @@
+"""
+콘텐츠 패싯 집계
+
+카테고리별, 태그별, 난이도별 콘텐츠 수와 전체 개수를 UNION ALL로 묶어
+한 번의 쿼리로 집계한다. 각 행은 (facet, key, label, count) 형태다.
+"""
+from django.db.models import CharField, Count, F, Value
+from .models import Content
+
+DIFFICULTY_LABELS = dict(Content._meta.get_field('difficulty').choices)
+
+
+def _facet_rows(queryset, facet, key, label):
+    return queryset.annotate(
+        facet=Value(facet, output_field=CharField()),
+        facet_key=key,
+        facet_label=label,
+    ).values('facet', 'facet_key', 'facet_label').annotate(
+        count=Count('pk', distinct=True)
+    ).values_list('facet', 'facet_key', 'facet_label', 'count')
+
+
+def count_facets(queryset):
+    """
+    콘텐츠 queryset의 패싯별 개수
+
+    Returns:
+        dict: total, categories, tags, difficulties
+    """
+    # 검색 정렬/중복 제거가 적용된 queryset도 IN 서브쿼리로 사용할 수 있도록 pk만 선택
+    contents = Content.objects.filter(pk__in=queryset.order_by().values('pk')).order_by()
+    empty = Value('', output_field=CharField())
+
+    rows = _facet_rows(
+        contents, 'total', empty, empty
+    ).union(
+        _facet_rows(
+            contents.filter(category__is_active=True),
+            'category', F('category__slug'), F('category__name')
+        ),
+        _facet_rows(
+            contents.filter(tags__isnull=False),
+            'tag', F('tags__slug'), F('tags__name')
+        ),
+        _facet_rows(
+            contents, 'difficulty', F('difficulty'), F('difficulty')
+        ),
+        all=True
+    )
+
+    result = {'total': 0, 'categories': [], 'tags': [], 'difficulties': []}
+    for facet, key, label, count in rows:
+        if facet == 'total':
+            result['total'] = count
+        elif facet == 'category':
+            result['categories'].append({'slug': key, 'name': label, 'count': count})
+        elif facet == 'tag':
+            result['tags'].append({'slug': key, 'name': label, 'count': count})
+        else:
+            result['difficulties'].append({
+                'value': key,
+                'label': DIFFICULTY_LABELS.get(key, key),
+                'count': count,
+            })
+
+    for items in (result['categories'], result['tags']):
+        items.sort(key=lambda item: (-item['count'], item['name']))
+    # 난이도는 선택지 순서(초급 → 고급)로 정렬
+    order = {value: index for index, value in enumerate(DIFFICULTY_LABELS)}
+    result['difficulties'].sort(key=lambda item: order.get(item['value'], len(order)))
+    return result
@@ -0,0 +1,127 @@
+"""
+즐겨찾기 유틸리티
+
+- 목록 페이지에서 콘텐츠마다 EXISTS 쿼리를 실행하지 않도록
+  요청 단위로 사용자의 즐겨찾기 콘텐츠 ID를 한 번에 조회해 재사용한다.
+- Content.favorite_count는 즐겨찾기 등록/해제 시 F()로 증감하고,
+  관리자 삭제나 회원 탈퇴 등으로 어긋난 값은 reconcile_favorite_counts()로 보정한다.
+"""
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from apps.common.queries import count_subquery
+from .models import Content, Favorite
+from .response_cache import content_detail_group, invalidate
+
+
+class FavoriteResolver:
+    """요청 단위 즐겨찾기 여부 조회기"""
+
+    def __init__(self, user):
+        self.user = user
+        self._favorited_ids = set()
+        self._resolved_ids = set()
+
+    @property
+    def is_active(self):
+        return self.user is not None and self.user.is_authenticated
+
+    def prime(self, content_ids):
+        """아직 조회하지 않은 콘텐츠 ID를 한 번의 쿼리로 조회"""
+        if not self.is_active:
+            return
+
+        missing_ids = set(content_ids) - self._resolved_ids
+        if not missing_ids:
+            return
+
+        self._favorited_ids.update(
+            Favorite.objects.filter(
+                user=self.user,
+                content_id__in=missing_ids
+            ).values_list('content_id', flat=True)
+        )
+        self._resolved_ids.update(missing_ids)
+
+    def is_favorited(self, content):
+        if not self.is_active:
+            return False
+        self.prime([content.pk])
+        return content.pk in self._favorited_ids
+
+
+def get_favorite_resolver(context):
+    """
+    Serializer context에서 요청 단위 조회기를 가져옴
+
+    같은 요청 안에서 여러 Serializer가 생성되어도 조회 결과를 공유하도록
+    request 객체에 조회기를 저장한다.
+    """
+    request = context.get('request')
+    if request is None:
+        return FavoriteResolver(None)
+
+    resolver = getattr(request, '_favorite_resolver', None)
+    if resolver is None or resolver.user is not request.user:
+        resolver = FavoriteResolver(request.user)
+        request._favorite_resolver = resolver
+    return resolver
+
+
+def toggle_favorite(user, content):
+    """
+    즐겨찾기 등록/해제 후 콘텐츠의 favorite_count를 증감
+
+    Returns:
+        bool: 등록되었으면 True, 해제되었으면 False
+    """
+    with transaction.atomic():
+        favorite, created = Favorite.objects.get_or_create(user=user, content=content)
+
+        if created:
+            delta = 1
+        else:
+            # 동시에 해제 요청이 들어와도 실제로 삭제한 요청만 차감
+            deleted, _ = Favorite.objects.filter(pk=favorite.pk).delete()
+            delta = -deleted
+
+        if delta:
+            # 어긋난 카운터가 0이면 차감하지 않음 (음수가 되면 PositiveIntegerField 제약 위반)
+            Content.objects.filter(pk=content.pk).update(
+                favorite_count=Greatest(F('favorite_count') + delta, Value(0))
+            )
+            # update()는 시그널을 보내지 않으므로 상세 응답 캐시를 직접 무효화
+            slug = content.slug
+            transaction.on_commit(lambda: invalidate(content_detail_group(slug)))
+
+    return created
+
+
+def actual_favorite_count():
+    """콘텐츠별 실제 즐겨찾기 수 표현식 (OuterRef('pk') 기준)"""
+    return count_subquery(Favorite.objects.all(), 'content')
+
+
+def reconcile_favorite_counts(dry_run=False):
+    """
+    favorite_count가 실제 즐겨찾기 수와 다른 콘텐츠를 찾아 보정
+
+    Returns:
+        list: 보정 대상 콘텐츠 ({'pk', 'slug', 'favorite_count', 'actual'})
+    """
+    drifted = list(
+        Content.objects.annotate(
+            actual=actual_favorite_count()
+        ).exclude(
+            favorite_count=F('actual')
+        ).values('pk', 'slug', 'favorite_count', 'actual')
+    )
+
+    if drifted and not dry_run:
+        # 조회 이후의 변경도 반영되도록 갱신 시점에 다시 계산
+        Content.objects.filter(
+            pk__in=[row['pk'] for row in drifted]
+        ).update(favorite_count=actual_favorite_count())
+        invalidate(*[content_detail_group(row['slug']) for row in drifted])
+
+    return drifted
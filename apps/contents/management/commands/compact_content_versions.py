@@ -0,0 +1,25 @@
+"""
+콘텐츠 버전 압축 Management Command
+
+기존 버전(전체 본문 저장)을 주기적 스냅샷과 이전 버전과의 델타로 다시 저장합니다.
+"""
+from django.core.management.base import BaseCommand
+from apps.contents.models import Content
+from apps.contents.versioning import compact_versions
+
+
+class Command(BaseCommand):
+    help = '콘텐츠 버전을 스냅샷/델타 형식으로 압축'
+
+    def handle(self, *args, **options):
+        total = 0
+        snapshots = 0
+        contents = Content.objects.filter(versions__isnull=False).distinct().only('pk')
+        for content in contents.iterator(chunk_size=100):
+            count, snapshot_count = compact_versions(content)
+            total += count
+            snapshots += snapshot_count
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ {total}개 버전을 압축했습니다. (스냅샷 {snapshots}개, 델타 {total - snapshots}개)"
+        ))
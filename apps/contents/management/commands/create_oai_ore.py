@@ -479,34 +479,27 @@ class Command(BaseCommand):
 
         # 이메일 알림 발송
         self.stdout.write(self.style.WARNING("📧 이메일 알림 발송 중..."))
-        from apps.accounts.email_utils import send_immediate_content_notification
+        from apps.accounts.email_utils import build_immediate_content_notification, deliver_messages
+        from apps.accounts.models import MailingPreference
+        from apps.accounts.recipients import EMAIL, resolve_recipients
+
+        # 해당 카테고리의 즉시 알림 구독자
+        recipients = resolve_recipients(content.category_id, MailingPreference.Frequency.IMMEDIATE)
+        users = User.objects.in_bulk(
+            [recipient.user_id for recipient in recipients if EMAIL in recipient.channels]
+        )
 
-        users = User.objects.filter(
-            is_active=True,
-            mailing_preference__enabled=True,
-            mailing_preference__frequency='IMMEDIATE'
-        ).select_related('mailing_preference')
+        results = deliver_messages(
+            build_immediate_content_notification(user, content) for user in users.values()
+        )
 
         email_count = 0
-        for user in users:
-            try:
-                pref = user.mailing_preference
-
-                # 전체 카테고리 구독 또는 해당 카테고리 구독 확인
-                if pref.all_categories:
-                    should_send = True
-                else:
-                    selected_category_ids = list(pref.selected_categories.values_list('id', flat=True))
-                    should_send = content.category_id in selected_category_ids
-
-                if should_send:
-                    send_immediate_content_notification(user, content)
-                    email_count += 1
-                    self.stdout.write(self.style.SUCCESS(f"  ✓ {user.username} ({user.email})"))
-
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ✗ {user.username}: {str(e)}"))
-                continue
+        for result in results:
+            if result.sent:
+                email_count += 1
+                self.stdout.write(self.style.SUCCESS(f"  ✓ {result.recipient}"))
+            else:
+                self.stdout.write(self.style.ERROR(f"  ✗ {result.recipient}: {result.error}"))
 
         if email_count > 0:
             self.stdout.write(self.style.SUCCESS(f"📧 총 {email_count}명에게 이메일 발송 완료"))
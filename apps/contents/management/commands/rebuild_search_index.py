@@ -0,0 +1,22 @@
+"""
+검색 색인 재생성 Management Command
+
+모든 콘텐츠의 검색 문서와 검색 벡터를 다시 만듭니다.
+(색인 규칙을 변경했거나 색인이 누락된 경우 사용)
+"""
+from django.core.management.base import BaseCommand
+from apps.contents.models import Content
+from apps.contents.search import update_search_index
+
+
+class Command(BaseCommand):
+    help = '콘텐츠 검색 색인 재생성'
+
+    def handle(self, *args, **options):
+        count = 0
+        contents = Content.objects.only('pk', 'title', 'summary', 'plain_text')
+        for content in contents.iterator(chunk_size=100):
+            update_search_index(content)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"✓ {count}개 콘텐츠의 검색 색인을 재생성했습니다."))
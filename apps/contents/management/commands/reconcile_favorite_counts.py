@@ -0,0 +1,31 @@
+"""
+즐겨찾기 수 보정 Management Command
+
+Content.favorite_count가 실제 즐겨찾기 수와 다른 콘텐츠를 찾아 보정합니다.
+(관리자 화면에서 즐겨찾기를 삭제했거나 회원 탈퇴로 즐겨찾기가 삭제된 경우 등)
+"""
+from django.core.management.base import BaseCommand
+from apps.contents.favorite_utils import reconcile_favorite_counts
+
+
+class Command(BaseCommand):
+    help = '콘텐츠 즐겨찾기 수 보정'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='보정하지 않고 대상만 출력'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        drifted = reconcile_favorite_counts(dry_run=dry_run)
+
+        for row in drifted:
+            self.stdout.write(f"  - {row['slug']}: {row['favorite_count']} → {row['actual']}")
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"보정 대상 {len(drifted)}개 (dry-run)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✓ {len(drifted)}개 콘텐츠의 즐겨찾기 수를 보정했습니다."))
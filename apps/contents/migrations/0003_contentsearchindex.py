@@ -0,0 +1,153 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:27
+
+import re
+from html.parser import HTMLParser
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+import django.db.models.deletion
+
+
+POSTGRES_INDEX_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX content_search_vector_gin ON content_search_index USING gin (search_vector)',
+    'CREATE INDEX content_search_document_trgm ON content_search_index USING gin (document gin_trgm_ops)',
+]
+
+POSTGRES_INDEX_REVERSE_SQL = [
+    'DROP INDEX IF EXISTS content_search_document_trgm',
+    'DROP INDEX IF EXISTS content_search_vector_gin',
+]
+
+
+def create_postgres_indexes(apps, schema_editor):
+    """GIN 색인은 PostgreSQL에서만 생성"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in POSTGRES_INDEX_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in POSTGRES_INDEX_REVERSE_SQL:
+        schema_editor.execute(sql)
+
+
+# 이 마이그레이션 시점의 색인 규칙 (apps.contents.search가 바뀌어도 결과가 달라지지 않도록 복사)
+SEARCH_CONFIG = 'simple'
+MAX_BODY_CHARS = 100000
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+
+class _TextExtractor(HTMLParser):
+    """HTML에서 화면에 표시되는 텍스트만 추출"""
+
+    SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    if not html:
+        return ''
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return ' '.join(' '.join(extractor.parts).split())
+
+
+def tokenize(text):
+    """색인용 토큰 (한글 단어는 원형과 2-gram을 함께 사용)"""
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        tokens.append(word)
+        if HANGUL_RE.search(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def build_index_values(title, summary, tag_names, html):
+    """검색 문서와 가중치별 색인 텍스트"""
+    body = html_to_text(html)[:MAX_BODY_CHARS]
+    tags = ' '.join(tag_names)
+
+    document = ' '.join(part for part in [title, summary, tags, body] if part).lower()
+    weighted = {
+        'A': ' '.join(tokenize(title)),
+        'B': ' '.join(tokenize(f'{summary} {tags}')),
+        'D': ' '.join(tokenize(body)),
+    }
+    return document, weighted
+
+
+def build_search_vector(weighted):
+    vector = None
+    for weight, text in weighted.items():
+        part = SearchVector(Value(text), config=SEARCH_CONFIG, weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def build_search_index(apps, schema_editor):
+    """기존 콘텐츠의 검색 색인 생성"""
+    Content = apps.get_model('contents', 'Content')
+    ContentSearchIndex = apps.get_model('contents', 'ContentSearchIndex')
+    is_postgres = schema_editor.connection.vendor == 'postgresql'
+
+    for content in Content.objects.prefetch_related('tags').iterator(chunk_size=100):
+        document, weighted = build_index_values(
+            content.title,
+            content.summary,
+            [tag.name for tag in content.tags.all()],
+            content.content_html,
+        )
+        ContentSearchIndex.objects.create(content=content, document=document)
+        if is_postgres:
+            ContentSearchIndex.objects.filter(content=content).update(
+                search_vector=build_search_vector(weighted)
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0002_remove_category_parent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentSearchIndex',
+            fields=[
+                ('content', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_index', serialize=False, to='contents.content', verbose_name='콘텐츠')),
+                ('document', models.TextField(blank=True, verbose_name='검색 문서')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True, verbose_name='검색 벡터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='색인일')),
+            ],
+            options={
+                'verbose_name': '콘텐츠 검색 색인',
+                'verbose_name_plural': '콘텐츠 검색 색인 목록',
+                'db_table': 'content_search_index',
+            },
+        ),
+        migrations.RunPython(create_postgres_indexes, drop_postgres_indexes),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:35
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_favorite_count(apps, schema_editor):
+    """기존 즐겨찾기 수 채우기"""
+    Content = apps.get_model('contents', 'Content')
+    Favorite = apps.get_model('contents', 'Favorite')
+
+    counts = Favorite.objects.filter(
+        content=OuterRef('pk')
+    ).order_by().values('content').annotate(
+        count=Count('pk')
+    ).values('count')
+    Content.objects.update(
+        favorite_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0003_contentsearchindex'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='favorite_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='즐겨찾기 수'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['-favorite_count'], name='contents_favorit_190589_idx'),
+        ),
+        migrations.RunPython(backfill_favorite_count, migrations.RunPython.noop),
+    ]
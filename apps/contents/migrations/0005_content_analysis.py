@@ -0,0 +1,120 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:36
+
+import math
+from html.parser import HTMLParser
+from django.db import migrations, models
+
+
+# 이 마이그레이션 시점의 분석 규칙 (apps.contents.analysis/search가 바뀌어도 결과가 달라지지 않도록 복사)
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+WORDS_PER_MINUTE = 200
+
+
+class ContentAnalyzer(HTMLParser):
+    """화면에 표시되는 텍스트와 제목 태그(h1~h6) 목차 추출"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.toc = []
+        self._skip_depth = 0
+        self._heading = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        if tag in HEADING_TAGS and self._heading is None:
+            self._heading = {
+                'level': int(tag[1]),
+                'id': dict(attrs).get('id') or '',
+                'parts': [],
+            }
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        if tag in HEADING_TAGS and self._heading is not None:
+            text = ' '.join(' '.join(self._heading['parts']).split())
+            if text:
+                self.toc.append({
+                    'level': self._heading['level'],
+                    'text': text,
+                    'id': self._heading['id'],
+                })
+            self._heading = None
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+            if self._heading is not None:
+                self._heading['parts'].append(data)
+
+
+def analyze_html(html):
+    analyzer = ContentAnalyzer()
+    if html:
+        analyzer.feed(html)
+        analyzer.close()
+
+    words = ' '.join(analyzer.parts).split()
+    return {
+        'plain_text': ' '.join(words),
+        'toc': analyzer.toc,
+        'word_count': len(words),
+        'char_count': sum(len(word) for word in words),
+        'reading_time': math.ceil(len(words) / WORDS_PER_MINUTE),
+    }
+
+
+def analyze_contents(apps, schema_editor):
+    """기존 콘텐츠의 본문 분석 필드 채우기"""
+    Content = apps.get_model('contents', 'Content')
+    fields = ['plain_text', 'toc', 'word_count', 'char_count', 'reading_time']
+
+    batch = []
+    for content in Content.objects.only('pk', 'content_html').iterator(chunk_size=100):
+        for name, value in analyze_html(content.content_html).items():
+            setattr(content, name, value)
+        batch.append(content)
+        if len(batch) >= 100:
+            Content.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        Content.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0004_content_favorite_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='char_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='글자 수 (공백 제외)'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='plain_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='본문 텍스트'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='본문 분량으로 계산한 읽기 시간 (분)', verbose_name='읽기 시간'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='toc',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='목차'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='단어 수'),
+        ),
+        migrations.RunPython(analyze_contents, migrations.RunPython.noop),
+    ]
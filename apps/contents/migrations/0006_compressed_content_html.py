@@ -0,0 +1,108 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:40
+
+import apps.common.fields
+from django.db import migrations, models
+
+BATCH_SIZE = 100
+
+
+def copy_content_html(apps, schema_editor, source, target):
+    """content_html 컬럼 간 복사 (CompressedTextField에 저장하면 gzip으로 압축됨)"""
+    from apps.common.fields import brotli_compress
+
+    for model_name in ('Content', 'ContentVersion'):
+        model = apps.get_model('contents', model_name)
+        fields = [target]
+        if model_name == 'Content' and source == 'content_html':
+            fields.append('content_html_br')
+
+        batch = []
+        for obj in model.objects.only('pk', source).iterator(chunk_size=BATCH_SIZE):
+            html = getattr(obj, source)
+            setattr(obj, target, html)
+            if 'content_html_br' in fields:
+                obj.content_html_br = brotli_compress(html)
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, fields)
+
+
+def compress_content_html(apps, schema_editor):
+    copy_content_html(apps, schema_editor, 'content_html', 'content_html_compressed')
+
+
+def decompress_content_html(apps, schema_editor):
+    copy_content_html(apps, schema_editor, 'content_html_compressed', 'content_html')
+
+
+class Migration(migrations.Migration):
+    """
+    content_html을 gzip 압축 컬럼(bytea)으로 변경
+
+    text → bytea 형 변환은 압축을 거치지 않으므로
+    새 컬럼에 압축해 복사한 뒤 기존 컬럼을 삭제하고 이름을 바꾼다.
+    """
+
+    dependencies = [
+        ('contents', '0005_content_analysis'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='content_html_br',
+            field=models.BinaryField(blank=True, null=True, verbose_name='콘텐츠 HTML (brotli)'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='content_html_compressed',
+            field=apps.common.fields.CompressedTextField(null=True, verbose_name='콘텐츠 HTML'),
+        ),
+        migrations.AddField(
+            model_name='contentversion',
+            name='content_html_compressed',
+            field=apps.common.fields.CompressedTextField(null=True, verbose_name='콘텐츠 HTML'),
+        ),
+        migrations.AlterField(
+            model_name='content',
+            name='content_html',
+            field=models.TextField(null=True, verbose_name='콘텐츠 HTML'),
+        ),
+        migrations.AlterField(
+            model_name='contentversion',
+            name='content_html',
+            field=models.TextField(null=True, verbose_name='콘텐츠 HTML'),
+        ),
+        migrations.RunPython(compress_content_html, decompress_content_html),
+        migrations.RemoveField(
+            model_name='content',
+            name='content_html',
+        ),
+        migrations.RemoveField(
+            model_name='contentversion',
+            name='content_html',
+        ),
+        migrations.RenameField(
+            model_name='content',
+            old_name='content_html_compressed',
+            new_name='content_html',
+        ),
+        migrations.RenameField(
+            model_name='contentversion',
+            old_name='content_html_compressed',
+            new_name='content_html',
+        ),
+        migrations.AlterField(
+            model_name='content',
+            name='content_html',
+            field=apps.common.fields.CompressedTextField(verbose_name='콘텐츠 HTML'),
+        ),
+        migrations.AlterField(
+            model_name='contentversion',
+            name='content_html',
+            field=apps.common.fields.CompressedTextField(verbose_name='콘텐츠 HTML'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:42
+
+import apps.common.fields
+from django.db import migrations, models
+
+
+def number_versions(apps, schema_editor):
+    """기존 버전에 콘텐츠별 순번과 본문 길이 채우기 (모두 스냅샷으로 유지)"""
+    ContentVersion = apps.get_model('contents', 'ContentVersion')
+
+    batch = []
+    sequences = {}
+    versions = ContentVersion.objects.only('pk', 'content_id', 'content_html').order_by(
+        'content_id', 'created_at', 'pk'
+    )
+    for version in versions.iterator(chunk_size=100):
+        sequences[version.content_id] = sequences.get(version.content_id, 0) + 1
+        version.sequence = sequences[version.content_id]
+        version.size = len(version.content_html)
+        batch.append(version)
+        if len(batch) >= 100:
+            ContentVersion.objects.bulk_update(batch, ['sequence', 'size'])
+            batch = []
+    if batch:
+        ContentVersion.objects.bulk_update(batch, ['sequence', 'size'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0006_compressed_content_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentversion',
+            name='delta',
+            field=models.JSONField(blank=True, null=True, verbose_name='변경분'),
+        ),
+        migrations.AddField(
+            model_name='contentversion',
+            name='is_snapshot',
+            field=models.BooleanField(default=True, verbose_name='스냅샷 여부'),
+        ),
+        migrations.AddField(
+            model_name='contentversion',
+            name='sequence',
+            field=models.PositiveIntegerField(default=0, verbose_name='순번'),
+        ),
+        migrations.AddField(
+            model_name='contentversion',
+            name='size',
+            field=models.PositiveIntegerField(default=0, verbose_name='본문 길이'),
+        ),
+        migrations.AlterField(
+            model_name='contentversion',
+            name='content_html',
+            field=apps.common.fields.CompressedTextField(blank=True, verbose_name='콘텐츠 HTML'),
+        ),
+        migrations.RunPython(number_versions, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='contentversion',
+            unique_together={('content', 'version'), ('content', 'sequence')},
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Q
+
+
+def record_existing_publications(apps, schema_editor):
+    """이미 발행된 콘텐츠는 발송 완료로 기록 (다시 공개해도 알림을 보내지 않도록)"""
+    Content = apps.get_model('contents', 'Content')
+    ContentPublishEvent = apps.get_model('contents', 'ContentPublishEvent')
+
+    content_ids = Content.objects.filter(
+        Q(status='PUBLISHED') | Q(published_at__isnull=False)
+    ).values_list('pk', flat=True)
+
+    batch = []
+    for content_id in content_ids.iterator(chunk_size=500):
+        batch.append(ContentPublishEvent(content_id=content_id, status='COMPLETED'))
+        if len(batch) >= 500:
+            ContentPublishEvent.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        ContentPublishEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0007_contentversion_delta'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentPublishEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('DISPATCHED', '발송 중'), ('COMPLETED', '완료')], default='PENDING', max_length=10, verbose_name='상태')),
+                ('recipient_count', models.PositiveIntegerField(default=0, verbose_name='대상자 수')),
+                ('chunk_count', models.PositiveIntegerField(default=0, verbose_name='청크 수')),
+                ('completed_chunks', models.PositiveIntegerField(default=0, verbose_name='완료된 청크 수')),
+                ('sent_count', models.PositiveIntegerField(default=0, verbose_name='발송 성공')),
+                ('failed_count', models.PositiveIntegerField(default=0, verbose_name='발송 실패')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='발행일')),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 시작일')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 완료일')),
+                ('content', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='publish_event', to='contents.content', verbose_name='콘텐츠')),
+            ],
+            options={
+                'verbose_name': '콘텐츠 발행 이벤트',
+                'verbose_name_plural': '콘텐츠 발행 이벤트 목록',
+                'db_table': 'content_publish_events',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='content_pub_status_86918b_idx')],
+            },
+        ),
+        migrations.RunPython(record_existing_publications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.18 on 2026-10-18 11:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0008_contentpublishevent'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='favorite',
+            index=models.Index(fields=['created_at'], name='favorites_created_b09698_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0009_favorite_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='trending_score',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='인기 점수'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['-trending_score'], name='contents_trendin_83af13_idx'),
+        ),
+    ]
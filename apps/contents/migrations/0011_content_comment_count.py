@@ -0,0 +1,18 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0010_content_trending_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='댓글 수'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.18 on 2026-10-18 13:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0011_content_comment_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentPublishChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField(verbose_name='순번')),
+                ('user_ids', models.JSONField(default=list, verbose_name='대상 사용자 ID 목록')),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('SENDING', '발송 중'), ('SENT', '발송 완료')], default='PENDING', max_length=10, verbose_name='상태')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 시작일')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='contents.contentpublishevent', verbose_name='발행 이벤트')),
+            ],
+            options={
+                'verbose_name': '콘텐츠 발행 알림 청크',
+                'verbose_name_plural': '콘텐츠 발행 알림 청크 목록',
+                'db_table': 'content_publish_chunks',
+                'ordering': ['event', 'index'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='contentpublishchunk',
+            constraint=models.UniqueConstraint(fields=('event', 'index'), name='unique_publish_chunk_index'),
+        ),
+    ]
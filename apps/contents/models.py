@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.utils.text import slugify
+from apps.common.fields import CompressedTextField, brotli_compress
 
 
 class Category(models.Model):
@@ -103,10 +105,52 @@ class Content(models.Model):
         verbose_name='요약'
     )
 
-    content_html = models.TextField(
+    # gzip으로 압축 저장 (저장된 바이트를 gzip 응답으로 그대로 사용)
+    content_html = CompressedTextField(
         verbose_name='콘텐츠 HTML'
     )
 
+    # brotli 변형 (저장 시 생성, brotli 패키지가 없으면 null)
+    content_html_br = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='콘텐츠 HTML (brotli)'
+    )
+
+    # 본문 분석 결과 (저장 시 content_html로 계산, analysis 참고)
+    plain_text = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name='본문 텍스트'
+    )
+
+    toc = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name='목차'
+    )
+
+    word_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='단어 수'
+    )
+
+    char_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='글자 수 (공백 제외)'
+    )
+
+    reading_time = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text='본문 분량으로 계산한 읽기 시간 (분)',
+        verbose_name='읽기 시간'
+    )
+
     category = models.ForeignKey(
         Category,
         on_delete=models.PROTECT,
@@ -153,6 +197,26 @@ class Content(models.Model):
         verbose_name='조회수'
     )
 
+    # 즐겨찾기 등록/해제 시 F()로 증감 (reconcile_favorite_counts로 보정)
+    favorite_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='즐겨찾기 수'
+    )
+
+    # 댓글 작성/삭제/숨김 시 F()로 증감 (reconcile_comment_counts로 보정)
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='댓글 수'
+    )
+
+    # 시간 감쇠 조회수의 로그 값 (조회수 반영 시 갱신, analytics.trending 참고)
+    trending_score = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='인기 점수'
+    )
+
     estimated_time = models.PositiveIntegerField(
         default=0,
         help_text='예상 학습 시간 (분)',
@@ -224,19 +288,109 @@ class Content(models.Model):
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['category', '-created_at']),
             models.Index(fields=['slug']),
+            models.Index(fields=['-favorite_count']),
+            models.Index(fields=['-trending_score']),
         ]
 
     def __str__(self):
         return self.title
 
+    # 저장과 별도로 갱신하는 카운터 (관리자/API 수정 시 읽어 둔 이전 값으로 덮어쓰지 않음)
+    COUNTER_FIELDS = ('view_count', 'favorite_count', 'comment_count', 'trending_score')
+
+    # content_html에서 계산하는 필드
+    DERIVED_FIELDS = ('content_html_br', 'plain_text', 'toc', 'word_count', 'char_count', 'reading_time')
+
+    def update_derived_fields(self):
+        """content_html로 brotli 변형, 본문 텍스트, 목차, 분량 필드 갱신"""
+        from .analysis import analyze_html
+
+        self.content_html_br = brotli_compress(self.content_html)
+        for name, value in analyze_html(self.content_html).items():
+            setattr(self, name, value)
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title, allow_unicode=True)
+
+        # content_html이 저장될 때만 계산 (update_fields에 없거나 로드되지 않았으면 생략)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            if 'content_html' not in self.get_deferred_fields():
+                self.update_derived_fields()
+        elif 'content_html' in update_fields:
+            self.update_derived_fields()
+            kwargs['update_fields'] = {*update_fields, *self.DERIVED_FIELDS}
         super().save(*args, **kwargs)
 
+    def save_without_counters(self):
+        """
+        카운터 필드를 제외하고 저장 (관리자/API 수정 경로)
+
+        폼을 여는 동안 늘어난 조회수/즐겨찾기 수/댓글 수를 읽어 둔 값으로 되돌리지 않는다.
+        새 객체는 그대로 저장한다.
+        """
+        if self._state.adding:
+            self.save()
+            return
+        deferred = self.get_deferred_fields()
+        self.save(update_fields=[
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.name not in self.COUNTER_FIELDS
+            and field.attname not in deferred
+        ])
+
+
+class ContentSearchIndex(models.Model):
+    """
+    콘텐츠 검색 색인
+
+    제목, 요약, 태그, 본문 텍스트로 만든 검색 문서를 콘텐츠 저장 시 갱신한다.
+    PostgreSQL에서는 search_vector(GIN)와 document(pg_trgm GIN) 색인을 사용한다.
+    (색인은 마이그레이션에서 PostgreSQL일 때만 생성)
+    """
+
+    content = models.OneToOneField(
+        Content,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_index',
+        verbose_name='콘텐츠'
+    )
+
+    document = models.TextField(
+        blank=True,
+        verbose_name='검색 문서'
+    )
+
+    search_vector = SearchVectorField(
+        null=True,
+        verbose_name='검색 벡터'
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='색인일'
+    )
+
+    class Meta:
+        db_table = 'content_search_index'
+        verbose_name = '콘텐츠 검색 색인'
+        verbose_name_plural = '콘텐츠 검색 색인 목록'
+
+    def __str__(self):
+        return f"{self.content_id} 검색 색인"
+
 
 class ContentVersion(models.Model):
-    """콘텐츠 버전 관리"""
+    """
+    콘텐츠 버전 관리
+
+    본문은 스냅샷(전체 본문) 또는 이전 버전과의 델타로 저장한다.
+    버전 생성과 본문 복원은 versioning 모듈을 사용한다.
+    """
 
     content = models.ForeignKey(
         Content,
@@ -250,10 +404,35 @@ class ContentVersion(models.Model):
         verbose_name='버전'
     )
 
-    content_html = models.TextField(
+    # 콘텐츠별 버전 순번 (1부터)
+    sequence = models.PositiveIntegerField(
+        default=0,
+        verbose_name='순번'
+    )
+
+    is_snapshot = models.BooleanField(
+        default=True,
+        verbose_name='스냅샷 여부'
+    )
+
+    # 스냅샷 본문 (델타 버전은 비어 있음)
+    content_html = CompressedTextField(
+        blank=True,
         verbose_name='콘텐츠 HTML'
     )
 
+    # 이전 버전과의 차이 (스냅샷은 null)
+    delta = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='변경분'
+    )
+
+    size = models.PositiveIntegerField(
+        default=0,
+        verbose_name='본문 길이'
+    )
+
     change_log = models.TextField(
         verbose_name='변경 내역'
     )
@@ -275,11 +454,159 @@ class ContentVersion(models.Model):
         verbose_name = '콘텐츠 버전'
         verbose_name_plural = '콘텐츠 버전 목록'
         ordering = ['-created_at']
-        unique_together = ['content', 'version']
+        unique_together = [
+            ['content', 'version'],
+            ['content', 'sequence'],
+        ]
 
     def __str__(self):
         return f"{self.content.title} v{self.version}"
 
+    @property
+    def html(self):
+        """버전 본문 (스냅샷과 델타로 복원)"""
+        from .versioning import get_version_html
+        return get_version_html(self)
+
+
+class ContentPublishEvent(models.Model):
+    """
+    콘텐츠 발행 이벤트
+
+    콘텐츠가 임시저장에서 공개로 바뀔 때 저장과 같은 트랜잭션에서 기록하고,
+    커밋 후 Celery 작업이 즉시 알림 구독자를 청크로 나눠 발송한다.
+    콘텐츠당 하나만 생성되므로 다시 공개해도 알림이 중복 발송되지 않는다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', '대기'
+        DISPATCHED = 'DISPATCHED', '발송 중'
+        COMPLETED = 'COMPLETED', '완료'
+
+    content = models.OneToOneField(
+        Content,
+        on_delete=models.CASCADE,
+        related_name='publish_event',
+        verbose_name='콘텐츠'
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='상태'
+    )
+
+    recipient_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='대상자 수'
+    )
+
+    chunk_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='청크 수'
+    )
+
+    completed_chunks = models.PositiveIntegerField(
+        default=0,
+        verbose_name='완료된 청크 수'
+    )
+
+    sent_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='발송 성공'
+    )
+
+    failed_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='발송 실패'
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='발행일'
+    )
+
+    dispatched_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='발송 시작일'
+    )
+
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='발송 완료일'
+    )
+
+    class Meta:
+        db_table = 'content_publish_events'
+        verbose_name = '콘텐츠 발행 이벤트'
+        verbose_name_plural = '콘텐츠 발행 이벤트 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.content_id} 발행 ({self.get_status_display()})"
+
+
+class ContentPublishChunk(models.Model):
+    """
+    발행 이벤트 알림 청크 (발송 작업 단위)
+
+    청크마다 대상자와 발송 상태를 기록해 두므로 멈춘 이벤트를 다시 등록해도
+    이미 보낸 청크는 다시 보내지 않는다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', '대기'
+        SENDING = 'SENDING', '발송 중'
+        SENT = 'SENT', '발송 완료'
+
+    event = models.ForeignKey(
+        ContentPublishEvent,
+        on_delete=models.CASCADE,
+        related_name='chunks',
+        verbose_name='발행 이벤트'
+    )
+
+    index = models.PositiveIntegerField(
+        verbose_name='순번'
+    )
+
+    user_ids = models.JSONField(
+        default=list,
+        verbose_name='대상 사용자 ID 목록'
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='상태'
+    )
+
+    # 발송 작업이 발송 중 상태로 가져간 시각 (멈춘 청크 복구 기준)
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='발송 시작일'
+    )
+
+    class Meta:
+        db_table = 'content_publish_chunks'
+        verbose_name = '콘텐츠 발행 알림 청크'
+        verbose_name_plural = '콘텐츠 발행 알림 청크 목록'
+        ordering = ['event', 'index']
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'index'], name='unique_publish_chunk_index'),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} 청크 {self.index} ({self.get_status_display()})"
+
 
 class Favorite(models.Model):
     """즐겨찾기"""
@@ -309,6 +636,9 @@ class Favorite(models.Model):
         verbose_name_plural = '즐겨찾기 목록'
         ordering = ['-created_at']
         unique_together = ['user', 'content']
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.content.title}"
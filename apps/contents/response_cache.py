@@ -0,0 +1,136 @@
+"""
+비회원 응답 캐시
+
+비회원 GET 응답 데이터를 공유 캐시(Redis)에 저장해 모든 인스턴스가 함께 사용한다.
+
+캐시 키에는 응답이 의존하는 그룹의 세대(generation) 값이 포함된다.
+콘텐츠/카테고리/태그가 변경되면 시그널에서 관련 그룹의 세대를 새 값으로
+바꾸므로, 이전 세대의 항목은 더 이상 조회되지 않고 만료 시간 후 사라진다.
+
+그룹:
+- contents: 콘텐츠 목록 (콘텐츠가 하나라도 바뀌면 갱신)
+- content:<slug>: 콘텐츠 상세 (해당 콘텐츠가 바뀌면 갱신)
+- categories: 카테고리 (콘텐츠 응답에 카테고리명이 포함되므로 콘텐츠 응답도 의존)
+- tags: 태그 (콘텐츠 응답에 태그명이 포함되므로 콘텐츠 응답도 의존)
+
+무효화가 모든 프로세스에 보여야 하므로 공유 캐시(CACHE_IS_SHARED)에서만 응답을 캐시한다.
+"""
+import hashlib
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+KEY_PREFIX = 'response'
+
+RESPONSE_CACHE_TIMEOUT = 60 * 10
+
+
+def _generation_key(group):
+    return f'{KEY_PREFIX}:generation:{group}'
+
+
+def _new_generation():
+    # 캐시가 비워진 뒤에도 이전 값과 겹치지 않도록 임의 값 사용
+    return uuid.uuid4().hex[:12]
+
+
+def get_generations(groups):
+    """그룹별 현재 세대 값 (없으면 새로 생성)"""
+    keys = {group: _generation_key(group) for group in groups}
+    values = cache.get_many(list(keys.values()))
+
+    generations = []
+    for group, key in keys.items():
+        generation = values.get(key)
+        if generation is None:
+            cache.add(key, _new_generation(), timeout=None)
+            generation = cache.get(key)
+        generations.append(generation)
+    return generations
+
+
+def invalidate(*groups):
+    """그룹의 세대를 바꿔 해당 그룹에 의존하는 캐시 항목을 무효화"""
+    cache.set_many(
+        {_generation_key(group): _new_generation() for group in groups},
+        timeout=None
+    )
+
+
+def content_detail_group(slug):
+    return f'content:{slug}'
+
+
+def normalize_query_params(query_params):
+    """쿼리 파라미터를 순서와 무관한 문자열로 정규화 (빈 값 제외)"""
+    items = []
+    for key in sorted(query_params.keys()):
+        values = sorted(value for value in query_params.getlist(key) if value != '')
+        if values:
+            items.append(f'{key}={",".join(values)}')
+    return '&'.join(items)
+
+
+class AnonymousResponseCacheMixin:
+    """
+    비회원 GET 응답을 공유 캐시에 저장하는 ViewSet Mixin
+
+    response_cache_groups 또는 get_response_cache_groups()로
+    응답이 의존하는 그룹을 지정한다.
+    """
+
+    response_cache_groups = ()
+    response_cache_timeout = RESPONSE_CACHE_TIMEOUT
+
+    def get_response_cache_groups(self):
+        return self.response_cache_groups
+
+    def should_cache_response(self):
+        request = self.request
+        return (
+            settings.CACHE_IS_SHARED
+            and request.method == 'GET'
+            and not request.user.is_authenticated
+        )
+
+    def get_response_cache_key(self):
+        request = self.request
+        generations = get_generations(self.get_response_cache_groups())
+        lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field, '')
+
+        # 페이지네이션 링크가 절대 URL이므로 호스트도 키에 포함
+        raw_key = '|'.join([
+            request.get_host(),
+            request.path,
+            str(lookup),
+            normalize_query_params(request.query_params),
+            *generations,
+        ])
+        digest = hashlib.md5(raw_key.encode('utf-8')).hexdigest()
+        return f'{KEY_PREFIX}:{self.basename}:{self.action}:{digest}'
+
+    def get_cached_response(self, build_response):
+        """캐시된 응답을 반환하고, 없으면 build_response()의 응답을 저장"""
+        if not self.should_cache_response():
+            return build_response()
+
+        key = self.get_response_cache_key()
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = build_response()
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout=self.response_cache_timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            lambda: super(AnonymousResponseCacheMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            lambda: super(AnonymousResponseCacheMixin, self).retrieve(request, *args, **kwargs)
+        )
@@ -0,0 +1,173 @@
+"""
+콘텐츠 검색 색인
+
+콘텐츠마다 검색 문서(제목, 요약, 태그, 본문 텍스트)를 ContentSearchIndex에
+저장하고, PostgreSQL에서는 tsvector(GIN)와 pg_trgm(GIN) 색인으로 검색한다.
+
+한국어는 'simple' 설정의 공백 단위 토큰만으로는 조사가 붙은 단어를
+찾을 수 없으므로, 한글이 포함된 단어는 2-gram으로 분해해 색인하고
+검색어도 같은 방식으로 분해해 모든 2-gram이 포함된 문서를 찾는다.
+"""
+import re
+from html.parser import HTMLParser
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q, Value
+
+SEARCH_CONFIG = 'simple'
+
+# tsvector 크기 제한(1MB)을 넘지 않도록 본문 색인 길이를 제한
+MAX_BODY_CHARS = 100000
+
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+
+class _TextExtractor(HTMLParser):
+    """HTML에서 화면에 표시되는 텍스트만 추출"""
+
+    SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    """HTML 태그를 제거하고 공백을 정리한 텍스트"""
+    if not html:
+        return ''
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return ' '.join(' '.join(extractor.parts).split())
+
+
+def korean_ngrams(word, n=2):
+    """한글 단어를 n-gram으로 분해 (n보다 짧으면 단어 그대로)"""
+    if len(word) <= n:
+        return [word]
+    return [word[i:i + n] for i in range(len(word) - n + 1)]
+
+
+def tokenize(text):
+    """색인용 토큰 (한글 단어는 원형과 2-gram을 함께 사용)"""
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        tokens.append(word)
+        if HANGUL_RE.search(word) and len(word) > 2:
+            tokens.extend(korean_ngrams(word))
+    return tokens
+
+
+def build_index_values(title, summary, tag_names, html='', text=None):
+    """
+    검색 문서와 가중치별 색인 텍스트 생성
+
+    본문은 이미 추출한 텍스트(text)가 있으면 사용하고, 없으면 html에서 추출한다.
+
+    Returns:
+        tuple: (document, {'A': 제목, 'B': 요약/태그, 'D': 본문})
+    """
+    if text is None:
+        text = html_to_text(html)
+    body = text[:MAX_BODY_CHARS]
+    tags = ' '.join(tag_names)
+
+    document = ' '.join(part for part in [title, summary, tags, body] if part).lower()
+    weighted = {
+        'A': ' '.join(tokenize(title)),
+        'B': ' '.join(tokenize(f'{summary} {tags}')),
+        'D': ' '.join(tokenize(body)),
+    }
+    return document, weighted
+
+
+def build_search_vector(weighted):
+    """가중치별 색인 텍스트로 tsvector 표현식 생성"""
+    vector = None
+    for weight, text in weighted.items():
+        part = SearchVector(Value(text), config=SEARCH_CONFIG, weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def build_search_query(search):
+    """
+    검색어를 tsquery로 변환
+
+    한글 단어는 2-gram을 모두 포함해야 하고, 그 외 단어와 한 글자 단어는
+    접두어 일치로 검색한다. 검색 가능한 단어가 없으면 None.
+    """
+    terms = []
+    for word in WORD_RE.findall(search.lower()):
+        if HANGUL_RE.search(word) and len(word) >= 2:
+            terms.extend(f"'{gram}'" for gram in korean_ngrams(word))
+        else:
+            terms.append(f"'{word}':*")
+
+    if not terms:
+        return None
+    return SearchQuery(' & '.join(terms), config=SEARCH_CONFIG, search_type='raw')
+
+
+def update_search_index(content):
+    """콘텐츠 하나의 검색 색인 갱신 (저장 시 추출한 plain_text 사용)"""
+    from .models import ContentSearchIndex
+
+    document, weighted = build_index_values(
+        content.title,
+        content.summary,
+        list(content.tags.values_list('name', flat=True)),
+        text=content.plain_text,
+    )
+
+    ContentSearchIndex.objects.update_or_create(
+        content=content,
+        defaults={'document': document}
+    )
+
+    if connection.vendor == 'postgresql':
+        ContentSearchIndex.objects.filter(content=content).update(
+            search_vector=build_search_vector(weighted)
+        )
+
+
+def search_contents(queryset, search):
+    """
+    검색어로 콘텐츠를 필터링하고 관련도 순으로 정렬
+
+    PostgreSQL이 아닌 환경(로컬 SQLite 등)에서는 검색 문서 부분 일치로 대체한다.
+    """
+    search = search.strip()
+    if not search:
+        return queryset
+
+    # 검색 문서는 소문자로 저장되므로 대소문자 구분 LIKE로 pg_trgm 색인을 사용
+    substring_match = Q(search_index__document__contains=search.lower())
+
+    if connection.vendor != 'postgresql':
+        return queryset.filter(substring_match)
+
+    query = build_search_query(search)
+    if query is None:
+        return queryset.filter(substring_match)
+
+    return queryset.filter(
+        Q(search_index__search_vector=query) | substring_match
+    ).annotate(
+        search_rank=SearchRank(F('search_index__search_vector'), query)
+    ).order_by('-search_rank', '-created_at')
@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from apps.common.fieldsets import SparseFieldsetSerializerMixin
 from .models import Category, Tag, Content, ContentVersion, Favorite
+from .favorite_utils import get_favorite_resolver
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -18,7 +20,16 @@ class TagSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'slug']
 
 
-class ContentListSerializer(serializers.ModelSerializer):
+class FavoritePrimingListSerializer(serializers.ListSerializer):
+    """목록 직렬화 전에 페이지 전체의 즐겨찾기 여부를 한 번에 조회"""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        get_favorite_resolver(self.context).prime(item.pk for item in items)
+        return super().to_representation(items)
+
+
+class ContentListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """콘텐츠 목록용 Serializer"""
 
     category_name = serializers.CharField(source='category.name', read_only=True)
@@ -32,25 +43,22 @@ class ContentListSerializer(serializers.ModelSerializer):
             'id', 'title', 'slug', 'summary', 'thumbnail',
             'category', 'category_name', 'tags',
             'author', 'author_name', 'status', 'version',
-            'view_count', 'estimated_time', 'difficulty',
+            'view_count', 'comment_count', 'estimated_time', 'reading_time', 'difficulty',
             'created_at', 'updated_at', 'is_favorited'
         ]
+        list_serializer_class = FavoritePrimingListSerializer
 
     def get_is_favorited(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return Favorite.objects.filter(user=request.user, content=obj).exists()
-        return False
+        return get_favorite_resolver(self.context).is_favorited(obj)
 
 
-class ContentDetailSerializer(serializers.ModelSerializer):
+class ContentDetailSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """콘텐츠 상세용 Serializer"""
 
     category_name = serializers.CharField(source='category.name', read_only=True)
     author_name = serializers.CharField(source='author.username', read_only=True)
     tags = TagSerializer(many=True, read_only=True)
     is_favorited = serializers.SerializerMethodField()
-    favorite_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Content
@@ -59,20 +67,15 @@ class ContentDetailSerializer(serializers.ModelSerializer):
             'category', 'category_name', 'tags',
             'author', 'author_name', 'status', 'version',
             'thumbnail', 'view_count', 'estimated_time', 'difficulty',
+            'reading_time', 'word_count', 'char_count', 'toc',
             'prerequisites', 'learning_objectives',
             'meta_description', 'meta_keywords',
             'created_at', 'updated_at', 'published_at',
-            'is_favorited', 'favorite_count'
+            'is_favorited', 'favorite_count', 'comment_count'
         ]
 
     def get_is_favorited(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return Favorite.objects.filter(user=request.user, content=obj).exists()
-        return False
-
-    def get_favorite_count(self, obj):
-        return obj.favorited_by.count()
+        return get_favorite_resolver(self.context).is_favorited(obj)
 
 
 class ContentCreateUpdateSerializer(serializers.ModelSerializer):
@@ -94,16 +97,37 @@ class ContentCreateUpdateSerializer(serializers.ModelSerializer):
         content.tags.set(tags)
         return content
 
+    def update(self, instance, validated_data):
+        tags = validated_data.pop('tags', None)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save_without_counters()
+        if tags is not None:
+            instance.tags.set(tags)
+        return instance
+
 
 class ContentVersionSerializer(serializers.ModelSerializer):
-    """콘텐츠 버전 Serializer"""
+    """콘텐츠 버전 목록용 Serializer (본문 제외)"""
 
     created_by_name = serializers.CharField(source='created_by.username', read_only=True)
 
     class Meta:
         model = ContentVersion
-        fields = ['id', 'content', 'version', 'content_html', 'change_log', 'created_by', 'created_by_name', 'created_at']
-        read_only_fields = ['created_at', 'created_by']
+        fields = [
+            'id', 'content', 'version', 'sequence', 'size',
+            'change_log', 'created_by', 'created_by_name', 'created_at'
+        ]
+        read_only_fields = ['sequence', 'size', 'created_at', 'created_by']
+
+
+class ContentVersionDetailSerializer(ContentVersionSerializer):
+    """콘텐츠 버전 상세용 Serializer (스냅샷과 델타로 복원한 본문 포함)"""
+
+    content_html = serializers.CharField(source='html', read_only=True)
+
+    class Meta(ContentVersionSerializer.Meta):
+        fields = ContentVersionSerializer.Meta.fields + ['content_html']
 
 
 class FavoriteContentSerializer(serializers.ModelSerializer):
@@ -120,7 +144,7 @@ class FavoriteContentSerializer(serializers.ModelSerializer):
             'id', 'title', 'slug', 'summary', 'thumbnail',
             'category', 'category_name', 'tags',
             'author', 'author_name', 'status', 'version',
-            'view_count', 'estimated_time', 'difficulty',
+            'view_count', 'estimated_time', 'reading_time', 'difficulty',
             'created_at', 'updated_at', 'is_favorited'
         ]
 
@@ -1,79 +1,164 @@
 """
 콘텐츠 관련 시그널
 """
-from django.db.models.signals import post_save
+import logging
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
 from django.dispatch import receiver
-from .models import Content
+from apps.common.view_counter import view_counts_flushed
+from .models import Category, Content, ContentPublishEvent, Tag
+from .search import update_search_index
+from . import response_cache
+
+logger = logging.getLogger(__name__)
+
+# 검색 문서에 포함되는 필드 (update_fields에 없으면 색인 갱신 생략)
+SEARCH_INDEX_FIELDS = {'title', 'summary', 'content_html'}
+
+
+def reindex_contents(content_ids):
+    """여러 콘텐츠의 검색 색인 갱신"""
+    contents = Content.objects.filter(pk__in=content_ids).only('pk', 'title', 'summary', 'plain_text')
+    for content in contents:
+        update_search_index(content)
 
 
 @receiver(post_save, sender=Content)
-def send_immediate_notifications(sender, instance, created, **kwargs):
+def update_content_search_index(sender, instance, update_fields=None, **kwargs):
+    """콘텐츠 저장 시 검색 색인 갱신"""
+    if update_fields and not SEARCH_INDEX_FIELDS.intersection(update_fields):
+        return
+    update_search_index(instance)
+
+
+@receiver(m2m_changed, sender=Content.tags.through)
+def update_search_index_on_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """콘텐츠 태그가 변경되면 검색 색인 갱신"""
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            update_search_index(instance)
+        return
+
+    # 태그 쪽에서 변경한 경우 (instance는 Tag)
+    if action == 'pre_clear':
+        instance._search_reindex_ids = list(instance.contents.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        reindex_contents(getattr(instance, '_search_reindex_ids', []))
+    elif action in ('post_add', 'post_remove'):
+        reindex_contents(pk_set)
+
+
+@receiver(post_save, sender=Tag)
+def update_search_index_on_tag_saved(sender, instance, created, **kwargs):
+    """태그명이 바뀌면 해당 태그가 달린 콘텐츠의 검색 색인 갱신"""
+    if created:
+        return
+    reindex_contents(instance.contents.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Tag)
+def update_search_index_on_tag_deleted(sender, instance, **kwargs):
+    """태그 삭제 시 해당 태그가 달린 콘텐츠의 검색 색인 갱신 (삭제 후 실행)"""
+    content_ids = list(instance.contents.values_list('pk', flat=True))
+    transaction.on_commit(lambda: reindex_contents(content_ids))
+
+
+@receiver(pre_save, sender=Content)
+def remember_previous_state(sender, instance, **kwargs):
     """
-    새 콘텐츠가 발행되면 즉시 알림 설정한 사용자들에게 이메일 발송
+    저장 전 slug와 공개 상태 기록
+
+    - slug 변경 시 이전 주소의 캐시도 무효화
+    - 임시저장 → 공개 전환을 감지해 발행 이벤트 기록
     """
-    # 상태가 PUBLISHED로 변경되었는지 확인
-    # 이미 발행된 콘텐츠를 수정하는 경우에는 이메일을 보내지 않음
-    should_notify = False
-
-    if created and instance.status == 'PUBLISHED':
-        # 새로 생성되고 발행 상태인 경우
-        should_notify = True
-    elif not created and instance.status == 'PUBLISHED':
-        # 기존 콘텐츠가 수정된 경우, published_at이 방금 설정되었는지 확인
-        # (즉, DRAFT -> PUBLISHED로 변경된 경우)
-        from django.utils import timezone
-        from datetime import timedelta
-
-        # published_at이 최근 10초 이내에 설정되었다면 새로 발행된 것으로 간주
-        if instance.published_at:
-            time_diff = timezone.now() - instance.published_at
-            if time_diff < timedelta(seconds=10):
-                should_notify = True
-
-    if not should_notify:
+    instance._previous_slug = None
+    instance._previous_status = None
+    if instance.pk:
+        previous = Content.objects.filter(pk=instance.pk).values('slug', 'status').first()
+        if previous:
+            instance._previous_slug = previous['slug']
+            instance._previous_status = previous['status']
+
+
+@receiver(post_save, sender=Content)
+@receiver(post_delete, sender=Content)
+def invalidate_content_response_cache(sender, instance, **kwargs):
+    """콘텐츠 저장/삭제 시 목록 캐시와 해당 콘텐츠 상세 캐시 무효화"""
+    groups = {'contents', response_cache.content_detail_group(instance.slug)}
+    previous_slug = getattr(instance, '_previous_slug', None)
+    if previous_slug:
+        groups.add(response_cache.content_detail_group(previous_slug))
+    response_cache.invalidate(*groups)
+
+
+@receiver(m2m_changed, sender=Content.tags.through)
+def invalidate_response_cache_on_tags_changed(sender, instance, action, reverse, **kwargs):
+    """콘텐츠 태그가 변경되면 관련 캐시 무효화"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        # 태그 쪽에서 변경한 경우 태그에 의존하는 모든 콘텐츠 응답 무효화
+        response_cache.invalidate('contents', 'tags')
+    else:
+        response_cache.invalidate('contents', response_cache.content_detail_group(instance.slug))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_response_cache(sender, instance, **kwargs):
+    """카테고리 변경 시 카테고리 및 콘텐츠 응답 캐시 무효화"""
+    response_cache.invalidate('categories')
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_response_cache(sender, instance, **kwargs):
+    """태그 변경 시 태그 및 콘텐츠 응답 캐시 무효화"""
+    response_cache.invalidate('tags')
+
+
+@receiver(view_counts_flushed, sender=Content)
+def invalidate_detail_cache_on_view_counts_flushed(sender, pks, **kwargs):
+    """
+    조회수가 DB에 반영되면 상세 캐시 무효화
+
+    상세 캐시에는 DB 조회수가 저장되고 응답 시 반영 대기분을 더하므로,
+    반영 후에도 이전 값을 사용하면 조회수가 줄어든 것처럼 보인다.
+    """
+    slugs = Content.objects.filter(pk__in=pks).values_list('slug', flat=True)
+    groups = [response_cache.content_detail_group(slug) for slug in slugs]
+    if groups:
+        response_cache.invalidate(*groups)
+
+
+def enqueue_publish_event(event_id):
+    """발행 이벤트 발송 작업 등록 (실패해도 주기 작업이 대기 중인 이벤트를 다시 등록)"""
+    from apps.accounts.tasks import dispatch_publish_event
+
+    try:
+        dispatch_publish_event.delay(event_id)
+    except Exception as e:
+        logger.error(f"[PUBLISH] 발송 작업 등록 실패 (event={event_id}): {e}")
+
+
+@receiver(post_save, sender=Content)
+def record_publish_event(sender, instance, created, **kwargs):
+    """
+    콘텐츠가 발행되면 발행 이벤트를 기록하고 커밋 후 즉시 알림 발송 작업 등록
+
+    새로 공개 상태로 생성되었거나 임시저장에서 공개로 바뀐 경우만 해당하며,
+    실제 발송은 Celery 작업이 구독자를 청크로 나눠 처리하므로 저장은 바로 끝난다.
+    """
+    if instance.status != Content.Status.PUBLISHED:
+        return
+    if not created and getattr(instance, '_previous_status', None) != Content.Status.DRAFT:
+        return
+
+    event, event_created = ContentPublishEvent.objects.get_or_create(content=instance)
+    if not event_created:
+        # 이미 알림을 보낸 콘텐츠를 다시 공개한 경우
         return
 
-    print(f"[Signal] 콘텐츠 발행 감지: {instance.title}")
-
-    from apps.accounts.models import User
-    from apps.accounts.email_utils import send_immediate_content_notification
-    from apps.accounts.kakao_message_utils import send_kakao_message_notification
-
-    # 즉시 알림을 받도록 설정한 모든 활성 사용자
-    users = User.objects.filter(
-        is_active=True,
-        mailing_preference__enabled=True,
-        mailing_preference__frequency='IMMEDIATE'
-    ).select_related('mailing_preference')
-
-    for user in users:
-        try:
-            # 카테고리 확인
-            pref = user.mailing_preference
-
-            # 전체 카테고리 구독 또는 해당 카테고리 구독 확인
-            if pref.all_categories:
-                should_send = True
-            else:
-                selected_category_ids = list(pref.selected_categories.values_list('id', flat=True))
-                should_send = instance.category_id in selected_category_ids
-
-            if should_send:
-                # 로컬 개발 환경에서는 동기적으로 발송 (Celery/Redis 불필요)
-                # 이메일 발송
-                send_immediate_content_notification(user, instance)
-                print(f"[Signal] 이메일 발송 완료: {user.username} <- {instance.title}")
-
-                # 카카오 메시지 발송 (카카오 로그인 사용자 + 알림 활성화된 경우)
-                print(f"[Signal] 카카오 체크 - User: {user.username}, Provider: {user.social_provider}, Kakao enabled: {pref.kakao_notification_enabled}")
-                if user.social_provider == User.SocialProvider.KAKAO and pref.kakao_notification_enabled:
-                    print(f"[Signal] 카카오 메시지 발송 시도: {user.username}")
-                    kakao_sent = send_kakao_message_notification(user, instance)
-                    if kakao_sent:
-                        print(f"[Signal] 카카오 메시지 발송 완료: {user.username} <- {instance.title}")
-                    else:
-                        print(f"[Signal] 카카오 메시지 발송 실패: {user.username}")
-
-        except Exception as e:
-            print(f"[Signal] 알림 발송 실패 ({user.username}): {e}")
-            continue
+    logger.info(f"[PUBLISH] 콘텐츠 발행 감지: {instance.title}")
+    transaction.on_commit(lambda: enqueue_publish_event(event.pk))
@@ -1,6 +1,7 @@
-from django.test import TestCase
+from io import StringIO
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
-from .models import Category, Tag, Content, Favorite
+from .models import Category, Tag, Content, ContentVersion, Favorite
 
 User = get_user_model()
 
@@ -50,3 +51,695 @@ class ContentModelTest(TestCase):
         self.content.view_count += 1
         self.content.save()
         self.assertEqual(self.content.view_count, initial_count + 1)
+
+
+class ContentAnalysisTest(TestCase):
+    """본문 분석 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html=(
+                '<h2 id="intro">소개 <em>부분</em></h2><p>메타데이터 표준을 알아봅니다.</p>'
+                '<script>ignored()</script><h3>세부 내용</h3><p>' + 'word ' * 400 + '</p>'
+            ),
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_analysis_on_save(self):
+        """저장 시 본문 텍스트, 목차, 분량 계산"""
+        self.assertNotIn('<', self.content.plain_text)
+        self.assertNotIn('ignored', self.content.plain_text)
+        self.assertEqual(self.content.toc, [
+            {'level': 2, 'text': '소개 부분', 'id': 'intro'},
+            {'level': 3, 'text': '세부 내용', 'id': ''},
+        ])
+        self.assertEqual(self.content.word_count, 407)
+        self.assertEqual(self.content.reading_time, 3)
+
+    def test_analysis_with_update_fields(self):
+        """update_fields에 content_html이 있으면 분석 필드도 함께 저장"""
+        self.content.content_html = '<p>짧은 본문</p>'
+        self.content.save(update_fields=['content_html'])
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.plain_text, '짧은 본문')
+        self.assertEqual(self.content.word_count, 2)
+        self.assertEqual(self.content.char_count, 4)
+        self.assertEqual(self.content.toc, [])
+
+
+class ContentListFavoriteTest(TestCase):
+    """목록 즐겨찾기 여부 일괄 조회 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIRequestFactory
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.contents = [
+            Content.objects.create(
+                title=f'Test Content {i}',
+                slug=f'test-content-{i}',
+                summary='Test summary',
+                content_html='<p>Test content</p>',
+                category=self.category,
+                author=self.user,
+                status=Content.Status.PUBLISHED
+            )
+            for i in range(5)
+        ]
+        Favorite.objects.create(user=self.user, content=self.contents[0])
+
+        self.request = APIRequestFactory().get('/api/contents/contents/')
+        self.request.user = self.user
+
+    def test_is_favorited_single_query(self):
+        """페이지 크기와 무관하게 즐겨찾기 조회는 한 번만 실행"""
+        from .serializers import ContentListSerializer
+
+        queryset = Content.objects.select_related(
+            'category', 'author'
+        ).prefetch_related('tags')
+
+        # 콘텐츠 + 태그 prefetch + 즐겨찾기 조회
+        with self.assertNumQueries(3):
+            data = ContentListSerializer(
+                queryset, many=True, context={'request': self.request}
+            ).data
+
+        favorited = {item['slug']: item['is_favorited'] for item in data}
+        self.assertTrue(favorited['test-content-0'])
+        self.assertFalse(favorited['test-content-1'])
+
+
+class ContentFavoriteCountTest(TestCase):
+    """즐겨찾기 수 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_toggle_updates_count(self):
+        """즐겨찾기 등록/해제 시 favorite_count 증감, 상세 응답에도 반영"""
+        url = '/api/contents/contents/test-content/'
+        self.assertEqual(self.client.get(url).data['favorite_count'], 0)
+
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'{url}favorite/')
+        self.assertEqual(response.status_code, 201)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.favorite_count, 1)
+
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(url).data['favorite_count'], 1)
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(f'{url}favorite/')
+        self.assertEqual(response.status_code, 200)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.favorite_count, 0)
+
+    def test_save_without_counters_keeps_count(self):
+        """관리자/API 수정 경로는 그 사이 바뀐 카운터를 덮어쓰지 않음"""
+        from .favorite_utils import toggle_favorite
+
+        stale = Content.objects.get(pk=self.content.pk)
+        toggle_favorite(self.user, self.content)
+
+        stale.title = 'Renamed'
+        stale.save_without_counters()
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.title, 'Renamed')
+        self.assertEqual(self.content.favorite_count, 1)
+
+    def test_toggle_off_keeps_count_non_negative(self):
+        """카운터가 어긋나 0이어도 해제 시 음수가 되지 않음"""
+        from .favorite_utils import toggle_favorite
+
+        Favorite.objects.create(user=self.user, content=self.content)
+        self.assertFalse(toggle_favorite(self.user, self.content))
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.favorite_count, 0)
+
+    def test_reconcile(self):
+        """reconcile_favorite_counts가 어긋난 값을 보정"""
+        from django.core.management import call_command
+
+        Favorite.objects.create(user=self.user, content=self.content)
+        Content.objects.filter(pk=self.content.pk).update(favorite_count=5)
+
+        call_command('reconcile_favorite_counts', stdout=StringIO())
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.favorite_count, 1)
+
+
+class ContentSearchTest(TestCase):
+    """콘텐츠 검색 색인 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='더블린 코어',
+            slug='dublin-core',
+            summary='메타데이터 표준 소개',
+            content_html='<h1>개요</h1><p>서지 레코드를 기술하는 요소</p><script>ignored()</script>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_index_updated_on_save(self):
+        """저장 시 본문 텍스트가 검색 문서에 포함됨"""
+        document = self.content.search_index.document
+        self.assertIn('서지 레코드', document)
+        self.assertNotIn('ignored', document)
+
+    def test_index_updated_on_tag_change(self):
+        """태그 변경 시 검색 문서 갱신"""
+        from .search import search_contents
+
+        tag = Tag.objects.create(name='MARC', slug='marc')
+        self.content.tags.add(tag)
+
+        results = search_contents(Content.objects.all(), 'marc')
+        self.assertEqual(list(results), [self.content])
+
+    def test_korean_ngrams(self):
+        """한글 단어는 2-gram으로 분해"""
+        from .search import tokenize
+
+        self.assertEqual(tokenize('메타데이터'), ['메타데이터', '메타', '타데', '데이', '이터'])
+        self.assertEqual(tokenize('RDF 기술'), ['rdf', '기술'])
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class ContentResponseCacheTest(TestCase):
+    """비회원 응답 캐시 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_anonymous_list_cached_and_invalidated(self):
+        """비회원 목록은 캐시되고 콘텐츠 수정 시 무효화"""
+        url = '/api/contents/contents/'
+        self.client.get(url)
+
+        # 조건부 GET 검증자 계산(집계 1회)만 실행
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['title'], 'Test Content')
+
+        self.content.title = 'Updated Content'
+        self.content.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['title'], 'Updated Content')
+
+    def test_cached_detail_counts_views(self):
+        """캐시된 상세 응답도 조회수를 증가"""
+        url = '/api/contents/contents/test-content/'
+        self.assertEqual(self.client.get(url).data['view_count'], 1)
+
+        # 조건부 GET 검증자 조회만 실행
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.data['view_count'], 2)
+
+    def test_category_rename_invalidates_content_list(self):
+        """카테고리명 변경 시 콘텐츠 목록 캐시도 무효화"""
+        url = '/api/contents/contents/'
+        self.client.get(url)
+
+        self.category.name = 'Renamed Category'
+        self.category.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['category_name'], 'Renamed Category')
+
+
+class ContentConditionalGetTest(TestCase):
+    """조건부 GET 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_detail_not_modified(self):
+        """ETag가 일치하면 본문 없이 304 반환"""
+        url = '/api/contents/contents/test-content/'
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        self.content.version = '1.1'
+        self.content.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_etag_depends_on_favorite(self):
+        """즐겨찾기 여부가 바뀌면 ETag도 바뀜"""
+        url = '/api/contents/contents/test-content/'
+        self.client.force_authenticate(self.user)
+        etag = self.client.get(url)['ETag']
+
+        Favorite.objects.create(user=self.user, content=self.content)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['is_favorited'])
+
+    def test_list_not_modified(self):
+        """목록은 콘텐츠가 추가되면 ETag가 바뀜"""
+        url = '/api/contents/contents/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Content.objects.create(
+            title='New Content',
+            slug='new-content',
+            summary='New summary',
+            content_html='<p>New</p>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_category_list_not_modified(self):
+        """카테고리 목록은 카테고리 변경 시 ETag가 바뀜"""
+        url = '/api/contents/categories/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.category.name = 'Renamed Category'
+        self.category.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class ContentSparseFieldsetTest(TestCase):
+    """?fields= / ?omit= 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_list_fields(self):
+        """?fields=로 지정한 필드만 응답"""
+        response = self.client.get('/api/contents/contents/?fields=id,title')
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title'})
+
+    def test_detail_omit_defers_column(self):
+        """?omit=으로 제외한 필드의 컬럼은 조회하지 않음"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                '/api/contents/contents/test-content/?omit=content_html'
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('content_html', response.data)
+        self.assertEqual(response.data['title'], 'Test Content')
+        self.assertFalse(any('"content_html"' in query['sql'] for query in queries))
+
+    def test_detail_fields_without_view_count(self):
+        """view_count를 제외해도 상세 조회가 동작"""
+        response = self.client.get('/api/contents/contents/test-content/?fields=title')
+        self.assertEqual(response.data, {'title': 'Test Content'})
+
+
+@override_settings(CACHE_IS_SHARED=True)
+class ContentFacetTest(TestCase):
+    """패싯 집계 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.python = Category.objects.create(name='Python', slug='python')
+        self.metadata = Category.objects.create(name='Metadata', slug='metadata')
+        self.tag = Tag.objects.create(name='Basics', slug='basics')
+
+        specs = [
+            ('a', self.python, 'BEGINNER', Content.Status.PUBLISHED, True),
+            ('b', self.python, 'ADVANCED', Content.Status.PUBLISHED, False),
+            ('c', self.metadata, 'BEGINNER', Content.Status.PUBLISHED, True),
+            ('d', self.metadata, 'BEGINNER', Content.Status.DRAFT, True),
+        ]
+        for slug, category, difficulty, status, tagged in specs:
+            content = Content.objects.create(
+                title=f'Content {slug}',
+                slug=f'content-{slug}',
+                summary='Test summary',
+                content_html='<p>Test content</p>',
+                category=category,
+                author=self.user,
+                difficulty=difficulty,
+                status=status
+            )
+            if tagged:
+                content.tags.add(self.tag)
+
+    def test_facets_single_query(self):
+        """공개 콘텐츠의 패싯 개수를 한 번의 쿼리로 집계"""
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/contents/contents/facets/')
+
+        self.assertEqual(response.data['total'], 3)
+        self.assertEqual(response.data['categories'], [
+            {'slug': 'python', 'name': 'Python', 'count': 2},
+            {'slug': 'metadata', 'name': 'Metadata', 'count': 1},
+        ])
+        self.assertEqual(response.data['tags'], [
+            {'slug': 'basics', 'name': 'Basics', 'count': 2},
+        ])
+        self.assertEqual(
+            [(item['value'], item['count']) for item in response.data['difficulties']],
+            [('BEGINNER', 2), ('ADVANCED', 1)]
+        )
+
+    def test_facets_respect_filters_and_cache(self):
+        """현재 필터를 적용하고, 콘텐츠가 바뀌면 다시 집계"""
+        url = '/api/contents/contents/facets/?tag=basics'
+        response = self.client.get(url)
+        self.assertEqual(response.data['total'], 2)
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        content = Content.objects.get(slug='content-d')
+        content.status = Content.Status.PUBLISHED
+        content.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['total'], 3)
+
+
+class ContentCompressedBodyTest(TestCase):
+    """본문 압축 저장/응답 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.html = '<div class="p-4 text-lg">메타데이터</div>' * 200
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html=self.html,
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def test_stored_compressed(self):
+        """DB에는 gzip으로 압축해 저장하고 조회 시 문자열로 복원"""
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT content_html FROM contents WHERE id = %s', [self.content.pk])
+            stored = bytes(cursor.fetchone()[0])
+
+        self.assertTrue(stored.startswith(b'\x1f\x8b'))
+        self.assertLess(len(stored), len(self.html.encode('utf-8')))
+        self.assertEqual(Content.objects.get(pk=self.content.pk).content_html, self.html)
+
+    def test_body_gzip(self):
+        """gzip을 허용하면 저장된 바이트를 그대로 응답"""
+        import gzip
+
+        response = self.client.get(
+            '/api/contents/contents/test-content/body/',
+            HTTP_ACCEPT_ENCODING='gzip, deflate'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content).decode('utf-8'), self.html)
+
+        response = self.client.get(
+            '/api/contents/contents/test-content/body/',
+            HTTP_ACCEPT_ENCODING='gzip, deflate',
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_body_without_brotli_variant(self):
+        """brotli 변형이 없으면 gzip으로 응답하고 ETag도 gzip 응답과 같음"""
+        url = '/api/contents/contents/test-content/body/'
+        gzip_etag = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+
+        Content.objects.filter(pk=self.content.pk).update(content_html_br=None)
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='br, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['ETag'], gzip_etag)
+
+    def test_body_identity(self):
+        """압축을 허용하지 않으면 압축 해제해 응답"""
+        response = self.client.get(
+            '/api/contents/contents/test-content/body/',
+            HTTP_ACCEPT_ENCODING='gzip;q=0'
+        )
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content.decode('utf-8'), self.html)
+
+
+class ContentVersionStoreTest(TestCase):
+    """버전 델타 저장 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework.test import APIClient
+
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        self.category = Category.objects.create(
+            name='Test Category',
+            slug='test-category'
+        )
+
+        self.content = Content.objects.create(
+            title='Test Content',
+            slug='test-content',
+            summary='Test summary',
+            content_html='<p>Test content</p>',
+            category=self.category,
+            author=self.user,
+            status=Content.Status.PUBLISHED
+        )
+
+    def create_versions(self, count):
+        from .versioning import create_version
+
+        paragraphs = [f'<p class="mb-4">문단 {i} 내용입니다.</p>' for i in range(50)]
+        bodies = []
+        for i in range(count):
+            paragraphs[i % 50] = f'<p class="mb-4">문단 {i} 수정본 {i}</p>'
+            html = '\n'.join(paragraphs)
+            bodies.append(html)
+            create_version(self.content, f'1.{i}', f'수정 {i}', self.user, html=html)
+        return bodies
+
+    def test_snapshot_interval_and_reconstruct(self):
+        """N개마다 스냅샷, 그 사이는 델타로 저장하고 모든 버전을 복원"""
+        from django.core.cache import cache
+        from .versioning import SNAPSHOT_INTERVAL
+
+        bodies = self.create_versions(SNAPSHOT_INTERVAL + 2)
+        versions = list(self.content.versions.order_by('sequence'))
+
+        snapshots = [version.sequence for version in versions if version.is_snapshot]
+        self.assertEqual(snapshots, [1, SNAPSHOT_INTERVAL + 1])
+        self.assertEqual(versions[1].content_html, '')
+        self.assertLess(len(str(versions[1].delta)), len(bodies[1]) / 4)
+
+        cache.clear()
+        for version, html in zip(versions, bodies):
+            self.assertEqual(ContentVersion.objects.get(pk=version.pk).html, html)
+
+    def test_versions_api(self):
+        """목록에는 본문이 없고, 상세에서 복원한 본문 반환"""
+        bodies = self.create_versions(3)
+
+        response = self.client.get('/api/contents/contents/test-content/versions/')
+        self.assertEqual([item['sequence'] for item in response.data], [3, 2, 1])
+        self.assertNotIn('content_html', response.data[0])
+
+        response = self.client.get('/api/contents/contents/test-content/versions/2/')
+        self.assertEqual(response.data['content_html'], bodies[1])
+
+    def test_compact(self):
+        """기존 전체 본문 버전을 스냅샷/델타로 압축"""
+        from django.core.management import call_command
+
+        bodies = self.create_versions(4)
+        for version, html in zip(self.content.versions.order_by('sequence'), bodies):
+            version.is_snapshot = True
+            version.content_html = html
+            version.delta = None
+            version.save()
+
+        call_command('compact_content_versions', stdout=StringIO())
+
+        versions = list(self.content.versions.order_by('sequence'))
+        self.assertEqual([version.is_snapshot for version in versions], [True, False, False, False])
+        self.assertEqual([version.html for version in versions], bodies)
@@ -0,0 +1,189 @@
+"""
+콘텐츠 버전 저장소
+
+버전마다 본문 전체를 저장하지 않고 이전 버전과의 차이(델타)만 저장하며,
+SNAPSHOT_INTERVAL개 버전마다(또는 델타가 본문보다 크게 줄지 않으면) 전체 본문을 스냅샷으로 저장한다.
+
+- 델타: HTML을 태그/공백/단어 단위 토큰으로 나눠 비교한 결과
+  [[i, j], '삽입 문자열', ...] 형태로, [i, j]는 이전 버전 토큰 i~j-1을 복사하고
+  문자열은 그대로 삽입한다.
+- 복원: 가장 가까운 이전 스냅샷에서 대상 버전까지 델타를 차례로 적용한다.
+  (최대 SNAPSHOT_INTERVAL개 행만 조회)
+- 버전은 저장 후 바뀌지 않으므로 복원한 본문은 공유 캐시에 저장해 재사용한다.
+"""
+import difflib
+import json
+import re
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max, Q
+from .models import Content, ContentVersion
+
+# 전체 본문을 저장하는 간격 (복원 시 적용할 델타 수의 상한)
+SNAPSHOT_INTERVAL = 10
+
+# 델타가 본문 크기의 이 비율 이상이면 스냅샷으로 저장
+SNAPSHOT_DELTA_RATIO = 0.5
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+TOKEN_RE = re.compile(r'(<[^>]*>|\s+)')
+
+
+def _cache_key(version_pk):
+    return f'content-version:{version_pk}:html'
+
+
+def tokenize(html):
+    """HTML을 태그, 공백, 그 사이 텍스트 토큰으로 분리 (이어 붙이면 원문과 같음)"""
+    return [token for token in TOKEN_RE.split(html) if token]
+
+
+def make_delta(base_html, html):
+    """base_html을 html로 바꾸는 델타"""
+    base_tokens = tokenize(base_html)
+    tokens = tokenize(html)
+
+    delta = []
+    matcher = difflib.SequenceMatcher(None, base_tokens, tokens)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            delta.append([i1, i2])
+        elif j1 < j2:  # replace, insert
+            delta.append(''.join(tokens[j1:j2]))
+    return delta
+
+
+def apply_delta(base_html, delta):
+    """base_html에 델타를 적용해 다음 버전 본문 생성"""
+    base_tokens = tokenize(base_html)
+    parts = []
+    for op in delta:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(base_tokens[op[0]:op[1]])
+    return ''.join(parts)
+
+
+def _should_snapshot(sequence, last_snapshot, html, delta):
+    if last_snapshot is None or sequence - last_snapshot >= SNAPSHOT_INTERVAL:
+        return True
+    return len(json.dumps(delta, ensure_ascii=False)) >= len(html) * SNAPSHOT_DELTA_RATIO
+
+
+def _encode(version, html, base_html, last_snapshot):
+    """버전을 스냅샷 또는 델타로 채움"""
+    delta = make_delta(base_html, html) if base_html is not None else None
+    version.size = len(html)
+    if base_html is None or _should_snapshot(version.sequence, last_snapshot, html, delta):
+        version.is_snapshot = True
+        version.content_html = html
+        version.delta = None
+    else:
+        version.is_snapshot = False
+        version.content_html = ''
+        version.delta = delta
+
+
+def save_version(version, html=None):
+    """
+    새 버전 저장 (sequence, 스냅샷/델타를 채운 뒤 저장)
+
+    Args:
+        version: 저장하지 않은 ContentVersion (content, version, change_log, created_by 지정)
+        html: 버전 본문 (없으면 콘텐츠의 현재 본문)
+    """
+    if html is None:
+        html = version.content.content_html
+
+    with transaction.atomic():
+        # 같은 콘텐츠의 버전 번호가 동시에 발급되지 않도록 콘텐츠 행 잠금
+        Content.objects.select_for_update().filter(pk=version.content_id).exists()
+
+        versions = ContentVersion.objects.filter(content_id=version.content_id)
+        stats = versions.aggregate(
+            last_sequence=Max('sequence'),
+            last_snapshot=Max('sequence', filter=Q(is_snapshot=True)),
+        )
+        previous = versions.filter(sequence=stats['last_sequence']).first()
+
+        version.sequence = (stats['last_sequence'] or 0) + 1
+        base_html = get_version_html(previous) if previous else None
+        _encode(version, html, base_html, stats['last_snapshot'])
+        version.save()
+
+    # 최신 버전은 다음 버전의 델타 기준이므로 바로 캐시
+    cache.set(_cache_key(version.pk), html, timeout=CACHE_TIMEOUT)
+    return version
+
+
+def create_version(content, version, change_log, created_by, html=None):
+    """콘텐츠의 새 버전 생성"""
+    return save_version(
+        ContentVersion(
+            content=content,
+            version=version,
+            change_log=change_log,
+            created_by=created_by,
+        ),
+        html=html
+    )
+
+
+def get_version_html(version):
+    """버전 본문 복원 (캐시 사용)"""
+    key = _cache_key(version.pk)
+    html = cache.get(key)
+    if html is not None:
+        return html
+
+    chain = list(
+        ContentVersion.objects.filter(
+            content_id=version.content_id,
+            sequence__lte=version.sequence,
+            sequence__gte=ContentVersion.objects.filter(
+                content_id=version.content_id,
+                sequence__lte=version.sequence,
+                is_snapshot=True
+            ).order_by('-sequence').values('sequence')[:1]
+        ).order_by('sequence').only('pk', 'is_snapshot', 'content_html', 'delta')
+    )
+
+    html = chain[0].content_html
+    for item in chain[1:]:
+        html = apply_delta(html, item.delta)
+
+    cache.set(key, html, timeout=CACHE_TIMEOUT)
+    return html
+
+
+def compact_versions(content):
+    """
+    콘텐츠의 모든 버전을 스냅샷/델타 형식으로 다시 저장
+
+    Returns:
+        tuple: (버전 수, 스냅샷 수)
+    """
+    with transaction.atomic():
+        versions = list(
+            ContentVersion.objects.select_for_update().filter(
+                content=content
+            ).order_by('sequence')
+        )
+
+        base_html = None
+        last_snapshot = None
+        for version in versions:
+            html = version.content_html if version.is_snapshot else apply_delta(base_html, version.delta)
+            _encode(version, html, base_html, last_snapshot)
+            if version.is_snapshot:
+                last_snapshot = version.sequence
+            base_html = html
+
+        ContentVersion.objects.bulk_update(
+            versions, ['is_snapshot', 'content_html', 'delta', 'size'], batch_size=100
+        )
+
+    cache.delete_many([_cache_key(version.pk) for version in versions])
+    return len(versions), sum(version.is_snapshot for version in versions)
@@ -2,8 +2,25 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import Q, Max, Count, BooleanField, ExpressionWrapper
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from apps.common.fields import gzip_decompress, raw_bytes
+from apps.common.fieldsets import SparseFieldsetViewMixin
+from apps.common.pagination import PageNumberOrCursorPagination
+from apps.analytics.activity import record_event
+from apps.analytics.models import ActivityEvent
+from apps.analytics.trending import decayed_score, get_recent_views
+from apps.common.view_counter import record_view
 from .models import Category, Tag, Content, ContentVersion, Favorite
+from .facets import count_facets
+from .favorite_utils import toggle_favorite
+from .search import search_contents
+from .response_cache import AnonymousResponseCacheMixin, content_detail_group, get_generations
+from .conditional import ConditionalGetMixin, accepted_encodings, make_etag
 from .serializers import (
     CategorySerializer,
     TagSerializer,
@@ -11,28 +28,31 @@ from .serializers import (
     ContentDetailSerializer,
     ContentCreateUpdateSerializer,
     ContentVersionSerializer,
+    ContentVersionDetailSerializer,
     FavoriteSerializer
 )
 
 
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, AnonymousResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     """카테고리 ViewSet (읽기 전용)"""
 
+    response_cache_groups = ('categories',)
     queryset = Category.objects.filter(is_active=True)
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = None  # 카테고리는 페이지네이션 비활성화 (전체 목록 반환)
 
 
-class TagViewSet(viewsets.ReadOnlyModelViewSet):
+class TagViewSet(ConditionalGetMixin, AnonymousResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     """태그 ViewSet (읽기 전용)"""
 
+    response_cache_groups = ('tags',)
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
 
-class ContentViewSet(viewsets.ModelViewSet):
+class ContentViewSet(SparseFieldsetViewMixin, ConditionalGetMixin, AnonymousResponseCacheMixin, viewsets.ModelViewSet):
     """
     콘텐츠 ViewSet
 
@@ -41,26 +61,37 @@ class ContentViewSet(viewsets.ModelViewSet):
     - create: 콘텐츠 생성 (관리자만)
     - update: 콘텐츠 수정 (관리자만)
     - destroy: 콘텐츠 삭제 (관리자만, Soft Delete)
+    - facets: 카테고리/태그/난이도별 콘텐츠 수 (비회원 가능)
+    - body: 본문 HTML (저장된 gzip/brotli 바이트를 그대로 응답)
+    - trending: 최근 조회수 기준 인기 콘텐츠 (비회원 가능)
+
+    비회원 목록/상세 응답은 공유 캐시에 저장된다. (response_cache 참고)
+    목록/상세 응답에는 ETag, Last-Modified가 붙는다. (conditional 참고)
+    ?fields= / ?omit=으로 응답 필드와 조회 컬럼을 줄일 수 있다. (fieldsets 참고)
     """
 
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = PageNumberOrCursorPagination
     lookup_field = 'slug'
+    sparse_fieldset_actions = ('list', 'retrieve', 'trending')
+    sparse_fieldset_always_load = ('created_at', 'trending_score')
+    cursor_ordering = ('-created_at', '-id')
 
-    def get_queryset(self):
+    # 인기 콘텐츠 최대 개수
+    TRENDING_LIMIT = 50
+
+    def get_filtered_queryset(self):
+        """권한과 쿼리 파라미터로 필터링한 콘텐츠 (연관 객체 로딩 없음)"""
         queryset = Content.objects.filter(is_deleted=False)
 
         # 비관리자는 공개 콘텐츠만 조회
         if not (self.request.user.is_authenticated and self.request.user.is_admin):
             queryset = queryset.filter(status=Content.Status.PUBLISHED)
 
-        # 검색
+        # 검색 (검색 색인 사용, 관련도 순 정렬)
         search = self.request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(summary__icontains=search) |
-                Q(tags__name__icontains=search)
-            ).distinct()
+            queryset = search_contents(queryset, search)
 
         # 카테고리 필터
         category = self.request.query_params.get('category', None)
@@ -79,22 +110,127 @@ class ContentViewSet(viewsets.ModelViewSet):
         if difficulty:
             queryset = queryset.filter(difficulty=difficulty)
 
-        return queryset.select_related('category', 'author').prefetch_related('tags')
+        return queryset
+
+    def get_queryset(self):
+        return self.get_filtered_queryset().select_related('category', 'author').prefetch_related('tags')
+
+    def get_cursor_ordering(self):
+        # 검색 결과는 관련도 순이라 keyset으로 표현할 수 없으므로 페이지 번호 방식으로 처리
+        if self.request.query_params.get('search'):
+            return None
+        return self.cursor_ordering
 
     def get_serializer_class(self):
-        if self.action == 'list':
+        if self.action in ['list', 'trending']:
             return ContentListSerializer
         elif self.action in ['create', 'update', 'partial_update']:
             return ContentCreateUpdateSerializer
         return ContentDetailSerializer
 
+    def get_response_cache_groups(self):
+        if self.action == 'retrieve':
+            return [content_detail_group(self.kwargs['slug']), 'categories', 'tags']
+        return ['contents', 'categories', 'tags']
+
+    def should_cache_response(self):
+        # 패싯은 공개 콘텐츠만 집계하므로 사용자와 무관하게 캐시
+        if self.action == 'facets':
+            return settings.CACHE_IS_SHARED and self.request.method == 'GET'
+        return super().should_cache_response()
+
+    def get_validators(self):
+        """
+        본문: updated_at, 응답 인코딩
+        상세: updated_at, version, 즐겨찾기 수와 여부, 댓글 수
+        목록: 필터링된 콘텐츠의 max(updated_at)와 개수, 사용자의 즐겨찾기 상태,
+        목록 응답 캐시 세대 값 (댓글 수 등 updated_at을 바꾸지 않는 카운터 변경 시 갱신됨)
+        (카테고리명/태그명이 응답에 포함되므로 두 그룹의 세대 값도 포함)
+        """
+        if self.action == 'body':
+            row = self.get_filtered_queryset().filter(
+                slug=self.kwargs['slug']
+            ).annotate(
+                has_brotli=ExpressionWrapper(Q(content_html_br__isnull=False), output_field=BooleanField())
+            ).values('pk', 'updated_at', 'has_brotli').first()
+            if row is None:
+                return None
+            etag = make_etag(
+                'content-body', row['pk'], row['updated_at'].isoformat(),
+                self.get_body_encoding(row['has_brotli'])
+            )
+            return etag, row['updated_at']
+
+        user = self.request.user
+        generations = get_generations(['categories', 'tags'])
+
+        if self.action == 'retrieve':
+            row = self.get_filtered_queryset().filter(
+                slug=self.kwargs['slug']
+            ).values('pk', 'updated_at', 'version', 'favorite_count', 'comment_count').first()
+            if row is None:
+                return None  # 404는 본 응답에서 처리
+
+            self.validated_content_pk = row['pk']
+            is_favorited = (
+                user.is_authenticated and
+                Favorite.objects.filter(user=user, content_id=row['pk']).exists()
+            )
+            etag = make_etag(
+                'content', row['pk'], row['updated_at'].isoformat(),
+                row['version'], row['favorite_count'], row['comment_count'], is_favorited, *generations
+            )
+            return etag, row['updated_at']
+
+        stamp = self.get_filtered_queryset().order_by().aggregate(
+            last_modified=Max('updated_at'),
+            count=Count('pk')
+        )
+        favorite_stamp = {}
+        if user.is_authenticated:
+            favorite_stamp = Favorite.objects.filter(user=user).aggregate(
+                last_favorited=Max('created_at'),
+                count=Count('pk')
+            )
+        etag = make_etag(
+            'contents', user.pk, stamp['last_modified'], stamp['count'],
+            favorite_stamp.get('last_favorited'), favorite_stamp.get('count'),
+            *generations, *get_generations(['contents'])
+        )
+        return etag, stamp['last_modified']
+
+    def list(self, request, *args, **kwargs):
+        """콘텐츠 목록 조회 (검색어는 활동 이벤트로 기록)"""
+        response = super().list(request, *args, **kwargs)
+
+        search = request.query_params.get('search')
+        if search and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            record_event(ActivityEvent.EventType.SEARCH, request.user, query=search[:100])
+        return response
+
     def retrieve(self, request, *args, **kwargs):
         """콘텐츠 상세 조회 시 조회수 증가"""
-        instance = self.get_object()
-        instance.view_count += 1
-        instance.save(update_fields=['view_count'])
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        response = self.get_conditional_response(self.build_detail_response)
+
+        # 변경이 없어 304를 반환하는 경우에도 조회수는 증가
+        if response.status_code == status.HTTP_304_NOT_MODIFIED:
+            record_view(Content(pk=self.validated_content_pk))
+        record_event(ActivityEvent.EventType.CONTENT_VIEW, request.user, object_id=self.validated_content_pk)
+        return response
+
+    def build_detail_response(self):
+        # 캐시에는 DB에 반영된 조회수가 담긴 응답을 저장
+        response = self.get_cached_response(
+            lambda: Response(self.get_serializer(self.get_object()).data)
+        )
+
+        # 조회수는 캐시에 기록하고 주기적으로 DB에 반영 (상세 조회는 DB 쓰기 없음)
+        # (?fields=로 id가 빠질 수 있으므로 검증자 조회 시 확인한 pk 사용)
+        pending = record_view(Content(pk=self.validated_content_pk))
+        data = dict(response.data)
+        if 'view_count' in data:
+            data['view_count'] += pending
+        return Response(data)
 
     def perform_create(self, serializer):
         """콘텐츠 생성 시 작성자 자동 설정"""
@@ -124,7 +260,7 @@ class ContentViewSet(viewsets.ModelViewSet):
 
         instance = self.get_object()
         instance.is_deleted = True
-        instance.save()
+        instance.save_without_counters()
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -133,37 +269,143 @@ class ContentViewSet(viewsets.ModelViewSet):
         """즐겨찾기 등록/해제"""
         content = self.get_object()
 
-        favorite, created = Favorite.objects.get_or_create(
-            user=request.user,
-            content=content
-        )
-
-        if not created:
-            favorite.delete()
+        if not toggle_favorite(request.user, content):
+            record_event(ActivityEvent.EventType.UNFAVORITE, request.user, object_id=content.pk)
             return Response(
                 {"detail": "즐겨찾기가 해제되었습니다."},
                 status=status.HTTP_200_OK
             )
 
+        record_event(ActivityEvent.EventType.FAVORITE, request.user, object_id=content.pk)
         return Response(
             {"detail": "즐겨찾기에 등록되었습니다."},
             status=status.HTTP_201_CREATED
         )
 
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        공개 콘텐츠의 카테고리/태그/난이도별 개수
+
+        목록과 같은 필터(category, tag, difficulty, search)를 적용하고
+        한 번의 집계 쿼리로 계산한다. (콘텐츠/카테고리/태그 변경 시 캐시 무효화)
+        """
+        return self.get_cached_response(
+            lambda: Response(count_facets(
+                self.get_filtered_queryset().filter(status=Content.Status.PUBLISHED)
+            ))
+        )
+
+    @action(detail=False, methods=['get'])
+    def trending(self, request):
+        """
+        인기 콘텐츠
+
+        시간 감쇠 조회수(Content.trending_score) 순으로 최대 limit개(기본 10, 최대 50)를 반환한다.
+        목록과 같은 필터(category, tag, difficulty)를 적용하며,
+        항목마다 현재 시점의 점수와 최근 24시간 조회수를 함께 담는다.
+        """
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), self.TRENDING_LIMIT)
+        except ValueError:
+            limit = 10
+
+        contents = list(
+            self.filter_queryset(self.get_queryset()).filter(
+                status=Content.Status.PUBLISHED,
+                trending_score__isnull=False
+            ).order_by('-trending_score')[:limit]
+        )
+        recent_views = get_recent_views([content.pk for content in contents])
+
+        results = []
+        now = timezone.now()
+        for content, data in zip(contents, self.get_serializer(contents, many=True).data):
+            data['trending_score'] = round(decayed_score(content.trending_score, now), 3)
+            data['recent_views'] = recent_views.get(content.pk, 0)
+            results.append(data)
+        return Response(results)
+
+    @action(detail=True, methods=['get'])
+    def body(self, request, slug=None):
+        """
+        콘텐츠 본문 HTML
+
+        Accept-Encoding이 허용하면 저장된 brotli/gzip 바이트를 압축 해제 없이 그대로 응답한다.
+        (상세 응답에서 ?omit=content_html로 본문을 제외하고 함께 사용)
+        """
+        response = self.get_conditional_response(self.build_body_response)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def get_body_encoding(self, has_brotli):
+        """
+        실제 본문 응답 인코딩 (br > gzip > 압축 없음)
+
+        brotli 변형이 없으면 gzip으로 응답한다. ETag와 응답 본문이 같은 값을 사용한다.
+        """
+        encodings = accepted_encodings(self.request)
+        if has_brotli and 'br' in encodings:
+            return 'br'
+        if 'gzip' in encodings:
+            return 'gzip'
+        return None
+
+    def build_body_response(self):
+        row = self.get_filtered_queryset().filter(
+            slug=self.kwargs['slug']
+        ).annotate(
+            content_html_gzip=raw_bytes('content_html')
+        ).values('content_html_gzip', 'content_html_br').first()
+        if row is None:
+            raise Http404
+
+        gzip_body = bytes(row['content_html_gzip'])
+        brotli_body = row['content_html_br']
+
+        encoding = self.get_body_encoding(brotli_body is not None)
+        if encoding == 'br':
+            body = bytes(brotli_body)
+        elif encoding == 'gzip':
+            body = gzip_body
+        else:
+            body = gzip_decompress(gzip_body)
+
+        response = HttpResponse(body, content_type='text/html; charset=utf-8')
+        if encoding:
+            response['Content-Encoding'] = encoding
+        return response
+
     @action(detail=True, methods=['get'])
     def versions(self, request, slug=None):
-        """콘텐츠 버전 이력 조회"""
+        """콘텐츠 버전 이력 조회 (본문 제외)"""
         content = self.get_object()
-        versions = content.versions.all()
+        versions = content.versions.select_related(
+            'created_by'
+        ).defer(
+            'content_html', 'delta'
+        ).order_by('-sequence')
         serializer = ContentVersionSerializer(versions, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'], url_path=r'versions/(?P<sequence>\d+)')
+    def version(self, request, slug=None, sequence=None):
+        """콘텐츠 버전 상세 조회 (본문 포함)"""
+        content = self.get_object()
+        version = get_object_or_404(
+            content.versions.select_related('created_by').defer('content_html', 'delta'),
+            sequence=sequence
+        )
+        serializer = ContentVersionDetailSerializer(version)
+        return Response(serializer.data)
+
 
 class FavoriteViewSet(viewsets.ReadOnlyModelViewSet):
     """즐겨찾기 ViewSet"""
 
     serializer_class = FavoriteSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = PageNumberOrCursorPagination
 
     def get_queryset(self):
         return Favorite.objects.filter(
@@ -173,4 +415,8 @@ class FavoriteViewSet(viewsets.ReadOnlyModelViewSet):
             'content__author'
         ).prefetch_related(
             'content__tags'
+        ).defer(
+            # 즐겨찾기 목록에는 본문이 포함되지 않음
+            'content__content_html',
+            'content__plain_text'
         )
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:26
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def delete_duplicate_logs(apps, schema_editor):
+    """같은 캠페인/수신자의 중복 발송 로그 중 가장 먼저 만든 로그만 남김"""
+    EmailLog = apps.get_model('mailing', 'EmailLog')
+
+    duplicates = EmailLog.objects.values('campaign_id', 'recipient').annotate(
+        first_id=Min('pk'),
+        count=Count('pk')
+    ).filter(count__gt=1)
+    for row in duplicates.iterator():
+        EmailLog.objects.filter(
+            campaign_id=row['campaign_id'],
+            recipient=row['recipient']
+        ).exclude(pk=row['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_logs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='emaillog',
+            constraint=models.UniqueConstraint(fields=('campaign', 'recipient'), name='unique_campaign_recipient'),
+        ),
+    ]
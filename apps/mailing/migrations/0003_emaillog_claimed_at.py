@@ -0,0 +1,23 @@
+# Generated by Django 4.2.18 on 2026-10-18 12:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailing', '0002_emaillog_unique_campaign_recipient'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillog',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='발송 시작일'),
+        ),
+        migrations.AlterField(
+            model_name='emaillog',
+            name='status',
+            field=models.CharField(choices=[('PENDING', '대기'), ('SENDING', '발송 중'), ('SENT', '발송 완료'), ('FAILED', '발송 실패'), ('BOUNCED', '반송됨')], default='PENDING', max_length=20, verbose_name='상태'),
+        ),
+    ]
@@ -148,6 +148,7 @@ class EmailLog(models.Model):
 
     class Status(models.TextChoices):
         PENDING = 'PENDING', '대기'
+        SENDING = 'SENDING', '발송 중'
         SENT = 'SENT', '발송 완료'
         FAILED = 'FAILED', '발송 실패'
         BOUNCED = 'BOUNCED', '반송됨'
@@ -175,6 +176,13 @@ class EmailLog(models.Model):
         verbose_name='오류 메시지'
     )
 
+    # 청크 발송 작업이 발송 중 상태로 가져간 시각 (멈춘 로그 복구 기준)
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='발송 시작일'
+    )
+
     sent_at = models.DateTimeField(
         null=True,
         blank=True,
@@ -207,6 +215,10 @@ class EmailLog(models.Model):
             models.Index(fields=['campaign', 'status']),
             models.Index(fields=['recipient']),
         ]
+        constraints = [
+            # 재실행된 발송 작업이 같은 수신자의 로그를 다시 만들지 않도록
+            models.UniqueConstraint(fields=['campaign', 'recipient'], name='unique_campaign_recipient'),
+        ]
 
     def __str__(self):
         return f"{self.campaign.title} - {self.recipient}"
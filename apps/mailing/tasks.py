@@ -0,0 +1,241 @@
+"""
+Celery 태스크 - 이메일 캠페인 발송
+
+1. dispatch_campaign: 활성 구독자를 스트리밍하며 발송 로그를 bulk_create로 만들고
+   대기 중인 로그를 CAMPAIGN_CHUNK_SIZE개씩 나눠 청크 발송 작업을 등록
+2. send_campaign_chunk: 청크의 대기 로그를 발송 중(SENDING) 상태로 가져간 뒤
+   SMTP 연결을 재사용해 발송하고 로그 상태와 캠페인 집계(F() 증가)를 한 번에 반영,
+   마지막 청크가 끝나면 완료 처리
+   (같은 청크 작업이 두 번 실행되어도 먼저 가져간 작업만 발송)
+3. dispatch_stalled_campaigns: 발송 중 상태로 CAMPAIGN_STALL_TIMEOUT 동안 진행이 없고
+   보내지 않은 로그가 남은 캠페인을 다시 등록 (작업 등록 실패, 워커 중단 등)
+   워커가 중단되어 CAMPAIGN_STALL_TIMEOUT이 지나도록 발송 중으로 남은 로그는 대기 상태로 되돌림
+
+발송 속도는 메시지마다 acquire_send_slot()으로 제한한다.
+공유 캐시의 초 단위 카운터를 모든 워커가 함께 쓰므로 워커 수, 동시 발송 스레드 수와 무관하게
+전체 발송량이 초당 CAMPAIGN_SEND_RATE통을 넘지 않는다. (공유 캐시 필요, CACHE_URL 참고)
+"""
+import logging
+import time
+from datetime import timedelta
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
+from django.db.models import Case, Exists, F, OuterRef, Q, Value, When
+from django.utils import timezone
+from apps.accounts.email_utils import deliver_messages
+from .models import MailingList, EmailCampaign, EmailLog
+
+logger = logging.getLogger(__name__)
+
+# 발송 중 캠페인이 이 시간 동안 진행이 없으면 다시 등록
+CAMPAIGN_STALL_TIMEOUT = timedelta(minutes=30)
+
+SEND_RATE_KEY = 'campaign-send-rate'
+
+
+def acquire_send_slot():
+    """
+    발송 한 건이 허용될 때까지 대기
+
+    현재 초의 발송 수를 공유 캐시에서 증가시키고, CAMPAIGN_SEND_RATE를 넘으면 다음 초까지 기다린다.
+    """
+    rate = max(settings.CAMPAIGN_SEND_RATE, 1)
+    while True:
+        now = time.time()
+        window = int(now)
+        key = f'{SEND_RATE_KEY}:{window}'
+        cache.add(key, 0, timeout=5)
+        try:
+            count = cache.incr(key)
+        except ValueError:  # 그 사이 만료된 경우
+            continue
+        if count <= rate:
+            return
+        time.sleep(window + 1 - now)
+
+
+def create_campaign_logs(campaign):
+    """
+    활성 구독자마다 대기 상태 발송 로그 생성
+
+    이전 실행이 중간에 실패했더라도 없는 로그만 만든다.
+    (캠페인, 수신자) 유일 제약으로 이미 있는 로그는 건너뜀
+
+    Returns:
+        int: 캠페인의 발송 로그 수
+    """
+    batch_size = settings.CAMPAIGN_CHUNK_SIZE
+
+    batch = []
+    emails = MailingList.objects.filter(is_active=True).order_by('pk').values_list('email', flat=True)
+    for email in emails.iterator(chunk_size=batch_size):
+        batch.append(EmailLog(campaign=campaign, recipient=email, status=EmailLog.Status.PENDING))
+        if len(batch) >= batch_size:
+            EmailLog.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        EmailLog.objects.bulk_create(batch, ignore_conflicts=True)
+    return campaign.logs.count()
+
+
+def complete_campaign(campaign_id):
+    """대기/발송 중인 발송 로그가 없으면 캠페인 완료 처리 (모두 실패하면 실패)"""
+    pending = EmailLog.objects.filter(
+        campaign_id=OuterRef('pk'),
+        status__in=[EmailLog.Status.PENDING, EmailLog.Status.SENDING]
+    )
+    EmailCampaign.objects.filter(
+        pk=campaign_id,
+        status=EmailCampaign.Status.SENDING
+    ).exclude(Exists(pending)).update(
+        status=Case(
+            When(sent_count=0, failed_count__gt=0, then=Value(EmailCampaign.Status.FAILED)),
+            default=Value(EmailCampaign.Status.SENT)
+        ),
+        sent_at=timezone.now()
+    )
+
+
+@shared_task
+def dispatch_campaign(campaign_id):
+    """
+    캠페인 발송 로그를 만들고 청크 발송 작업 등록
+
+    Args:
+        campaign_id: EmailCampaign ID
+    """
+    chunk_size = settings.CAMPAIGN_CHUNK_SIZE
+    campaign = EmailCampaign.objects.get(pk=campaign_id)
+    if campaign.status != EmailCampaign.Status.SENDING:
+        return f"Campaign {campaign_id} is not sending"
+
+    total = create_campaign_logs(campaign)
+    EmailCampaign.objects.filter(pk=campaign_id).update(total_recipients=total, updated_at=timezone.now())
+
+    # 대기 중인 로그를 pk 범위로 나눠 등록 (작업 메시지 크기를 청크 크기와 무관하게 유지)
+    chunk_count = 0
+    log_ids = EmailLog.objects.filter(
+        campaign_id=campaign_id,
+        status=EmailLog.Status.PENDING
+    ).order_by('pk').values_list('pk', flat=True)
+    chunk = []
+    for log_id in log_ids.iterator(chunk_size=chunk_size):
+        chunk.append(log_id)
+        if len(chunk) >= chunk_size:
+            send_campaign_chunk.delay(campaign_id, chunk[0], chunk[-1])
+            chunk_count += 1
+            chunk = []
+    if chunk:
+        send_campaign_chunk.delay(campaign_id, chunk[0], chunk[-1])
+        chunk_count += 1
+
+    if not chunk_count:
+        complete_campaign(campaign_id)
+
+    return f"Campaign {campaign_id}: {total} recipients in {chunk_count} chunks"
+
+
+@shared_task
+def send_campaign_chunk(campaign_id, first_log_id, last_log_id):
+    """
+    캠페인 발송 로그 청크 하나 발송
+
+    Args:
+        campaign_id: EmailCampaign ID
+        first_log_id: 청크의 첫 EmailLog ID
+        last_log_id: 청크의 마지막 EmailLog ID
+    """
+    campaign = EmailCampaign.objects.get(pk=campaign_id)
+    # 대기 로그를 발송 중 상태로 가져감
+    # (다시 등록된 같은 범위의 작업이 동시에 실행되어도 잠긴 로그는 건너뛰므로 한쪽만 발송)
+    with transaction.atomic():
+        logs = list(
+            EmailLog.objects.select_for_update(skip_locked=True).filter(
+                campaign_id=campaign_id,
+                pk__range=(first_log_id, last_log_id),
+                status=EmailLog.Status.PENDING
+            ).order_by('pk').only('pk', 'recipient')
+        )
+        EmailLog.objects.filter(pk__in=[log.pk for log in logs]).update(
+            status=EmailLog.Status.SENDING,
+            claimed_at=timezone.now()
+        )
+    if not logs:
+        return f"Campaign {campaign_id}: nothing to send"
+    EmailCampaign.objects.filter(pk=campaign_id).update(updated_at=timezone.now())
+
+    def messages():
+        for log in logs:
+            message = EmailMultiAlternatives(
+                subject=campaign.subject,
+                body=campaign.content_text,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[log.recipient],
+            )
+            message.attach_alternative(campaign.content_html, "text/html")
+            yield message
+
+    results = deliver_messages(messages(), throttle=acquire_send_slot)
+
+    now = timezone.now()
+    for log, result in zip(logs, results):
+        if result.sent:
+            log.status = EmailLog.Status.SENT
+            log.sent_at = now
+        else:
+            log.status = EmailLog.Status.FAILED
+            log.error_message = str(result.error)
+    EmailLog.objects.bulk_update(logs, ['status', 'sent_at', 'error_message'])
+
+    sent_count = sum(result.sent for result in results)
+    failed_count = len(results) - sent_count
+    EmailCampaign.objects.filter(pk=campaign_id).update(
+        sent_count=F('sent_count') + sent_count,
+        failed_count=F('failed_count') + failed_count,
+        updated_at=timezone.now()
+    )
+    complete_campaign(campaign_id)
+
+    return f"Campaign {campaign_id}: sent {sent_count}, failed {failed_count}"
+
+
+@shared_task
+def dispatch_stalled_campaigns():
+    """
+    진행이 멈춘 발송 중 캠페인을 다시 등록
+    (발송 요청 직후 브로커에 연결하지 못했거나 청크 작업이 유실된 경우 등)
+
+    발송 로그를 아직 만들지 못했거나 대기 중인 로그가 남은 캠페인만 해당하며,
+    청크가 시작하고 끝날 때마다 updated_at이 갱신되므로 진행 중인 캠페인은 건너뛴다.
+    다시 등록된 청크 작업은 이미 가져간 로그를 건너뛰므로 원래 작업이 아직 큐에 있어도 중복 발송하지 않는다.
+    """
+    stalled_before = timezone.now() - CAMPAIGN_STALL_TIMEOUT
+
+    # 발송 중에 워커가 중단된 로그를 대기 상태로 되돌림
+    EmailLog.objects.filter(
+        campaign__status=EmailCampaign.Status.SENDING,
+        status=EmailLog.Status.SENDING,
+        claimed_at__lt=stalled_before
+    ).update(status=EmailLog.Status.PENDING, claimed_at=None)
+
+    pending = EmailLog.objects.filter(
+        campaign_id=OuterRef('pk'),
+        status=EmailLog.Status.PENDING
+    )
+    campaign_ids = list(
+        EmailCampaign.objects.filter(
+            status=EmailCampaign.Status.SENDING,
+            updated_at__lt=stalled_before
+        ).filter(
+            Exists(pending) | Q(total_recipients=0)
+        ).values_list('pk', flat=True)
+    )
+    for campaign_id in campaign_ids:
+        # 다음 주기에 다시 등록하지 않도록 갱신 시각 기록
+        EmailCampaign.objects.filter(pk=campaign_id).update(updated_at=timezone.now())
+        dispatch_campaign.delay(campaign_id)
+
+    return f"Re-dispatched {len(campaign_ids)} campaigns"
@@ -43,3 +43,190 @@ class EmailCampaignModelTest(TestCase):
         """캠페인 생성 테스트"""
         self.assertEqual(self.campaign.title, 'Test Campaign')
         self.assertEqual(self.campaign.status, EmailCampaign.Status.DRAFT)
+
+
+class EmailCampaignSendTest(TestCase):
+    """이메일 캠페인 발송 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.admin = User.objects.create_user(
+            username='admin',
+            password='adminpass123',
+            is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        self.campaign = EmailCampaign.objects.create(
+            title='Test Campaign',
+            subject='Test Subject',
+            content_html='<p>Test</p>',
+            content_text='Test',
+            created_by=self.admin
+        )
+        MailingList.objects.bulk_create(
+            [MailingList(email=f'reader{i}@example.com') for i in range(5)]
+            + [MailingList(email='inactive@example.com', is_active=False)]
+        )
+
+    def test_send_returns_immediately(self):
+        """발송 요청은 작업만 등록하고 바로 응답 (한 번만 발송)"""
+        from unittest import mock
+
+        url = f'/api/mailing/campaigns/{self.campaign.pk}/send/'
+        with mock.patch('apps.mailing.views.dispatch_campaign.delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url)
+            self.assertEqual(response.status_code, 202)
+            delay.assert_called_once_with(self.campaign.pk)
+
+            response = self.client.post(url)
+            self.assertEqual(response.status_code, 400)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, EmailCampaign.Status.SENDING)
+        self.assertFalse(self.campaign.logs.exists())
+
+    def test_stalled_campaign_is_redispatched(self):
+        """작업 등록에 실패해도 발송 중 상태로 남은 캠페인을 주기 작업이 다시 등록"""
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+        from .tasks import CAMPAIGN_STALL_TIMEOUT, dispatch_stalled_campaigns
+
+        url = f'/api/mailing/campaigns/{self.campaign.pk}/send/'
+        with mock.patch('apps.mailing.views.dispatch_campaign.delay', side_effect=ConnectionError):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url)
+        self.assertEqual(response.status_code, 202)
+
+        with mock.patch('apps.mailing.tasks.dispatch_campaign.delay') as delay:
+            # 아직 멈춘 것으로 보지 않음
+            dispatch_stalled_campaigns()
+            self.assertFalse(delay.called)
+
+            EmailCampaign.objects.filter(pk=self.campaign.pk).update(
+                updated_at=timezone.now() - CAMPAIGN_STALL_TIMEOUT - timedelta(minutes=1)
+            )
+            dispatch_stalled_campaigns()
+            dispatch_stalled_campaigns()
+            delay.assert_called_once_with(self.campaign.pk)
+
+    def test_duplicate_chunk_sends_once(self):
+        """같은 청크 작업이 겹쳐 실행되어도 먼저 가져간 작업만 발송"""
+        from unittest import mock
+        from django.core import mail
+        from . import tasks
+        from apps.accounts.email_utils import deliver_messages
+
+        EmailCampaign.objects.filter(pk=self.campaign.pk).update(status=EmailCampaign.Status.SENDING)
+        tasks.create_campaign_logs(self.campaign)
+        self.assertEqual(self.campaign.logs.filter(status=EmailLog.Status.PENDING).count(), 5)
+
+        duplicates = []
+
+        def deliver_during_duplicate(messages, throttle=None):
+            # 첫 작업이 발송하는 도중 다시 등록된 같은 범위의 작업이 실행됨
+            duplicates.append(tasks.send_campaign_chunk(self.campaign.pk, 0, 10 ** 9))
+            return deliver_messages(messages)
+
+        with mock.patch('apps.mailing.tasks.deliver_messages', side_effect=deliver_during_duplicate):
+            tasks.send_campaign_chunk(self.campaign.pk, 0, 10 ** 9)
+
+        self.assertEqual(duplicates, [f'Campaign {self.campaign.pk}: nothing to send'])
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(self.campaign.logs.filter(status=EmailLog.Status.SENT).count(), 5)
+
+    def test_stalled_sending_logs_are_reset(self):
+        """발송 중에 멈춘 로그만 대기 상태로 되돌리고 캠페인을 다시 등록"""
+        from datetime import timedelta
+        from unittest import mock
+        from django.utils import timezone
+        from .tasks import CAMPAIGN_STALL_TIMEOUT, create_campaign_logs, dispatch_stalled_campaigns
+
+        stalled_at = timezone.now() - CAMPAIGN_STALL_TIMEOUT - timedelta(minutes=1)
+        EmailCampaign.objects.filter(pk=self.campaign.pk).update(
+            status=EmailCampaign.Status.SENDING, updated_at=stalled_at
+        )
+        create_campaign_logs(self.campaign)
+        logs = list(self.campaign.logs.order_by('pk'))
+        EmailLog.objects.filter(pk=logs[0].pk).update(status=EmailLog.Status.SENDING, claimed_at=stalled_at)
+        EmailLog.objects.filter(pk=logs[1].pk).update(status=EmailLog.Status.SENDING, claimed_at=timezone.now())
+        EmailLog.objects.filter(pk__in=[log.pk for log in logs[2:]]).update(status=EmailLog.Status.SENT)
+
+        with mock.patch('apps.mailing.tasks.dispatch_campaign.delay') as delay:
+            dispatch_stalled_campaigns()
+        delay.assert_called_once_with(self.campaign.pk)
+
+        self.assertEqual(
+            list(self.campaign.logs.order_by('pk').values_list('status', flat=True)[:2]),
+            [EmailLog.Status.PENDING, EmailLog.Status.SENDING]
+        )
+
+    def test_create_missing_logs_only(self):
+        """중간에 실패한 로그 생성을 다시 실행하면 없는 로그만 생성"""
+        from .tasks import create_campaign_logs
+
+        EmailLog.objects.create(campaign=self.campaign, recipient='reader0@example.com')
+        self.assertEqual(create_campaign_logs(self.campaign), 5)
+        self.assertEqual(create_campaign_logs(self.campaign), 5)
+        self.assertEqual(
+            sorted(self.campaign.logs.values_list('recipient', flat=True)),
+            [f'reader{i}@example.com' for i in range(5)]
+        )
+
+    def test_send_rate_is_shared(self):
+        """초당 CAMPAIGN_SEND_RATE통을 넘으면 다음 초까지 대기"""
+        from types import SimpleNamespace
+        from unittest import mock
+        from django.core.cache import cache
+        from django.test import override_settings
+        from .tasks import acquire_send_slot
+
+        cache.clear()
+        clock = SimpleNamespace(now=1000.5)
+        fake_time = SimpleNamespace(
+            time=lambda: clock.now,
+            sleep=lambda seconds: setattr(clock, 'now', clock.now + seconds)
+        )
+        with override_settings(CAMPAIGN_SEND_RATE=2), mock.patch('apps.mailing.tasks.time', fake_time):
+            slots = []
+            for _ in range(5):
+                acquire_send_slot()
+                slots.append(int(clock.now))
+        self.assertEqual(slots, [1000, 1000, 1001, 1001, 1002])
+
+    def test_dispatch_in_chunks(self):
+        """발송 로그를 일괄 생성하고 청크로 나눠 발송한 뒤 집계"""
+        from unittest import mock
+        from django.core import mail
+        from django.test import override_settings
+        from . import tasks
+
+        EmailCampaign.objects.filter(pk=self.campaign.pk).update(status=EmailCampaign.Status.SENDING)
+
+        with override_settings(CAMPAIGN_CHUNK_SIZE=2), mock.patch(
+            'apps.mailing.tasks.send_campaign_chunk.delay',
+            side_effect=tasks.send_campaign_chunk
+        ) as chunk_delay:
+            tasks.dispatch_campaign(self.campaign.pk)
+
+        self.assertEqual(chunk_delay.call_count, 3)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertNotIn('inactive@example.com', [message.to[0] for message in mail.outbox])
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, EmailCampaign.Status.SENT)
+        self.assertEqual(self.campaign.total_recipients, 5)
+        self.assertEqual(self.campaign.sent_count, 5)
+        self.assertEqual(self.campaign.failed_count, 0)
+        self.assertIsNotNone(self.campaign.sent_at)
+        self.assertEqual(
+            self.campaign.logs.filter(status=EmailLog.Status.SENT, sent_at__isnull=False).count(), 5
+        )
+
+        # 다시 실행해도 재발송하지 않음
+        tasks.send_campaign_chunk(self.campaign.pk, 0, 10 ** 9)
+        self.assertEqual(len(mail.outbox), 5)
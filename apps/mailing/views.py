@@ -1,10 +1,12 @@
+import logging
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.db import transaction
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
-from .models import MailingList, EmailCampaign, EmailLog
+from .models import MailingList, EmailCampaign
 from .serializers import (
     MailingListSerializer,
     MailingSubscribeSerializer,
@@ -13,6 +15,17 @@ from .serializers import (
     EmailCampaignCreateUpdateSerializer,
     EmailLogSerializer
 )
+from .tasks import dispatch_campaign
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_campaign(campaign_id):
+    """캠페인 발송 작업 등록 (실패해도 주기 작업이 멈춘 캠페인을 다시 등록)"""
+    try:
+        dispatch_campaign.delay(campaign_id)
+    except Exception as e:
+        logger.error(f"[CAMPAIGN] 발송 작업 등록 실패 (campaign={campaign_id}): {e}")
 
 
 class MailingListViewSet(viewsets.ModelViewSet):
@@ -125,33 +138,23 @@ class EmailCampaignViewSet(viewsets.ModelViewSet):
 
         campaign = self.get_object()
 
-        if campaign.status != EmailCampaign.Status.DRAFT:
+        # 임시저장 → 발송 중 전환 (동시에 요청해도 한 번만 발송)
+        claimed = EmailCampaign.objects.filter(
+            pk=campaign.pk,
+            status=EmailCampaign.Status.DRAFT
+        ).update(status=EmailCampaign.Status.SENDING, updated_at=timezone.now())
+        if not claimed:
             return Response(
                 {"detail": "임시저장 상태의 캠페인만 발송할 수 있습니다."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 활성 구독자 조회
-        subscribers = MailingList.objects.filter(is_active=True)
-
-        # 캠페인 정보 업데이트
-        campaign.status = EmailCampaign.Status.SENDING
-        campaign.total_recipients = subscribers.count()
-        campaign.save()
-
-        # 발송 로그 생성 (실제 발송 로직은 Celery 등 비동기 작업으로 처리)
-        for subscriber in subscribers:
-            EmailLog.objects.create(
-                campaign=campaign,
-                recipient=subscriber.email,
-                status=EmailLog.Status.PENDING
-            )
-
-        # TODO: 실제 이메일 발송 비동기 작업 실행
+        # 발송 로그 생성과 발송은 Celery 작업에서 처리
+        transaction.on_commit(lambda: enqueue_campaign(campaign.pk))
 
         return Response(
-            {"detail": f"{campaign.total_recipients}명에게 이메일 발송을 시작했습니다."},
-            status=status.HTTP_200_OK
+            {"detail": "이메일 발송을 시작했습니다."},
+            status=status.HTTP_202_ACCEPTED
         )
 
     @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated])
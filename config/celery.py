@@ -29,6 +29,36 @@ app.conf.beat_schedule = {
         'task': 'apps.accounts.tasks.send_monthly_digest_emails',
         'schedule': crontab(hour=9, minute=0, day_of_month=1),  # 매월 1일 오전 9시
     },
+    # 발송 작업 등록이 누락되었거나 발송이 멈춘 발행 이벤트 재등록 - 5분마다
+    'dispatch-pending-publish-events': {
+        'task': 'apps.accounts.tasks.dispatch_pending_publish_events',
+        'schedule': crontab(minute='*/5'),
+    },
+    # 진행이 멈춘 이메일 캠페인 재등록 - 10분마다
+    'dispatch-stalled-campaigns': {
+        'task': 'apps.mailing.tasks.dispatch_stalled_campaigns',
+        'schedule': crontab(minute='*/10'),
+    },
+    # 일별 통계 갱신 - 10분마다
+    'refresh-daily-statistics': {
+        'task': 'apps.analytics.tasks.refresh_daily_statistics',
+        'schedule': crontab(minute='*/10'),
+    },
+    # 오래된 활동 이벤트 삭제 - 매일 새벽 4시
+    'prune-activity-events': {
+        'task': 'apps.analytics.tasks.prune_activity_events',
+        'schedule': crontab(hour=4, minute=0),
+    },
+    # 오래된 시간별 조회수 삭제 - 매일 새벽 4시 30분
+    'prune-content-view-buckets': {
+        'task': 'apps.analytics.tasks.prune_content_view_buckets',
+        'schedule': crontab(hour=4, minute=30),
+    },
+    # 조회수 반영 - 매분
+    'flush-view-counts': {
+        'task': 'apps.common.tasks.flush_view_counts',
+        'schedule': crontab(),  # 매분
+    },
 }
 
 # 타임존 설정
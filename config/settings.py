@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third party apps
     'rest_framework',
@@ -37,11 +38,13 @@ INSTALLED_APPS = [
     'ckeditor_uploader',
 
     # Local apps
+    'apps.common',
     'apps.accounts',
     'apps.contents',
     'apps.comments',
     'apps.boards',
     'apps.mailing',
+    'apps.analytics',
 ]
 
 MIDDLEWARE = [
@@ -142,6 +145,9 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# 테스트 러너
+TEST_RUNNER = 'apps.common.test_runner.TestRunner'
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -250,6 +256,30 @@ if DEBUG:
     }
     LOGGING['loggers']['django']['handlers'].append('file')
 
+# Cache
+# 여러 Cloud Run 인스턴스가 같은 캐시를 공유하도록 운영 환경에서는 Redis 사용
+CACHE_URL = config('CACHE_URL', default='')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 캐시를 모든 웹 워커와 Celery 워커가 공유하는지 여부
+# 프로세스별 메모리 캐시(LocMemCache)에서는 다른 프로세스가 기록한 값을 볼 수 없으므로
+# 조회수는 캐시를 거치지 않고 바로 DB에 반영하고, 비회원 응답 캐시는 사용하지 않으며,
+# 관리자 통계 스냅샷은 요청을 처리하는 프로세스에서 갱신한다.
+CACHE_IS_SHARED = bool(CACHE_URL)
+
 # Celery Configuration
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default='redis://localhost:6379/0')
@@ -258,6 +288,36 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = False
+# Redis 없이 로컬에서 실행할 때 작업을 요청 안에서 바로 실행
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=False, cast=bool)
+
+# 즉시 알림 발송 작업 하나가 처리하는 사용자 수
+NOTIFICATION_CHUNK_SIZE = config('NOTIFICATION_CHUNK_SIZE', default=100, cast=int)
+
+# 이메일 일괄 발송: SMTP 연결 하나로 보내는 메시지 수, 동시 연결 수, 메시지별 재시도 횟수
+EMAIL_BATCH_SIZE = config('EMAIL_BATCH_SIZE', default=50, cast=int)
+EMAIL_SEND_CONCURRENCY = config('EMAIL_SEND_CONCURRENCY', default=2, cast=int)
+EMAIL_SEND_RETRIES = config('EMAIL_SEND_RETRIES', default=2, cast=int)
+
+# 이메일 캠페인: 발송 작업 하나가 처리하는 수신자 수, 전체 워커 합계 초당 발송 수 (메일 서비스 한도)
+CAMPAIGN_CHUNK_SIZE = config('CAMPAIGN_CHUNK_SIZE', default=200, cast=int)
+CAMPAIGN_SEND_RATE = config('CAMPAIGN_SEND_RATE', default=14, cast=int)
+
+# 관리자 통계: 다시 계산하는 최근 일수, 스냅샷을 새로 만드는 주기(초)
+STATISTICS_ROLLUP_DAYS = config('STATISTICS_ROLLUP_DAYS', default=2, cast=int)
+STATISTICS_SNAPSHOT_TTL = config('STATISTICS_SNAPSHOT_TTL', default=300, cast=int)
+
+# 활동 이벤트: 일괄 저장 단위, 저장 간격(초), 워커당 버퍼 최대 크기, 보관 기간(일)
+ACTIVITY_BATCH_SIZE = config('ACTIVITY_BATCH_SIZE', default=200, cast=int)
+ACTIVITY_FLUSH_INTERVAL = config('ACTIVITY_FLUSH_INTERVAL', default=10, cast=int)
+ACTIVITY_BUFFER_LIMIT = config('ACTIVITY_BUFFER_LIMIT', default=10000, cast=int)
+ACTIVITY_RETENTION_DAYS = config('ACTIVITY_RETENTION_DAYS', default=180, cast=int)
+# 백그라운드 저장 스레드 사용 여부 (테스트 러너에서 끔)
+ACTIVITY_BACKGROUND_FLUSH = True
+
+# 인기 콘텐츠: 조회수 감쇠 반감기(시간), 시간별 조회수 보관 기간(일)
+TRENDING_HALF_LIFE_HOURS = config('TRENDING_HALF_LIFE_HOURS', default=24, cast=float)
+VIEW_BUCKET_RETENTION_DAYS = config('VIEW_BUCKET_RETENTION_DAYS', default=30, cast=int)
 
 # Site URL (for email links)
 SITE_URL = config('SITE_URL', default='http://localhost:3000')
@@ -325,6 +385,14 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Kakao API Settings
 KAKAO_REST_API_KEY = config('KAKAO_REST_API_KEY', default='')
 
+# 카카오 메시지 발송: API 주소, 요청 타임아웃(초), 동시 요청 수, 요청별 재시도 횟수
+KAKAO_MESSAGE_SEND_URL = config(
+    'KAKAO_MESSAGE_SEND_URL', default='https://kapi.kakao.com/v2/api/talk/memo/default/send'
+)
+KAKAO_MESSAGE_TIMEOUT = config('KAKAO_MESSAGE_TIMEOUT', default=5, cast=float)
+KAKAO_MESSAGE_CONCURRENCY = config('KAKAO_MESSAGE_CONCURRENCY', default=4, cast=int)
+KAKAO_MESSAGE_RETRIES = config('KAKAO_MESSAGE_RETRIES', default=2, cast=int)
+
 # Naver API Settings
 NAVER_CLIENT_ID = config('NAVER_CLIENT_ID', default='')
 NAVER_CLIENT_SECRET = config('NAVER_CLIENT_SECRET', default='')